@@ -0,0 +1,136 @@
+"""Micro-benchmark for handling MQTT values of ERDs a device already supports.
+
+Compares the coroutine path, where every message runs as its own task through
+GeaDiscovery.handle_message and coroutine subscribers, with the synchronous
+@callback path through GeaDiscovery.async_handle_value.
+
+Run from the repository root with `scripts/benchmark`.
+"""
+
+import argparse
+import asyncio
+import time
+
+from custom_components.geappliances.catalog import ApplianceApiCatalog
+from custom_components.geappliances.const import Erd
+from custom_components.geappliances.discovery import GeaDiscovery
+from custom_components.geappliances.entity import GeaEntity
+from custom_components.geappliances.ha_compatibility.data_source import DataSource
+from custom_components.geappliances.ha_compatibility.mqtt_client import MQTTMessage
+from custom_components.geappliances.topic import parse_topic
+
+from homeassistant.core import callback
+
+DEVICE_NAME = "benchmark"
+ERD_VALUE_TOPIC = "geappliances/benchmark/erd/{:#06x}/value"
+ERD_SIZE = 4
+
+
+class BenchmarkMetaErdCoordinator:
+    """Stand-in coordinator for a device without meta ERDs."""
+
+    async def is_meta_erd(self, erd: Erd) -> bool:
+        """Return false; the benchmark has no meta ERDs."""
+        return False
+
+    @callback
+    def async_is_meta_erd(self, erd: Erd) -> bool:
+        """Return false; the benchmark has no meta ERDs."""
+        return False
+
+
+class BenchmarkEntity(GeaEntity):
+    """Entity that reads one byte of an ERD and skips the Home Assistant state machine."""
+
+    def __init__(self, data_source: DataSource, erd: Erd, offset: int) -> None:
+        """Initialize the entity."""
+        self._data_source = data_source
+        self._device_name = DEVICE_NAME
+        self._erd = erd
+        self._offset = offset
+        self._size = 1
+        self._field_bytes: bytes | None = None
+
+    def async_schedule_update_ha_state(self, force_refresh: bool = False) -> None:
+        """Do nothing instead of writing state."""
+
+    @callback
+    def erd_updated(self, value: bytes | None) -> None:
+        """Update state from ERD without awaiting."""
+        self._field_bytes = None if value is None else self.field_bytes(value)
+        self.async_schedule_state_write()
+
+    async def erd_updated_async(self, value: bytes | None) -> None:
+        """Update state from ERD as a coroutine."""
+        self._field_bytes = None if value is None else await self.get_field_bytes(value)
+        self.async_schedule_state_write()
+
+
+async def set_up(erd_count: int, synchronous: bool) -> GeaDiscovery:
+    """Create a device with the given number of supported ERDs and one entity per ERD byte."""
+    data_source = DataSource(ApplianceApiCatalog.from_json("{}", '{"erds": []}'), None)
+    await data_source.add_device(DEVICE_NAME, DEVICE_NAME)
+    for erd in range(1, erd_count + 1):
+        await data_source.add_supported_erd_to_device(DEVICE_NAME, erd, None)
+        for offset in range(ERD_SIZE):
+            entity = BenchmarkEntity(data_source, erd, offset)
+            await data_source.erd_subscribe(
+                DEVICE_NAME,
+                erd,
+                entity.erd_updated if synchronous else entity.erd_updated_async,
+                entity.field_interest,
+            )
+
+    return GeaDiscovery(None, data_source, BenchmarkMetaErdCoordinator())
+
+
+def create_messages(count: int, erd_count: int) -> list[MQTTMessage]:
+    """Return messages that change one byte of each ERD in turn."""
+    return [
+        MQTTMessage(
+            ERD_VALUE_TOPIC.format(i % erd_count + 1),
+            (i // erd_count).to_bytes(ERD_SIZE),
+            0,
+            False,
+            "geappliances/#",
+            0.0,
+        )
+        for i in range(count)
+    ]
+
+
+async def run_async_path(messages: list[MQTTMessage], erd_count: int) -> float:
+    """Return messages per second when each message is a task through the coroutine handlers."""
+    discovery = await set_up(erd_count, synchronous=False)
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    for msg in messages:
+        await loop.create_task(discovery.handle_message(msg))
+    return len(messages) / (time.perf_counter() - start)
+
+
+async def run_callback_path(messages: list[MQTTMessage], erd_count: int) -> float:
+    """Return messages per second through the synchronous value handler."""
+    discovery = await set_up(erd_count, synchronous=True)
+    start = time.perf_counter()
+    for msg in messages:
+        if not discovery.async_handle_value(parse_topic(msg.topic), msg.payload):
+            raise RuntimeError(f"{msg.topic} was not handled in place")
+    return len(messages) / (time.perf_counter() - start)
+
+
+async def main(count: int, erd_count: int) -> None:
+    """Run both paths and print their throughput."""
+    messages = create_messages(count, erd_count)
+    before = await run_async_path(messages, erd_count)
+    after = await run_callback_path(messages, erd_count)
+    print(f"coroutine path: {before:12,.0f} messages/s")
+    print(f"@callback path: {after:12,.0f} messages/s ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--erds", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(main(args.messages, args.erds))
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+from functools import partial
 import logging
 
 import aiofiles
@@ -10,13 +10,28 @@ import aiofiles
 from homeassistant.components import mqtt
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-
-from .const import DISCOVERY, DOMAIN, PLATFORMS, SUBSCRIBE_TOPIC
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .catalog import load_catalog
+from .const import (
+    CATALOG_FILE,
+    CONF_COALESCE_WINDOW,
+    CONF_SUPPRESS_UNCHANGED_ERDS,
+    CONF_UNSUPPRESSED_DEVICES,
+    DATA_SOURCE,
+    DEFAULT_COALESCE_WINDOW_MS,
+    DEFAULT_SUPPRESS_UNCHANGED_ERDS,
+    DISCOVERY,
+    DOMAIN,
+    PLATFORMS,
+)
 from .discovery import GeaDiscovery
 from .ha_compatibility.data_source import DataSource
-from .ha_compatibility.meta_erds import MetaErdCoordinator
+from .ha_compatibility.meta_erds import MetaErdCoordinator, load_transform_table
 from .ha_compatibility.mqtt_client import GeaMQTTClient
 from .ha_compatibility.registry_updater import RegistryUpdater
+from .ha_compatibility.snapshot_store import SnapshotStore, remove_snapshot
+from .timing import StageTimings
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,10 +48,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     hass.data[DOMAIN][DISCOVERY] = await start_discovery(hass, entry)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry so changed options take effect."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -48,6 +69,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the snapshot of discovered devices when the config entry is removed."""
+    await remove_snapshot(hass)
+
+
 async def get_appliance_api_json() -> str:
     """Read the appliance API JSON file and return its contents."""
     async with aiofiles.open(
@@ -77,26 +103,69 @@ async def get_meta_erds_json() -> str:
 async def start_discovery(hass: HomeAssistant, entry: ConfigEntry) -> GeaDiscovery:
     """Create the discovery singleton asynchronously."""
 
-    mqtt_client = GeaMQTTClient(hass)
-
+    mqtt_client = GeaMQTTClient(hass, entry)
+    entry.async_on_unload(mqtt_client.async_unsubscribe_all)
+
+    timings = StageTimings()
+
+    with timings.stage("read appliance API files"):
+        appliance_api = await get_appliance_api_json()
+        appliance_api_erd_defs = await get_appliance_api_erd_defs_json()
+        meta_erds = await get_meta_erds_json()
+
+    # Parsing and indexing the appliance API takes long enough to block the
+    # event loop, so every CPU-bound stage is built in the executor.
+    with timings.stage("load appliance API catalog"):
+        catalog = await hass.async_add_executor_job(
+            partial(load_catalog, lazy=True),
+            appliance_api,
+            appliance_api_erd_defs,
+            hass.config.path(STORAGE_DIR, CATALOG_FILE),
+            timings,
+        )
+    entry.async_on_unload(catalog.close)
+
+    with timings.stage("build meta ERD transform table"):
+        transform_table = await hass.async_add_executor_job(
+            load_transform_table, meta_erds
+        )
+
+    coalesce_window_ms = entry.options.get(
+        CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW_MS
+    )
+    suppress_unchanged = entry.options.get(
+        CONF_SUPPRESS_UNCHANGED_ERDS, DEFAULT_SUPPRESS_UNCHANGED_ERDS
+    )
     data_source = DataSource(
-        await get_appliance_api_json(),
-        await get_appliance_api_erd_defs_json(),
+        catalog,
         mqtt_client,
+        coalesce_window_ms / 1000,
+        suppress_unchanged=suppress_unchanged,
+        unsuppressed_devices=entry.options.get(CONF_UNSUPPRESSED_DEVICES, []),
+        create_task=partial(
+            entry.async_create_background_task, hass, eager_start=False
+        ),
     )
-
-    meta_erd_coordinator = MetaErdCoordinator(
-        data_source, json.loads(await get_meta_erds_json()), hass
-    )
+    hass.data[DOMAIN][DATA_SOURCE] = data_source
+    entry.async_on_unload(data_source.async_cancel_pending_writes)
+    meta_erd_coordinator = MetaErdCoordinator(data_source, transform_table, hass)
     registry_updater = RegistryUpdater(hass, entry)
 
     gea_discovery = GeaDiscovery(registry_updater, data_source, meta_erd_coordinator)
-
-    await mqtt.client.async_subscribe(
-        hass,
-        SUBSCRIBE_TOPIC,
-        mqtt_client.handle_message,
-    )
     await mqtt_client.async_subscribe(gea_discovery.handle_message)
+    mqtt_client.async_set_value_handler(gea_discovery.async_handle_value)
+
+    # Devices seen before the restart are restored from the last snapshot so
+    # their entities are usable before the appliances report again.
+    snapshot_store = SnapshotStore(hass, data_source)
+    with timings.stage("restore snapshot"):
+        if not await gea_discovery.restore(await snapshot_store.load()):
+            await snapshot_store.remove()
+    data_source.async_set_change_listener(snapshot_store.async_schedule_save)
+    entry.async_on_unload(snapshot_store.flush)
+
+    timings.log(_LOGGER)
+
+    await mqtt_client.subscribe_for_discovery()
 
     return gea_discovery
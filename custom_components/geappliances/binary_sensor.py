@@ -13,6 +13,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import GEA_ENTITY_NEW
 from .entity import GeaEntity
+from .ha_compatibility.registry_updater import async_update_entity_devices
 from .models import GeaBinarySensorConfig
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,16 +28,20 @@ async def async_setup_entry(
     entity_registry = er.async_get(hass)
 
     @callback
-    async def async_discover(config: GeaBinarySensorConfig) -> None:
-        """Discover and add a GE Appliances binary sensor."""
-        _LOGGER.debug("Adding binary sensor with name: %s", config.name)
+    async def async_discover(configs: list[GeaBinarySensorConfig]) -> None:
+        """Discover and add a batch of GE Appliances binary sensors."""
+        _LOGGER.debug("Adding %d binary sensors", len(configs))
 
         nonlocal entity_registry
-        entity = GeaBinarySensor(config)
-        async_add_entities([entity])
-
-        entity_registry.async_update_entity(
-            entity.entity_id, device_id=config.device_id
+        entities = [GeaBinarySensor(config) for config in configs]
+        async_add_entities(entities)
+
+        async_update_entity_devices(
+            entity_registry,
+            [
+                (entity, config.device_id)
+                for entity, config in zip(entities, configs, strict=True)
+            ],
         )
 
     async_dispatcher_connect(
@@ -72,30 +77,32 @@ class GeaBinarySensor(BinarySensorEntity, GeaEntity):
     async def async_added_to_hass(self) -> None:
         """Set initial state from ERD and set up callback for updates."""
         value = await self._data_source.erd_read(self._device_name, self._erd)
-        await self.erd_updated(value)
+        self.erd_updated(value)
 
         await self._data_source.erd_subscribe(
-            self._device_name, self._erd, self.erd_updated
+            self._device_name, self._erd, self.erd_updated, self.field_interest
         )
+        await self._data_source.register_entity(self.unique_id, self)
         await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from the ERD."""
+        """Unsubscribe from the ERD and remove the entity from the unique ID lookup."""
         await self._data_source.erd_unsubscribe(
             self._device_name, self._erd, self.erd_updated
         )
+        await self._data_source.unregister_entity(self.unique_id)
 
     @callback
-    async def erd_updated(self, value: bytes | None) -> None:
-        """Update state from ERD."""
+    def erd_updated(self, value: bytes | None) -> None:
+        """Update state from ERD if the entity's bit changed."""
         if value is None:
-            self._attr_is_on = None
+            is_on = None
         else:
-            self._attr_is_on = (
-                int.from_bytes(await self.get_field_bytes(value)) & self._bit_mask != 0
-            )
+            is_on = int.from_bytes(self.field_bytes(value)) & self._bit_mask != 0
 
-        self.async_schedule_update_ha_state(True)
+        if is_on != self._attr_is_on:
+            self._attr_is_on = is_on
+            self.async_schedule_state_write()
 
     @property
     async def async_is_on(self) -> bool | None:
@@ -0,0 +1,476 @@
+"""Compiled appliance API catalog for GE Appliances."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from functools import lru_cache
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pickle
+import re
+import struct
+from typing import Any, Self
+
+from .const import CATALOG_CACHE_SIZE, Erd
+from .timing import StageTimings
+
+_LOGGER = logging.getLogger(__name__)
+
+CATALOG_MAGIC = b"GEACAT01"
+CATALOG_HEADER = struct.Struct(
+    ">8s32sQQ"
+)  # magic, source hash, index offset, index size
+
+COMMON = "common"
+FEATURE = "feature"
+ERD = "erd"
+STATUS_PAIRS = "status_pairs"
+
+type CatalogKey = tuple[str | Erd, ...]
+
+_STATUS_PAIR_MAPPING = {
+    "status": re.compile(r"\bStatus\b|\bActual\b|\bState\b|\bCurrent\b", re.IGNORECASE),
+    "request": re.compile(r"\bRequest\b|\bRequested\b|\bDesired\b", re.IGNORECASE),
+}
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_DOUBLE_SPACE = re.compile(r"  ")
+
+
+class CatalogError(Exception):
+    """Raised when a compiled catalog file is missing, corrupt or out of date."""
+
+
+def hash_sources(appliance_api: str, appliance_api_erd_definitions: str) -> bytes:
+    """Return the content hash used to key a compiled catalog to its source JSON."""
+    digest = hashlib.sha256()
+    digest.update(appliance_api.encode())
+    digest.update(b"\0")
+    digest.update(appliance_api_erd_definitions.encode())
+    return digest.digest()
+
+
+def compact_appliance_api_version(version_def: dict[str, Any]) -> dict[str, Any]:
+    """Return only the parts of an appliance API manifest version the integration uses."""
+    return {
+        "required": [{"erd": erd["erd"]} for erd in version_def["required"]],
+        "features": [
+            {
+                "mask": feature["mask"],
+                "required": [{"erd": erd["erd"]} for erd in feature["required"]],
+            }
+            for feature in version_def["features"]
+        ],
+    }
+
+
+def compact_erd_def(erd_def: dict[str, Any]) -> dict[str, Any]:
+    """Return only the parts of an ERD definition the integration uses."""
+    return {
+        "name": erd_def["name"],
+        "id": erd_def["id"],
+        "operations": erd_def["operations"],
+        "description": erd_def.get("description", ""),
+        "data": erd_def.get("data", []),
+    }
+
+
+def create_status_pair_dict(
+    appliance_api_erd_definitions: list[dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    """Create a mapping of status/request ERD pairs based on their names and data fields."""
+
+    def strip_name_field(data):
+        """Return a list of dicts with 'name' key removed from each dict."""
+        return [{k: v for k, v in item.items() if k != "name"} for item in data]
+
+    status_pair_dict: dict[str, dict[str, Any]] = {}
+    temp_dict: dict[str, dict[str, Any]] = {}
+
+    for erd in appliance_api_erd_definitions:
+        name = erd["name"]
+        for key, pattern in _STATUS_PAIR_MAPPING.items():
+            if pattern.search(name):
+                base_name = pattern.sub("", name)
+                base_name = _PUNCTUATION.sub("", base_name)
+                base_name = _DOUBLE_SPACE.sub(" ", base_name).strip()
+                if base_name not in temp_dict:
+                    temp_dict[base_name] = {}
+                temp_dict[base_name][key] = {
+                    "id": erd["id"],
+                    "data": erd.get("data", []),
+                }
+
+    for base_name, pair in temp_dict.items():
+        if "status" in pair and "request" in pair:
+            status_data = strip_name_field(pair["status"]["data"])
+            request_data = strip_name_field(pair["request"]["data"])
+            if status_data == request_data:
+                status_pair_dict[pair["status"]["id"]] = {
+                    "name": base_name,
+                    "status": int(pair["status"]["id"], 16),
+                    "request": int(pair["request"]["id"], 16),
+                }
+                status_pair_dict[pair["request"]["id"]] = {
+                    "name": base_name,
+                    "status": int(pair["status"]["id"], 16),
+                    "request": int(pair["request"]["id"], 16),
+                }
+
+    return status_pair_dict
+
+
+class ApplianceApiCatalog:
+    """Class to hold appliance API manifests and ERD definitions."""
+
+    def __init__(
+        self,
+        appliance_api: dict[str, Any],
+        appliance_api_erd_definitions: list[dict[str, Any]],
+        status_pair_dict: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        """Initialize the catalog and build its lookup indexes."""
+        self._appliance_api = appliance_api
+        self._appliance_api_erd_definitions = appliance_api_erd_definitions
+
+        self._create_erd_def_index()
+        self._status_pair_dict = (
+            create_status_pair_dict(appliance_api_erd_definitions)
+            if status_pair_dict is None
+            else status_pair_dict
+        )
+
+    @classmethod
+    def from_json(
+        cls, appliance_api: str, appliance_api_erd_definitions: str
+    ) -> ApplianceApiCatalog:
+        """Parse the appliance API and ERD definition JSON into a catalog."""
+        return cls(
+            json.loads(appliance_api), json.loads(appliance_api_erd_definitions)["erds"]
+        )
+
+    @classmethod
+    def from_reader(cls, reader: CatalogReader) -> ApplianceApiCatalog:
+        """Materialize a catalog from a compiled catalog file."""
+        appliance_api: dict[str, Any] = {
+            "common": {"versions": {}},
+            "featureApis": {},
+        }
+        erd_definitions: list[dict[str, Any]] = []
+
+        for key in reader:
+            if key[0] == COMMON:
+                appliance_api["common"]["versions"][key[1]] = reader.get(key)
+            elif key[0] == FEATURE:
+                appliance_api["featureApis"].setdefault(
+                    key[1], {"featureType": key[1], "versions": {}}
+                )["versions"][key[2]] = reader.get(key)
+            elif key[0] == ERD:
+                erd_definitions.append(reader.get(key))
+
+        return cls(appliance_api, erd_definitions, reader.get((STATUS_PAIRS,)))
+
+    def _create_erd_def_index(self) -> None:
+        """Index the ERD definitions by ERD number and by field name for constant time lookups."""
+        self._erd_def_index: dict[Erd, dict[str, Any]] = {}
+        self._erd_field_index: dict[Erd, dict[str, dict[str, Any]]] = {}
+
+        for erd_def in self._appliance_api_erd_definitions:
+            erd = int(erd_def["id"], base=16)
+            if erd in self._erd_def_index:
+                continue
+
+            self._erd_def_index[erd] = erd_def
+            self._erd_field_index[erd] = {
+                field["name"]: field for field in erd_def.get("data", [])
+            }
+
+    def get_common_appliance_api_version(self, version: str) -> dict[str, Any] | None:
+        """Return the dict for the requested common appliance API version, or None if it doesn't exist."""
+        return self._appliance_api["common"]["versions"].get(version)
+
+    def get_feature_api_version(
+        self, feature_type: str, version: str
+    ) -> dict[str, Any] | None:
+        """Return the dict for the requested feature appliance API version, or None if it doesn't exist."""
+        feature_appliance_api = self._appliance_api["featureApis"].get(feature_type)
+        if feature_appliance_api is None:
+            return None
+
+        return feature_appliance_api["versions"].get(version)
+
+    def get_erd_def(self, erd: Erd) -> dict[str, Any] | None:
+        """Find an ERD's fields in the appliance API ERD definitions."""
+        return self._erd_def_index.get(erd)
+
+    def get_erd_field_def(self, erd: Erd, field_name: str) -> dict[str, Any] | None:
+        """Find the definition of a single named field of an ERD, or None if it doesn't exist."""
+        erd_fields = self._erd_field_index.get(erd)
+        if erd_fields is None:
+            return None
+
+        return erd_fields.get(field_name)
+
+    def get_erd_status_pair(self, erd: Erd) -> dict[str, Any] | None:
+        """Return the status/request pair dict if the given ERD is part of a status/request pair, otherwise None."""
+        return self._status_pair_dict.get(f"{erd:#06x}", None)
+
+    def close(self) -> None:
+        """Release what the catalog holds open. An in-memory catalog holds nothing."""
+
+    def compile(self) -> dict[CatalogKey, Any]:
+        """Return the compact catalog entries to be written to a compiled catalog file."""
+        entries: dict[CatalogKey, Any] = {}
+
+        for version, version_def in (
+            self._appliance_api.get("common", {}).get("versions", {}).items()
+        ):
+            entries[(COMMON, version)] = compact_appliance_api_version(version_def)
+
+        for feature_type, feature_api in self._appliance_api.get(
+            "featureApis", {}
+        ).items():
+            for version, version_def in feature_api["versions"].items():
+                entries[(FEATURE, feature_type, version)] = (
+                    compact_appliance_api_version(version_def)
+                )
+
+        for erd, erd_def in self._erd_def_index.items():
+            entries[(ERD, erd)] = compact_erd_def(erd_def)
+
+        entries[(STATUS_PAIRS,)] = self._status_pair_dict
+        return entries
+
+
+def write_catalog(
+    path: str, source_hash: bytes, entries: dict[CatalogKey, Any]
+) -> None:
+    """Write compiled catalog entries to disk, replacing any existing file atomically."""
+    index: dict[CatalogKey, tuple[int, int]] = {}
+    body = bytearray()
+    for key, entry in entries.items():
+        blob = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        index[key] = (len(body), len(blob))
+        body += blob
+
+    index_blob = pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL)
+    header = CATALOG_HEADER.pack(
+        CATALOG_MAGIC, source_hash, CATALOG_HEADER.size, len(index_blob)
+    )
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as catalog_file:
+        catalog_file.write(header)
+        catalog_file.write(index_blob)
+        catalog_file.write(body)
+    os.replace(temp_path, path)
+
+
+class CatalogReader:
+    """Class to lazily read entries from a memory-mapped compiled catalog file."""
+
+    def __init__(self, path: str) -> None:
+        """Map the catalog file and read its header and index. Raise CatalogError if the file is unusable."""
+        try:
+            with open(path, "rb") as catalog_file:
+                self._mmap = mmap.mmap(
+                    catalog_file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        except (OSError, ValueError) as err:
+            raise CatalogError(f"Could not open catalog {path}") from err
+
+        try:
+            magic, self.source_hash, index_offset, index_size = (
+                CATALOG_HEADER.unpack_from(self._mmap)
+            )
+            if magic != CATALOG_MAGIC:
+                raise CatalogError(f"Catalog {path} has an unknown format")
+
+            self._index: dict[CatalogKey, tuple[int, int]] = pickle.loads(
+                self._mmap[index_offset : index_offset + index_size]
+            )
+            self._body_offset = index_offset + index_size
+            if any(
+                self._body_offset + offset + size > len(self._mmap)
+                for offset, size in self._index.values()
+            ):
+                raise CatalogError(f"Catalog {path} is truncated")
+        except (struct.error, pickle.UnpicklingError, EOFError) as err:
+            self.close()
+            raise CatalogError(f"Catalog {path} is corrupt") from err
+        except CatalogError:
+            self.close()
+            raise
+
+    def __enter__(self) -> Self:
+        """Return the reader for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Unmap the catalog file."""
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the catalog file."""
+        self._mmap.close()
+
+    def __iter__(self) -> Iterator[CatalogKey]:
+        """Return an iterator over the keys of every entry in the catalog."""
+        return iter(self._index)
+
+    def __contains__(self, key: CatalogKey) -> bool:
+        """Return true if the catalog has an entry for the given key."""
+        return key in self._index
+
+    def get(self, key: CatalogKey) -> Any | None:
+        """Decode and return a single entry, or None if the catalog doesn't have it. Raise CatalogError if the entry is corrupt."""
+        location = self._index.get(key)
+        if location is None:
+            return None
+
+        start = self._body_offset + location[0]
+        try:
+            return pickle.loads(self._mmap[start : start + location[1]])
+        except (pickle.UnpicklingError, EOFError) as err:
+            raise CatalogError(f"Catalog entry {key} is corrupt") from err
+
+
+class LazyApplianceApiCatalog(ApplianceApiCatalog):
+    """Class to materialize appliance API manifests and ERD definitions from a compiled catalog on first use."""
+
+    def __init__(
+        self, reader: CatalogReader, cache_size: int = CATALOG_CACHE_SIZE
+    ) -> None:
+        """Initialize the catalog over an open reader, keeping at most cache_size entries of each kind in memory.
+
+        The reader is closed if its status/request pairs can't be decoded, and CatalogError is raised.
+        """
+        self._reader = reader
+        try:
+            self._status_pair_dict = reader.get((STATUS_PAIRS,)) or {}
+        except CatalogError:
+            reader.close()
+            raise
+        self._get_version_entry = lru_cache(maxsize=cache_size)(self._read_entry)
+        self._get_erd_entry = lru_cache(maxsize=cache_size)(self._read_erd_entry)
+
+    def close(self) -> None:
+        """Unmap the compiled catalog file."""
+        self._reader.close()
+
+    def _read_entry(self, key: CatalogKey) -> Any | None:
+        """Decode a single entry, or return None and log an error if it is corrupt."""
+        try:
+            return self._reader.get(key)
+        except CatalogError:
+            _LOGGER.exception("Could not read appliance API catalog entry %s", key)
+            return None
+
+    def _read_erd_entry(
+        self, erd: Erd
+    ) -> tuple[dict[str, Any], dict[str, dict[str, Any]]] | None:
+        """Decode an ERD definition and index its fields by name."""
+        erd_def = self._read_entry((ERD, erd))
+        if erd_def is None:
+            return None
+
+        return erd_def, {field["name"]: field for field in erd_def["data"]}
+
+    def get_common_appliance_api_version(self, version: str) -> dict[str, Any] | None:
+        """Return the dict for the requested common appliance API version, or None if it doesn't exist."""
+        return self._get_version_entry((COMMON, version))
+
+    def get_feature_api_version(
+        self, feature_type: str, version: str
+    ) -> dict[str, Any] | None:
+        """Return the dict for the requested feature appliance API version, or None if it doesn't exist."""
+        return self._get_version_entry((FEATURE, feature_type, version))
+
+    def get_erd_def(self, erd: Erd) -> dict[str, Any] | None:
+        """Find an ERD's fields in the compiled catalog."""
+        erd_entry = self._get_erd_entry(erd)
+        if erd_entry is None:
+            return None
+
+        return erd_entry[0]
+
+    def get_erd_field_def(self, erd: Erd, field_name: str) -> dict[str, Any] | None:
+        """Find the definition of a single named field of an ERD, or None if it doesn't exist."""
+        erd_entry = self._get_erd_entry(erd)
+        if erd_entry is None:
+            return None
+
+        return erd_entry[1].get(field_name)
+
+    def compile(self) -> dict[CatalogKey, Any]:
+        """Return every entry in the compiled catalog."""
+        return {key: self._reader.get(key) for key in self._reader}
+
+    def materialize(self) -> ApplianceApiCatalog:
+        """Return an in-memory catalog holding every entry in the compiled catalog."""
+        return ApplianceApiCatalog.from_reader(self._reader)
+
+
+def load_catalog(
+    appliance_api: str,
+    appliance_api_erd_definitions: str,
+    path: str,
+    timings: StageTimings | None = None,
+    lazy: bool = False,
+) -> ApplianceApiCatalog:
+    """Load the compiled catalog for the given sources, rebuilding it if the sources have changed.
+
+    In lazy mode the compiled file stays mapped and entries are only decoded when first asked for.
+    This does blocking file I/O and parsing, so it must be run in the executor.
+    """
+    timings = timings or StageTimings()
+
+    with timings.stage("hash appliance API sources"):
+        source_hash = hash_sources(appliance_api, appliance_api_erd_definitions)
+
+    reader: CatalogReader | None = None
+    try:
+        with timings.stage("read compiled catalog"):
+            reader = CatalogReader(path)
+            if reader.source_hash == source_hash:
+                if lazy:
+                    return LazyApplianceApiCatalog(reader)
+                with reader:
+                    return ApplianceApiCatalog.from_reader(reader)
+            reader.close()
+    except CatalogError as err:
+        if reader is not None:
+            reader.close()
+        _LOGGER.debug("Rebuilding appliance API catalog: %s", err)
+
+    with timings.stage("parse appliance API JSON"):
+        appliance_api_dict = json.loads(appliance_api)
+        erd_definitions = json.loads(appliance_api_erd_definitions)["erds"]
+
+    with timings.stage("find status/request pairs"):
+        status_pair_dict = create_status_pair_dict(erd_definitions)
+
+    with timings.stage("index ERD definitions"):
+        catalog = ApplianceApiCatalog(
+            appliance_api_dict, erd_definitions, status_pair_dict
+        )
+
+    with timings.stage("write compiled catalog"):
+        try:
+            write_catalog(path, source_hash, catalog.compile())
+        except OSError:
+            _LOGGER.warning("Could not write appliance API catalog to %s", path)
+            return catalog
+
+    if not lazy:
+        return catalog
+
+    try:
+        with timings.stage("open compiled catalog"):
+            return LazyApplianceApiCatalog(CatalogReader(path))
+    except CatalogError:
+        _LOGGER.warning("Could not reopen appliance API catalog %s", path)
+        return catalog
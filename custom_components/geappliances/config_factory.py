@@ -1,12 +1,14 @@
 """GE Appliances configuration factory."""
 
+from functools import cache
 import re
 from typing import Any
 
 from homeassistant.const import Platform
 
 from .binary_sensor import GeaBinarySensor
-from .const import CONF_DEVICE_ID, CONF_NAME, Erd
+from .const import CONF_NAME, Erd
+from .decoder import SCALE_MAPPING, FieldDecoder, find_scale, get_field_key
 from .ha_compatibility.data_source import DataSource
 from .models import (
     GeaBinarySensorConfig,
@@ -35,59 +37,83 @@ PLATFORM_TYPE_LIST: list = [
 ]
 
 
+UNITS_MAPPING: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(pattern), unit)
+    for pattern, unit in {
+        r"Temperature.*\(C\)": "°C",
+        r"Temperature|Fahrenheit": "°F",
+        r"Battery Level": "%",
+        r"kWh": "kWh",
+        r"Humidity": "%",
+        r"(in Pa)": "Pa",
+        r"gallons": "gal",
+        r"(oz)": "fl. oz.",
+        r"(mL)": "mL",
+        r"(L)": "L",
+        r" lbs|(lbs)": "lb",
+        r"mA$| mA |(mA)": "mA",
+        r"seconds": "s",
+        r"minutes": "min",
+        r"hours": "h",
+        r"days": "d",
+        r"Watts": "W",
+        r"Voltage": "V",
+        r"Hz": "Hz",
+    }.items()
+]
+
+
+@cache
+def find_units(field_name: str) -> str | None:
+    """Return the unit for the first units pattern that matches the field name."""
+    for pattern, unit in UNITS_MAPPING:
+        if pattern.search(field_name) is not None:
+            return unit
+
+    return None
+
+
+@cache
+def remove_scale(name: str) -> str:
+    """Remove every scale suffix from an entity name."""
+    for pattern, _ in SCALE_MAPPING:
+        name = pattern.sub("", name).strip()
+
+    return name
+
+
 class ConfigFactory:
     """Class to create configurations."""
 
     def __init__(self, data_source: DataSource) -> None:
         """Initialize factory."""
         self._data_source = data_source
-        self._units_mapping: dict[str, str] = {
-            r"Temperature.*\(C\)": "°C",
-            r"Temperature|Fahrenheit": "°F",
-            r"Battery Level": "%",
-            r"kWh": "kWh",
-            r"Humidity": "%",
-            r"(in Pa)": "Pa",
-            r"gallons": "gal",
-            r"(oz)": "fl. oz.",
-            r"(mL)": "mL",
-            r"(L)": "L",
-            r" lbs|(lbs)": "lb",
-            r"mA$| mA |(mA)": "mA",
-            r"seconds": "s",
-            r"minutes": "min",
-            r"hours": "h",
-            r"days": "d",
-            r"Watts": "W",
-            r"Voltage": "V",
-            r"Hz": "Hz",
-        }
-        self._scale_mapping: dict[str, int] = {
-            r"\bx10\b|\bx 10\b|\bX10\b|\bX 10": 10,
-            r"\bx100\b|\bx 100\b|\bX100\b|\bX 100": 100,
-            r"\bx1000\b|\bx 1000\b|\bX1000\b|\bX 1000": 1000,
-        }
 
     async def get_scale(self, field: dict[str, Any], erd_description) -> int:
         """Return the appropriate scale for the given field."""
-        for name_substring, scale in self._scale_mapping.items():
-            if re.search(name_substring, field["name"]) is not None:
-                return scale
-            if re.search(name_substring, erd_description) is not None:
-                return scale
+        return find_scale(field["name"], erd_description)
+
+    async def get_decoder(
+        self, erd: Erd, field: dict[str, Any], erd_description: str
+    ) -> FieldDecoder:
+        """Return the field's decoder from the compiled decoder of its ERD, or compile one if the ERD doesn't define the field."""
+        erd_decoder = await self._data_source.get_erd_decoder(erd)
+        decoder = (
+            erd_decoder.fields.get(get_field_key(field))
+            if erd_decoder is not None
+            else None
+        )
+        if decoder is None:
+            return FieldDecoder(field, await self.get_scale(field, erd_description))
 
-        return 1
+        return decoder
 
     async def get_units(self, field: dict[str, Any]) -> str | None:
         """Determine the appropriate unit of measurement for the given field."""
         if field["type"] == "string" or field["type"] == "enum":
             return None
 
-        for name_substring, unit in self._units_mapping.items():
-            if re.search(name_substring, field["name"]) is not None:
-                return unit
-
-        return None
+        return find_units(field["name"])
 
     async def get_unique_id(
         self, device_name: str, erd: Erd, field: dict[str, Any]
@@ -107,7 +133,7 @@ class ConfigFactory:
         status_pair = await self._data_source.get_erd_status_pair(erd)
         return GeaEntityConfig(
             await self.get_unique_id(device_name, erd, field),
-            (await self._data_source.get_device(device_name))[CONF_DEVICE_ID],
+            (await self._data_source.get_device(device_name)).device_id,
             device_name,
             erd_name + ": " + field[CONF_NAME],
             platform,
@@ -163,8 +189,7 @@ class ConfigFactory:
         device_class = await NumberConfigAttributes.get_device_class(field)
         scale = await self.get_scale(field, erd_description)
 
-        for scale_pattern in self._scale_mapping:
-            base.name = re.sub(scale_pattern, "", base.name).strip()
+        base.name = remove_scale(base.name)
 
         return GeaNumberConfig(
             base.unique_identifier,
@@ -182,7 +207,7 @@ class ConfigFactory:
             scale,
             await NumberConfigAttributes.get_min(field) / scale,
             await NumberConfigAttributes.get_max(field) / scale,
-            await NumberConfigAttributes.get_value_function(field),
+            await self.get_decoder(erd, field, erd_description),
             bit_mask,
             bit_size,
             bit_offset,
@@ -227,8 +252,7 @@ class ConfigFactory:
         )
         device_class = await SensorConfigAttributes.get_device_class(field)
 
-        for scale_pattern in self._scale_mapping:
-            base.name = re.sub(scale_pattern, "", base.name).strip()
+        base.name = remove_scale(base.name)
 
         return GeaSensorConfig(
             base.unique_identifier,
@@ -245,7 +269,7 @@ class ConfigFactory:
             await SensorConfigAttributes.get_state_class(field),
             await self.get_units(field),
             await self.get_scale(field, erd_description),
-            await SensorConfigAttributes.get_value_function(field),
+            await self.get_decoder(erd, field, erd_description),
             await SensorConfigAttributes.get_enum_values(field),
             bit_mask,
             bit_size,
@@ -3,9 +3,26 @@
 import logging
 from typing import Any
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+import voluptuous as vol  # type:ignore [import-untyped]
 
-from .const import DOMAIN
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .const import (
+    CONF_COALESCE_WINDOW,
+    CONF_SUPPRESS_UNCHANGED_ERDS,
+    CONF_UNSUPPRESSED_DEVICES,
+    DEFAULT_COALESCE_WINDOW_MS,
+    DEFAULT_SUPPRESS_UNCHANGED_ERDS,
+    DOMAIN,
+    MAX_COALESCE_WINDOW_MS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,6 +34,12 @@ class FlowHandler(ConfigFlow, domain=DOMAIN):
 
     data: dict[str, Any] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow for the integration."""
+        return OptionsFlowHandler()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -41,3 +64,58 @@ class FlowHandler(ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="confirm",
         )
+
+
+class OptionsFlowHandler(OptionsFlow):
+    """Handle GE Appliances options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Set how long entity state writes are coalesced for each device and whether repeated ERD values are skipped, and for which devices they aren't."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        unsuppressed_devices = self.config_entry.options.get(
+            CONF_UNSUPPRESSED_DEVICES, []
+        )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_COALESCE_WINDOW,
+                        default=self.config_entry.options.get(
+                            CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW_MS
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=MAX_COALESCE_WINDOW_MS)
+                    ),
+                    vol.Required(
+                        CONF_SUPPRESS_UNCHANGED_ERDS,
+                        default=self.config_entry.options.get(
+                            CONF_SUPPRESS_UNCHANGED_ERDS,
+                            DEFAULT_SUPPRESS_UNCHANGED_ERDS,
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_UNSUPPRESSED_DEVICES, default=unsuppressed_devices
+                    ): cv.multi_select(
+                        {name: name for name in unsuppressed_devices}
+                        | self._get_device_names()
+                    ),
+                }
+            ),
+        )
+
+    def _get_device_names(self) -> dict[str, str]:
+        """Return the name shown for each discovered device, by the device name its ERDs are published under."""
+        return {
+            identifier[1]: device.name_by_user or device.name or identifier[1]
+            for device in dr.async_entries_for_config_entry(
+                dr.async_get(self.hass), self.config_entry.entry_id
+            )
+            for identifier in device.identifiers
+            if identifier[0] == DOMAIN
+        }
@@ -25,19 +25,51 @@ FEATURE_API_ERD_LOW_START = 0x0093
 FEATURE_API_ERD_LOW_END = 0x0097
 FEATURE_API_ERD_HIGH_START = 0x0109
 FEATURE_API_ERD_HIGH_END = 0x010D
+APPLIANCE_API_ERDS = frozenset(
+    (
+        COMMON_APPLIANCE_API_ERD,
+        *range(FEATURE_API_ERD_LOW_START, FEATURE_API_ERD_LOW_END + 1),
+        *range(FEATURE_API_ERD_HIGH_START, FEATURE_API_ERD_HIGH_END + 1),
+    )
+)
 
 DOMAIN = "geappliances"
 GEA_ENTITY_NEW = "gea_entity_new_{}"
+GEA_DIAGNOSTICS_NEW = "gea_diagnostics_new"
 DISCOVERY = "discovery"
+DATA_SOURCE = "data_source"
 APPLIANCE_API = "appliance_api"
 APPLIANCE_API_DEFINITIONS = "appliance_api_definitions"
+CATALOG_FILE = "geappliances.catalog"
+CATALOG_CACHE_SIZE = 256
+DEFAULT_SUPPRESS_UNCHANGED_ERDS = True
+DEFAULT_COALESCE_WINDOW_MS = 0
+SLOW_SUBSCRIBER_SECONDS = 0.1
+ERD_WRITE_WINDOW_SECONDS = 0.05
+SNAPSHOT_STORAGE_KEY = "geappliances.snapshot"
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY_SECONDS = 30
+INGEST_QUEUE_DEPTH = 256
+INGEST_DIAGNOSTICS = {
+    "depth": "Ingest queue depth",
+    "dropped": "Ingest messages dropped",
+    "merged": "Ingest messages merged",
+}
 
 # Configuration fields
 CONF_NAME = "name"
 CONF_DEVICE_ID = "id"
+CONF_COALESCE_WINDOW = "coalesce_window"
+CONF_SUPPRESS_UNCHANGED_ERDS = "suppress_unchanged_erds"
+CONF_UNSUPPRESSED_DEVICES = "unsuppressed_devices"
+MAX_COALESCE_WINDOW_MS = 1000
 
 # MQTT constants
-SUBSCRIBE_TOPIC = "geappliances/#"
+TOPIC_CACHE_SIZE = 4096
+TOPIC_DEVICE = "device"
+TOPIC_VALUE = "value"
+TOPIC_WRITE = "write"
+TOPIC_INVALID = "invalid"
 
 # Services to update entity attributes
 VALID_UNIQUE_ID = re.compile(r".*_[a-z0-9]{4}_.*")
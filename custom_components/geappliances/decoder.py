@@ -0,0 +1,175 @@
+"""Compiled decoders for the fields of GE Appliances ERD values."""
+
+from collections.abc import Iterable
+from functools import cache
+import re
+import struct
+from typing import Any
+
+SIGNED_TYPES = ("i8", "i16", "i32")
+UNSCALED_TYPES = ("string", "raw", "enum")
+STRUCT_CODES = {1: "b", 2: "h", 4: "i", 8: "q"}
+
+SCALE_MAPPING: list[tuple[re.Pattern[str], int]] = [
+    (re.compile(pattern), scale)
+    for pattern, scale in {
+        r"\bx10\b|\bx 10\b|\bX10\b|\bX 10": 10,
+        r"\bx100\b|\bx 100\b|\bX100\b|\bX 100": 100,
+        r"\bx1000\b|\bx 1000\b|\bX1000\b|\bX 1000": 1000,
+    }.items()
+]
+
+
+@cache
+def find_scale(field_name: str, erd_description: str) -> int:
+    """Return the scale for the first scale pattern that matches the field name or ERD description."""
+    for pattern, scale in SCALE_MAPPING:
+        if pattern.search(field_name) is not None:
+            return scale
+        if pattern.search(erd_description) is not None:
+            return scale
+
+    return 1
+
+
+class FieldDecoder:
+    """Class to turn the bytes of one ERD field into its value, with the struct, mask, shift and scale worked out in advance."""
+
+    __slots__ = (
+        "bit_mask",
+        "code",
+        "erd_decoder",
+        "offset",
+        "position",
+        "scale",
+        "shift",
+        "size",
+        "type",
+    )
+
+    def __init__(self, field: dict[str, Any], scale: int) -> None:
+        """Compile the decoder for the field definition. Bit fields are masked and shifted, numbers divided by the scale."""
+        self.type: str = field["type"]
+        self.offset: int = field["offset"]
+        self.size: int = field["size"]
+        self.scale = scale if scale > 1 and self.type not in UNSCALED_TYPES else 1
+        self.code: str | None = None
+        if self.type not in ("string", "raw") and self.size in STRUCT_CODES:
+            code = STRUCT_CODES[self.size]
+            self.code = code if self.type in SIGNED_TYPES else code.upper()
+
+        self.bit_mask: int | None = None
+        self.shift = 0
+        if (bits := field.get("bits")) is not None and self.type != "enum":
+            self.shift = (self.size * 8) - bits["offset"] - bits["size"]
+            self.bit_mask = ((1 << bits["size"]) - 1) << self.shift
+
+        self.erd_decoder: ErdDecoder | None = None
+        self.position = 0
+
+    def __call__(self, value: bytes | memoryview) -> Any:
+        """Return the value of the field's bytes."""
+        if self.type == "string":
+            return str(value, "utf-8")
+
+        if self.type == "raw":
+            return value.hex()
+
+        if self.code is not None and len(value) == self.size:
+            return self.finish(_get_struct(self.code).unpack(value)[0])
+
+        return self.finish(int.from_bytes(value, signed=self.type in SIGNED_TYPES))
+
+    def finish(self, raw: int) -> int | float:
+        """Mask, shift and scale an integer read from the field."""
+        if self.bit_mask is not None:
+            raw = (raw & self.bit_mask) >> self.shift
+
+        return (raw / self.scale) if self.scale > 1 else raw
+
+
+@cache
+def _get_struct(code: str) -> struct.Struct:
+    """Return the big-endian struct for a single integer code."""
+    return struct.Struct(">" + code)
+
+
+type FieldKey = tuple[str, int, int | None]
+
+
+def get_field_key(field: dict[str, Any]) -> FieldKey:
+    """Return what tells a field apart from the others of its ERD. Names alone don't, since some ERDs reuse them."""
+    bits = field.get("bits")
+    return (field["name"], field["offset"], bits["offset"] if bits else None)
+
+
+class ErdDecoder:
+    """Class to decode every field of an ERD value in one call, unpacking its fixed-size integer fields with a single struct."""
+
+    __slots__ = ("_separate", "_struct", "_unpacked", "decoders", "fields")
+
+    def __init__(self, erd_def: dict[str, Any]) -> None:
+        """Compile a decoder for each field of the ERD definition and one struct covering the bytes of those that don't overlap.
+
+        Bit fields of the same bytes share one struct item and are told apart by their masks and shifts.
+        """
+        description = erd_def.get("description", "")
+        self.decoders = tuple(
+            FieldDecoder(field, find_scale(field["name"], description))
+            for field in erd_def["data"]
+        )
+        self.fields: dict[FieldKey, FieldDecoder] = {
+            get_field_key(field): decoder
+            for field, decoder in zip(erd_def["data"], self.decoders, strict=True)
+        }
+        for position, decoder in enumerate(self.decoders):
+            decoder.erd_decoder = self
+            decoder.position = position
+
+        fmt = ">"
+        end = 0
+        items: dict[tuple[int, int, str], int] = {}
+        unpacked: list[tuple[int, int]] = []
+        separate: list[int] = []
+        for position, decoder in sorted(
+            enumerate(self.decoders), key=lambda item: item[1].offset
+        ):
+            if decoder.code is None:
+                separate.append(position)
+                continue
+
+            region = (decoder.offset, decoder.size, decoder.code)
+            if region not in items:
+                if decoder.offset < end:
+                    separate.append(position)
+                    continue
+
+                fmt += "x" * (decoder.offset - end) + decoder.code
+                end = decoder.offset + decoder.size
+                items[region] = len(items)
+
+            unpacked.append((position, items[region]))
+
+        self._struct = struct.Struct(fmt)
+        self._unpacked = tuple(unpacked)
+        self._separate = tuple(sorted(separate))
+
+    def decode(self, value: bytes) -> tuple[Any, ...]:
+        """Return the value of each field, in definition order, decoded from the ERD value."""
+        values: list[Any] = [None] * len(self.decoders)
+        view = memoryview(value)
+        if len(value) >= self._struct.size:
+            raw_items = self._struct.unpack_from(value)
+            for position, item in self._unpacked:
+                values[position] = self.decoders[position].finish(raw_items[item])
+            separate: Iterable[int] = self._separate
+        else:
+            separate = range(len(self.decoders))
+
+        for position in separate:
+            decoder = self.decoders[position]
+            values[position] = decoder(
+                view[decoder.offset : decoder.offset + decoder.size]
+            )
+
+        return tuple(values)
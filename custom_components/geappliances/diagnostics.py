@@ -0,0 +1,20 @@
+"""Diagnostics support for GE Appliances."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_SOURCE, DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for the config entry."""
+    data_source = hass.data[DOMAIN][DATA_SOURCE]
+    return {
+        "options": dict(entry.options),
+        "state_write_coalescing": await data_source.get_coalescing_stats(),
+        "subscribers": await data_source.get_subscriber_stats(),
+    }
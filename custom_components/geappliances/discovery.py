@@ -1,13 +1,16 @@
 """GE Appliances MQTT device discovery."""
 
 import logging
+from typing import Any
+
+from homeassistant.core import callback
 
 from .const import (
+    APPLIANCE_API_ERDS,
     COMMON_APPLIANCE_API_ERD,
-    FEATURE_API_ERD_HIGH_END,
-    FEATURE_API_ERD_HIGH_START,
-    FEATURE_API_ERD_LOW_END,
-    FEATURE_API_ERD_LOW_START,
+    INGEST_DIAGNOSTICS,
+    TOPIC_INVALID,
+    TOPIC_VALUE,
     Erd,
 )
 from .erd_factory import ERDFactory
@@ -15,6 +18,8 @@ from .ha_compatibility.data_source import DataSource
 from .ha_compatibility.meta_erds import MetaErdCoordinator
 from .ha_compatibility.mqtt_client import MQTTMessage
 from .ha_compatibility.registry_updater import RegistryUpdater
+from .models import GeaIngestSensorConfig
+from .topic import ParsedTopic, parse_topic
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,59 +41,98 @@ class GeaDiscovery:
         self._data_source = data_source
         self._meta_erd_coordinator = meta_erd_coordinator
 
-    async def should_log_error(self, split_topic: list[str]) -> bool:
-        """Return true if the MQTT topic is bad."""
-        return len(split_topic) != 2 and (
-            len(split_topic) != 5 or split_topic[4] != "write"
-        )
+    @callback
+    def async_handle_value(self, topic: ParsedTopic, payload: bytes) -> bool:
+        """Handle a value for an ERD the device already supports without awaiting. Return false if the message needs handle_message."""
+        if (
+            topic.kind != TOPIC_VALUE
+            or topic.erd is None
+            or self._meta_erd_coordinator.async_is_meta_erd(topic.erd)
+        ):
+            return False
+
+        return self._data_source.async_erd_update(topic.device_name, topic.erd, payload)
 
     async def handle_message(self, msg: MQTTMessage) -> None:
         """Handle an MQTT message."""
-        split_topic = msg.topic.split("/")
-        device_name = split_topic[1]
+        topic = parse_topic(msg.topic)
+        device_name = topic.device_name
         await self.add_device_if_not_already_exists(device_name)
 
-        if len(split_topic) == 5 and split_topic[4] == "value":
-            erd: Erd = int(split_topic[3], base=16)
-            if not await self._data_source.erd_is_supported_by_device(device_name, erd):
-                if erd == COMMON_APPLIANCE_API_ERD:
-                    await self._data_source.add_unsupported_erd_to_device(
-                        device_name, erd, msg.payload
-                    )
-                    await self.process_common_appliance_api(msg, device_name)
-
-                elif (FEATURE_API_ERD_LOW_START <= erd <= FEATURE_API_ERD_LOW_END) or (
-                    FEATURE_API_ERD_HIGH_START <= erd <= FEATURE_API_ERD_HIGH_END
-                ):
-                    await self._data_source.add_unsupported_erd_to_device(
-                        device_name, erd, msg.payload
-                    )
-                    await self.process_feature_appliance_api(msg, device_name)
+        if topic.kind == TOPIC_VALUE and topic.erd is not None:
+            await self.handle_value(device_name, topic.erd, msg.payload)
 
-                else:
-                    await self._data_source.add_unsupported_erd_to_device(
-                        device_name, erd, None
-                    )
-
-            else:
-                await self._data_source.erd_write(device_name, erd, msg.payload)
-                if await self._meta_erd_coordinator.is_meta_erd(erd):
-                    await self._meta_erd_coordinator.apply_transforms_for_meta_erd(
-                        device_name, erd
-                    )
-
-        elif await self.should_log_error(split_topic):
+        elif topic.kind == TOPIC_INVALID:
             _LOGGER.error(
                 "Bad GE Appliances MQTT topic: %s",
                 msg.topic,
             )
 
+    async def handle_value(self, device_name: str, erd: Erd, payload: bytes) -> None:
+        """Handle a value reported for one of the device's ERDs."""
+        if not await self._data_source.erd_is_supported_by_device(device_name, erd):
+            if erd not in APPLIANCE_API_ERDS:
+                await self._data_source.add_unsupported_erd_to_device(
+                    device_name, erd, None
+                )
+
+            elif not await self._data_source.manifest_is_unchanged(
+                device_name, erd, payload
+            ):
+                await self._data_source.add_unsupported_erd_to_device(
+                    device_name, erd, payload
+                )
+                if erd == COMMON_APPLIANCE_API_ERD:
+                    await self.process_common_appliance_api(payload, device_name)
+                else:
+                    await self.process_feature_appliance_api(payload, device_name, erd)
+
+        else:
+            if not await self._data_source.erd_update(device_name, erd, payload):
+                return
+
+            if await self._meta_erd_coordinator.is_meta_erd(erd):
+                await self._meta_erd_coordinator.apply_transforms_for_meta_erd(
+                    device_name, erd
+                )
+
+    async def restore(self, snapshot: dict[str, dict[str, dict[str, str]]]) -> bool:
+        """Recreate the devices, entities and ERD values in a snapshot taken by the data source, before live values arrive.
+
+        Return false if the snapshot can't be read or restoring it fails, so it can be discarded.
+        """
+        try:
+            devices = {
+                device_name: [
+                    (int(erd, base=16), bytes.fromhex(payload))
+                    for erd, payload in (
+                        *device["manifests"].items(),
+                        *device["erds"].items(),
+                    )
+                ]
+                for device_name, device in snapshot.items()
+            }
+        except (AttributeError, KeyError, TypeError, ValueError):
+            _LOGGER.error("Could not read the snapshot of discovered devices")
+            return False
+
+        try:
+            for device_name, values in devices.items():
+                await self.add_device_if_not_already_exists(device_name)
+                for erd, payload in values:
+                    await self.handle_value(device_name, erd, payload)
+        except Exception:
+            _LOGGER.exception("Could not restore the snapshot of discovered devices")
+            return False
+
+        return True
+
     async def process_common_appliance_api(
-        self, msg: MQTTMessage, device_name: str
+        self, payload: bytes, device_name: str
     ) -> None:
         """Process common appliance API manifest."""
-        version = f"{int.from_bytes(msg.payload[0:4])}"
-        features = int.from_bytes(msg.payload[4:8])
+        version = f"{int.from_bytes(payload[0:4])}"
+        features = int.from_bytes(payload[4:8])
 
         common_appliance_api = await self._data_source.get_common_appliance_api_version(
             version
@@ -97,25 +141,29 @@ class GeaDiscovery:
             _LOGGER.error("Invalid common appliance API version: %s", version)
             return
 
-        await self._data_source.move_all_erds_to_unsupported_for_api_erd(
-            device_name, None, version
+        erds = await self._get_erds_for_manifest(common_appliance_api, features)
+        await self._meta_erd_coordinator.update_appliance_api(
+            device_name, COMMON_APPLIANCE_API_ERD, "common", version, erds
         )
 
-        await self._erd_factory.set_up_erds(
-            common_appliance_api["required"], device_name
+        await self._data_source.reconcile_erds_for_api_erd(
+            device_name,
+            COMMON_APPLIANCE_API_ERD,
+            {int(erd["erd"], base=16) for erd in erds},
         )
 
-        for feature in common_appliance_api["features"]:
-            if int(feature["mask"], base=16) & features:
-                await self._erd_factory.set_up_erds(feature["required"], device_name)
+        await self._erd_factory.set_up_erds(
+            erds, device_name, (None, version, features)
+        )
+        await self._data_source.subscribe_to_supported_erds(device_name)
 
     async def process_feature_appliance_api(
-        self, msg: MQTTMessage, device_name: str
+        self, payload: bytes, device_name: str, api_erd: Erd
     ) -> None:
         """Process feature appliance API manifest."""
-        feature_type = f"{int.from_bytes(msg.payload[0:2])}"
-        version = f"{int.from_bytes(msg.payload[2:4])}"
-        features = int.from_bytes(msg.payload[4:8])
+        feature_type = f"{int.from_bytes(payload[0:2])}"
+        version = f"{int.from_bytes(payload[2:4])}"
+        features = int.from_bytes(payload[4:8])
 
         feature_appliance_api = await self._data_source.get_feature_api_version(
             feature_type, version
@@ -128,17 +176,30 @@ class GeaDiscovery:
             )
             return
 
-        await self._data_source.move_all_erds_to_unsupported_for_api_erd(
-            device_name, feature_type, version
+        erds = await self._get_erds_for_manifest(feature_appliance_api, features)
+        await self._meta_erd_coordinator.update_appliance_api(
+            device_name, api_erd, feature_type, version, erds
         )
 
-        await self._erd_factory.set_up_erds(
-            feature_appliance_api["required"], device_name
+        await self._data_source.reconcile_erds_for_api_erd(
+            device_name, api_erd, {int(erd["erd"], base=16) for erd in erds}
         )
 
-        for feature in feature_appliance_api["features"]:
+        await self._erd_factory.set_up_erds(
+            erds, device_name, (feature_type, version, features)
+        )
+        await self._data_source.subscribe_to_supported_erds(device_name)
+
+    async def _get_erds_for_manifest(
+        self, appliance_api: dict[str, Any], features: int
+    ) -> list[dict[str, Any]]:
+        """Return the required ERDs of the manifest followed by those of each feature it enables."""
+        erds = list(appliance_api["required"])
+        for feature in appliance_api["features"]:
             if int(feature["mask"], base=16) & features:
-                await self._erd_factory.set_up_erds(feature["required"], device_name)
+                erds.extend(feature["required"])
+
+        return erds
 
     async def add_device_if_not_already_exists(self, device_name: str) -> None:
         """Add a device if not in the registry."""
@@ -146,3 +207,16 @@ class GeaDiscovery:
             _LOGGER.debug("Adding %s", device_name)
             device_id = await self._registry_updater.create_device(device_name)
             await self._data_source.add_device(device_name, device_id)
+            await self._registry_updater.add_diagnostic_sensors(
+                [
+                    GeaIngestSensorConfig(
+                        f"{device_name}_ingest_{key}",
+                        device_name,
+                        name,
+                        self._data_source,
+                        key,
+                    )
+                    for key, name in INGEST_DIAGNOSTICS.items()
+                ],
+                device_name,
+            )
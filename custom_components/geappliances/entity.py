@@ -1,7 +1,12 @@
 """GE Appliances Entity."""
 
+from typing import Any
+
+from homeassistant.core import callback
+
 from .const import Erd
 from .ha_compatibility.data_source import DataSource
+from .ha_compatibility.event import FieldInterest
 
 
 class GeaEntity:
@@ -12,18 +17,39 @@ class GeaEntity:
     _device_name: str
     _offset: int
     _size: int
+    _bit_mask: int | None = None
+    _decoded_value: Any = None
 
-    async def get_field_bytes(self, value: bytes) -> bytes:
-        """Return the bytes slice associated with this entity's field."""
-        return value[self._offset : (self._offset + self._size)]
+    @callback
+    def field_bytes(self, value: bytes) -> memoryview:
+        """Return a view of the bytes associated with this entity's field without copying them or awaiting."""
+        return memoryview(value)[self._offset : (self._offset + self._size)]
 
-    async def set_field_bytes(self, value: bytes, set_bytes: bytes) -> bytes:
-        """Set the bytes associated with this entity's field and return the new value."""
+    async def get_field_bytes(self, value: bytes) -> memoryview:
+        """Return a view of the bytes associated with this entity's field."""
+        return self.field_bytes(value)
+
+    async def publish_field_bytes(self, set_bytes: bytes) -> None:
+        """Set the bytes associated with this entity's field and publish the ERD."""
         assert len(set_bytes) == self._size
-        return (
-            value[0 : self._offset] + set_bytes + value[(self._offset + self._size) :]
+        await self._data_source.erd_publish_field(
+            self._device_name, self._erd, self._offset, set_bytes
         )
 
+    @callback
+    def async_set_decoded_value(self, decoded_value: Any) -> None:
+        """Cache the value decoded from the entity's field and schedule a state write, unless it is unchanged."""
+        if decoded_value == self._decoded_value:
+            return
+
+        self._decoded_value = decoded_value
+        self.async_schedule_state_write()
+
+    @callback
+    def async_schedule_state_write(self) -> None:
+        """Schedule a state write, coalesced with other updates to the device if it has a coalescing window."""
+        self._data_source.async_schedule_state_write(self._device_name, self)
+
     async def enable_or_disable(self, enabled: bool) -> None:
         """Enable or disable the entity."""
         if enabled:
@@ -33,6 +59,11 @@ class GeaEntity:
                 self._device_name, self._erd
             )
 
+    @property
+    def field_interest(self) -> FieldInterest:
+        """Return the part of the ERD this entity's state depends on."""
+        return FieldInterest(self._offset, self._size, self._bit_mask)
+
     @property
     def offset(self) -> int:
         """Return the entity's offset."""
@@ -1,5 +1,6 @@
 """Class to set up ERDs in memory and create entities for them."""
 
+from dataclasses import dataclass, replace
 import logging
 from typing import Any
 
@@ -16,6 +17,18 @@ from .models import GeaEntityConfig
 
 _LOGGER = logging.getLogger(__name__)
 
+type PlanKey = tuple[str | None, str, int]
+
+
+@dataclass
+class ErdPlan:
+    """Dataclass for holding the device-independent setup of one ERD from a manifest."""
+
+    erd: Erd
+    status_pair: dict[str, Any] | None
+    configs: list[GeaEntityConfig]
+    special: bool = False
+
 
 class ERDFactory:
     """Class to set up ERDs as they are discovered."""
@@ -34,6 +47,7 @@ class ERDFactory:
         self._special_erd_coordinator = SpecialErdCoordinator(
             data_source, self._config_factory
         )
+        self._entity_plans: dict[PlanKey, list[ErdPlan]] = {}
 
     async def get_entity_configs(
         self, erd: Erd, device_name: str
@@ -59,13 +73,78 @@ class ERDFactory:
 
         return config_list
 
-    async def set_up_erds(
+    async def _build_entity_plan(
         self, erd_api_list: list[dict[str, Any]], device_name: str
-    ) -> None:
-        """Set up all ERDs in the list so entities know how to interact with them."""
+    ) -> list[ErdPlan]:
+        """Build the ERDs, status pairs and entity configs for the list, using the device as a template."""
+        plan: list[ErdPlan] = []
+        seen_erds: set[Erd] = set()
         for erd in erd_api_list:
             erd_int = int(erd["erd"], base=16)
-            status_pair = await self._data_source.get_erd_status_pair(erd_int)
+            if erd_int in seen_erds:
+                continue
+            seen_erds.add(erd_int)
+
+            special = await self._special_erd_coordinator.is_special_erd(erd_int)
+            if special:
+                entity_configs = (
+                    await self._special_erd_coordinator.build_config_for_erd(
+                        device_name,
+                        erd_int,
+                    )
+                )
+            else:
+                entity_configs = await self.get_entity_configs(erd_int, device_name)
+
+            plan.append(
+                ErdPlan(
+                    erd_int,
+                    await self._data_source.get_erd_status_pair(erd_int),
+                    entity_configs,
+                    special,
+                )
+            )
+
+        return plan
+
+    async def _stamp_config(
+        self, config: GeaEntityConfig, device_name: str, special: bool
+    ) -> GeaEntityConfig:
+        """Return a copy of a planned config for the given device, prefixing its unique ID the way its builder did."""
+        if config.device_name == device_name:
+            return config
+
+        # ConfigFactory.get_unique_id replaces the spaces in the device name,
+        # while special ERD builders use the name as it is.
+        prefix = device_name if special else device_name.replace(" ", "_")
+        return replace(
+            config,
+            unique_identifier=prefix
+            + config.unique_identifier[len(config.device_name) :],
+            device_id=(await self._data_source.get_device(device_name)).device_id,
+            device_name=device_name,
+        )
+
+    async def set_up_erds(
+        self,
+        erd_api_list: list[dict[str, Any]],
+        device_name: str,
+        plan_key: PlanKey | None = None,
+    ) -> None:
+        """Set up all ERDs in the list so entities know how to interact with them, creating the new entities as one batch.
+
+        If a plan key is given, the entity plan for the list is cached under it and reused for later devices.
+        """
+        plan = self._entity_plans.get(plan_key) if plan_key is not None else None
+        if plan is None:
+            plan = await self._build_entity_plan(erd_api_list, device_name)
+            if plan_key is not None:
+                self._entity_plans[plan_key] = plan
+
+        new_configs: list[tuple[GeaEntityConfig, Erd]] = []
+        for erd_plan in plan:
+            erd_int = erd_plan.erd
+            status_pair = erd_plan.status_pair
             if status_pair:
                 if not await self._data_source.erd_has_subscribers(
                     device_name, status_pair["request"]
@@ -84,24 +163,29 @@ class ERDFactory:
                     device_name, erd_int, None
                 )
             if not await self._data_source.erd_has_subscribers(device_name, erd_int):
-                if await self._special_erd_coordinator.is_special_erd(erd_int):
-                    entity_configs = (
-                        await self._special_erd_coordinator.build_config_for_erd(
-                            device_name,
+                new_configs.extend(
+                    [
+                        (
+                            await self._stamp_config(
+                                config, device_name, erd_plan.special
+                            ),
                             erd_int,
                         )
-                    )
-                else:
-                    entity_configs = await self.get_entity_configs(erd_int, device_name)
+                        for config in erd_plan.configs
+                    ]
+                )
 
-                for config in entity_configs:
-                    await self._registry_updater.add_entity_to_device(
-                        config, device_name
-                    )
-                    await self._meta_erd_coordinator.apply_transforms_to_entity(
-                        device_name,
-                        await self._get_entity_unique_id_for_config(config, erd_int),
-                    )
+        if not new_configs:
+            return
+
+        await self._registry_updater.add_entities_to_device(
+            [config for config, _ in new_configs], device_name
+        )
+        for config, erd_int in new_configs:
+            await self._meta_erd_coordinator.apply_transforms_to_entity(
+                device_name,
+                await self._get_entity_unique_id_for_config(config, erd_int),
+            )
 
     async def _get_entity_unique_id_for_config(
         self, config: GeaEntityConfig, erd: Erd
@@ -1,18 +1,69 @@
 """Home Assistant compatibility class for storing and accessing GE Appliances data."""
 
-from collections.abc import Awaitable, Callable
-import json
-import re
+import asyncio
+from collections.abc import Awaitable, Callable, Collection, Coroutine
 from typing import Any
 
-from ..const import Erd
-from .event import Event
+from homeassistant.core import callback
+
+from ..catalog import ApplianceApiCatalog
+from ..const import (
+    APPLIANCE_API_ERDS,
+    DEFAULT_SUPPRESS_UNCHANGED_ERDS,
+    ERD_WRITE_WINDOW_SECONDS,
+    Erd,
+)
+from ..decoder import ErdDecoder, FieldDecoder
+from .event import Event, FieldInterest
 from .mqtt_client import GeaMQTTClient
 
-SUPPORTED_ERDS = "supported_erds"
-UNSUPPORTED_ERDS = "unsupported_erds"
-VALUE = "value"
-EVENT = "event"
+
+class ErdSlot:
+    """Class to hold the value, support flag and subscribers of one ERD on a device."""
+
+    __slots__ = ("decoded", "event", "published", "supported", "value")
+
+    def __init__(self, value: bytes | None, supported: bool) -> None:
+        """Initialize the ERD with no subscribers."""
+        self.value = value
+        self.supported = supported
+        self.event = Event(concurrent=True)
+        self.published: bytes | None = None
+        self.decoded: tuple[ErdDecoder, bytes, tuple[Any, ...]] | None = None
+
+
+class DeviceState:
+    """Class to hold the ID and ERDs of a device."""
+
+    __slots__ = (
+        "coalesce_window",
+        "device_id",
+        "erd_write_flushes",
+        "erds",
+        "flush_handle",
+        "manifest_erds",
+        "pending_erd_writes",
+        "pending_state_writes",
+        "state_write_requests",
+        "state_writes",
+        "suppress_unchanged",
+    )
+
+    def __init__(
+        self, device_id: str, coalesce_window: float, suppress_unchanged: bool
+    ) -> None:
+        """Initialize the device with no ERDs."""
+        self.device_id = device_id
+        self.erds: dict[Erd, ErdSlot] = {}
+        self.suppress_unchanged = suppress_unchanged
+        self.coalesce_window = coalesce_window
+        self.pending_state_writes: dict[Any, None] = {}
+        self.flush_handle: asyncio.TimerHandle | None = None
+        self.state_write_requests = 0
+        self.state_writes = 0
+        self.pending_erd_writes: dict[Erd, bytearray] = {}
+        self.erd_write_flushes: dict[Erd, asyncio.Task[None]] = {}
+        self.manifest_erds: dict[Erd, frozenset[Erd]] = {}
 
 
 class DataSource:
@@ -20,80 +71,46 @@ class DataSource:
 
     def __init__(
         self,
-        appliance_api: str,
-        appliance_api_erd_definitions: str,
+        catalog: ApplianceApiCatalog,
         mqtt_client: GeaMQTTClient,
+        coalesce_window: float = 0.0,
+        *,
+        write_window: float = ERD_WRITE_WINDOW_SECONDS,
+        suppress_unchanged: bool = DEFAULT_SUPPRESS_UNCHANGED_ERDS,
+        unsuppressed_devices: Collection[str] = (),
+        create_task: Callable[[Coroutine[Any, Any, None], str], asyncio.Task[None]]
+        | None = None,
     ) -> None:
-        """Initialize data source class."""
-        self._data: dict[str, Any] = {}
-        self._appliance_api: dict[str, Any] = json.loads(appliance_api)
-        self._appliance_api_erd_definitions: list[dict[str, Any]] = json.loads(
-            appliance_api_erd_definitions
-        )["erds"]
-        self._mqtt_client = mqtt_client
-
-        self._create_status_pair_dict()
-
-    def _create_status_pair_dict(self):
-        """Create a mapping of status/request ERD pairs based on their names and data fields."""
+        """Initialize data source class. The coalescing and write windows are in seconds and, like change suppression, apply to every device added.
 
-        def strip_name_field(data):
-            """Return a list of dicts with 'name' key removed from each dict."""
-            return [{k: v for k, v in item.items() if k != "name"} for item in data]
+        Change suppression is turned off for the devices named in unsuppressed_devices.
 
-        self._status_pair_dict = {}
-        temp_dict = {}
-
-        status_pair_mapping = {
-            "status": re.compile(
-                r"\bStatus\b|\bActual\b|\bState\b|\bCurrent\b", re.IGNORECASE
-            ),
-            "request": re.compile(
-                r"\bRequest\b|\bRequested\b|\bDesired\b", re.IGNORECASE
-            ),
-        }
-
-        for erd in self._appliance_api_erd_definitions:
-            name = erd["name"]
-            for key, pattern in status_pair_mapping.items():
-                if pattern.search(name):
-                    base_name = pattern.sub("", name)
-                    base_name = re.sub(r"[^\w\s]", "", base_name)
-                    base_name = re.sub(r"  ", " ", base_name).strip()
-                    if base_name not in temp_dict:
-                        temp_dict[base_name] = {}
-                    temp_dict[base_name][key] = {
-                        "id": erd["id"],
-                        "data": erd.get("data", []),
-                    }
-
-        for base_name, pair in temp_dict.items():
-            if "status" in pair and "request" in pair:
-                status_data = strip_name_field(pair["status"]["data"])
-                request_data = strip_name_field(pair["request"]["data"])
-                if status_data == request_data:
-                    self._status_pair_dict[pair["status"]["id"]] = {
-                        "name": base_name,
-                        "status": int(pair["status"]["id"], 16),
-                        "request": int(pair["request"]["id"], 16),
-                    }
-                    self._status_pair_dict[pair["request"]["id"]] = {
-                        "name": base_name,
-                        "status": int(pair["status"]["id"], 16),
-                        "request": int(pair["request"]["id"], 16),
-                    }
+        ERD write flushes are started with create_task if given, so their owner can track and cancel them, or on the running loop otherwise.
+        """
+        self._data: dict[str, DeviceState] = {}
+        self._catalog = catalog
+        self._mqtt_client = mqtt_client
+        self._coalesce_window = coalesce_window
+        self._write_window = write_window
+        self._suppress_unchanged = suppress_unchanged
+        self._unsuppressed_devices = frozenset(unsuppressed_devices)
+        self._create_task = create_task
+        self._entities: dict[str, Any] = {}
+        self._change_listener: Callable[[], None] | None = None
+        self._decoders: dict[Erd, ErdDecoder] = {}
 
     async def add_device(self, device_name: str, device_id: str) -> None:
         """Add a device to the data source. Does nothing if the device already exists in the data source."""
-        if self._data.get(device_name) is None:
-            self._data[device_name] = {
-                "id": device_id,
-                SUPPORTED_ERDS: {},
-                UNSUPPORTED_ERDS: {},
-            }
+        if device_name not in self._data:
+            self._data[device_name] = DeviceState(
+                device_id,
+                self._coalesce_window,
+                self._suppress_unchanged
+                and device_name not in self._unsuppressed_devices,
+            )
 
-    async def get_device(self, device_name: str) -> dict[str, Any]:
-        """Return the dict for the requested device or None if it doesn't exist."""
+    async def get_device(self, device_name: str) -> DeviceState:
+        """Return the state of the requested device. Raises if the device doesn't exist."""
         return self._data[device_name]
 
     async def device_exists(self, device_name: str) -> bool:
@@ -104,166 +121,429 @@ class DataSource:
         self, device_name: str, erd: Erd, value: bytes | None
     ) -> None:
         """Add the ERD to the specified device's list of supported ERDs."""
-        if erd in self._data[device_name][UNSUPPORTED_ERDS]:
-            await self.move_erd_to_supported(device_name, erd)
-        else:
-            self._data[device_name][SUPPORTED_ERDS][erd] = {
-                VALUE: value,
-                EVENT: Event(),
-            }
+        erds = self._data[device_name].erds
+        slot = erds.get(erd)
+        if slot is None:
+            erds[erd] = ErdSlot(value, True)
+        elif not slot.supported:
+            slot.supported = True
 
     async def add_unsupported_erd_to_device(
         self, device_name: str, erd: Erd, value: bytes | None
     ) -> None:
         """Add the ERD to the device's list of unsupported ERDs."""
-        if erd in self._data[device_name][SUPPORTED_ERDS]:
+        erds = self._data[device_name].erds
+        slot = erds.get(erd)
+        if slot is not None and slot.supported:
             await self.move_erd_to_unsupported(device_name, erd)
         else:
-            self._data[device_name][UNSUPPORTED_ERDS][erd] = {
-                VALUE: value,
-                EVENT: Event(),
-            }
+            erds[erd] = ErdSlot(value, False)
+            if value is not None:
+                self._async_changed()
 
     async def move_erd_to_supported(self, device_name: str, erd: Erd) -> None:
-        """Move the given ERD to the supported list."""
-        if erd not in self._data[device_name][SUPPORTED_ERDS]:
-            self._data[device_name][SUPPORTED_ERDS][erd] = self._data[device_name][
-                UNSUPPORTED_ERDS
-            ].pop(erd)
+        """Move the given ERD to the supported list and subscribe to its values."""
+        slot = self._data[device_name].erds[erd]
+        if not slot.supported:
+            slot.supported = True
+            await self.subscribe_to_supported_erds(device_name)
 
     async def move_erd_to_unsupported(self, device_name: str, erd: Erd) -> None:
-        """Move the given ERD to the unsupported list and set associated entities to STATE_UNKNOWN."""
-        if erd not in self._data[device_name][UNSUPPORTED_ERDS]:
-            self._data[device_name][UNSUPPORTED_ERDS][erd] = self._data[device_name][
-                SUPPORTED_ERDS
-            ].pop(erd)
-            await self._data[device_name][UNSUPPORTED_ERDS][erd][EVENT].publish(None)
-
-    async def move_all_erds_to_unsupported_for_api_erd(
-        self, device_name: str, feature_type: str | None, version: str
+        """Move the given ERD to the unsupported list, set associated entities to STATE_UNKNOWN and unsubscribe from its values."""
+        if await self._drop_erd_support(device_name, erd):
+            await self.subscribe_to_supported_erds(device_name)
+
+    async def _drop_erd_support(self, device_name: str, erd: Erd) -> bool:
+        """Mark the ERD unsupported and set associated entities to STATE_UNKNOWN. Return false if it already was unsupported."""
+        slot = self._data[device_name].erds[erd]
+        if not slot.supported:
+            return False
+
+        slot.supported = False
+        slot.published = None
+        await slot.event.publish(None)
+        return True
+
+    async def manifest_is_unchanged(
+        self, device_name: str, api_erd: Erd, payload: bytes
+    ) -> bool:
+        """Return true if the device already reported exactly this manifest for the appliance API ERD."""
+        slot = self._data[device_name].erds.get(api_erd)
+        return slot is not None and slot.value == payload
+
+    async def reconcile_erds_for_api_erd(
+        self, device_name: str, api_erd: Erd, erds: set[Erd]
     ) -> None:
-        """Move all ERDs listed in the given appliance API manifest to the unsupported list."""
-        appliance_api = (
-            await self.get_common_appliance_api_version(version)
-            if feature_type is None
-            else await self.get_feature_api_version(feature_type, version)
-        )
-        if appliance_api is None:
+        """Record the ERDs the appliance API ERD's manifest lists and move those it dropped, unless another manifest lists them, to the unsupported list.
+
+        Subscriptions are left as they are, since the caller updates them once the manifest's ERDs are set up.
+        """
+        device = self._data[device_name]
+        removed = device.manifest_erds.get(api_erd, frozenset()) - erds
+        device.manifest_erds[api_erd] = frozenset(erds)
+        if not removed:
             return
 
-        for erd in appliance_api["required"]:
-            erd_int = int(erd["erd"], base=16)
-            if erd_int in self._data[device_name][SUPPORTED_ERDS]:
-                await self.move_erd_to_unsupported(device_name, erd_int)
-
-        for feature in appliance_api["features"]:
-            for erd in feature["required"]:
-                erd_int = int(erd["erd"], base=16)
-                if erd_int in self._data[device_name][SUPPORTED_ERDS]:
-                    await self.move_erd_to_unsupported(device_name, erd_int)
+        still_listed = frozenset().union(*device.manifest_erds.values())
+        for erd in removed - still_listed:
+            if erd in device.erds:
+                await self._drop_erd_support(device_name, erd)
+
+    async def subscribe_to_supported_erds(self, device_name: str) -> None:
+        """Subscribe to MQTT values for exactly the ERDs the device supports."""
+        await self._mqtt_client.subscribe_to_device_erds(
+            device_name,
+            [
+                erd
+                for erd, slot in self._data[device_name].erds.items()
+                if slot.supported
+            ],
+        )
 
     async def erd_is_supported_by_device(self, device_name: str, erd: Erd) -> bool:
         """Return true if the ERD is in the device's ERD list."""
-        return erd in self._data[device_name][SUPPORTED_ERDS]
-
-    async def _get_erd_from_either_list(
-        self, device_name: str, erd: Erd
-    ) -> dict[str, Any]:
-        """Return the given erd, raising a KeyError if it doesn't exist."""
-        if erd in self._data[device_name][SUPPORTED_ERDS]:
-            return self._data[device_name][SUPPORTED_ERDS][erd]
-
-        return self._data[device_name][UNSUPPORTED_ERDS][erd]
+        slot = self._data[device_name].erds.get(erd)
+        return slot is not None and slot.supported
 
     async def erd_read(self, device_name: str, erd: Erd) -> bytes:
-        """Return the value of the specified ERD. Raises if the ERD is not present on the given device."""
-        return (await self._get_erd_from_either_list(device_name, erd))[VALUE]
+        """Return the value of the specified ERD, including edits waiting to be published. Raises if the ERD is not present on the given device."""
+        device = self._data[device_name]
+        pending = device.pending_erd_writes.get(erd)
+        if pending is not None:
+            return bytes(pending)
+
+        return device.erds[erd].value
 
     async def erd_write(self, device_name: str, erd: Erd, value: bytes) -> None:
         """Write a value to a given ERD on a device."""
-        if erd in self._data[device_name][SUPPORTED_ERDS]:
-            self._data[device_name][SUPPORTED_ERDS][erd][VALUE] = value
-            await self._data[device_name][SUPPORTED_ERDS][erd][EVENT].publish(value)
-        else:
-            self._data[device_name][UNSUPPORTED_ERDS][erd][VALUE] = value
+        slot = self._data[device_name].erds[erd]
+        if slot.value != value:
+            slot.value = value
+            self._async_changed()
+        if slot.supported:
+            previous = slot.published
+            slot.published = value
+            await slot.event.publish(value, previous)
+
+    async def erd_update(self, device_name: str, erd: Erd, value: bytes) -> bool:
+        """Write a value reported by a device, skipping subscribers if they already have it. Return true if it was published."""
+        device = self._data[device_name]
+        slot = device.erds[erd]
+        if device.suppress_unchanged and slot.supported and slot.published == value:
+            slot.value = value
+            return False
+
+        await self.erd_write(device_name, erd, value)
+        return slot.supported
+
+    @callback
+    def async_erd_update(self, device_name: str, erd: Erd, value: bytes) -> bool:
+        """Write a value reported by a device without awaiting. Return false, without writing it, if the ERD isn't supported or has coroutine subscribers."""
+        device = self._data.get(device_name)
+        if device is None:
+            return False
+
+        slot = device.erds.get(erd)
+        if slot is None or not slot.supported or not slot.event.synchronous:
+            return False
+
+        if slot.value != value:
+            slot.value = value
+            self._async_changed()
+        if not (device.suppress_unchanged and slot.published == value):
+            previous = slot.published
+            slot.published = value
+            slot.event.async_publish(value, previous)
+
+        return True
+
+    @callback
+    def async_set_change_listener(self, listener: Callable[[], None]) -> None:
+        """Set the function called without awaiting whenever a manifest or ERD value is stored."""
+        self._change_listener = listener
+
+    @callback
+    def _async_changed(self) -> None:
+        """Tell the change listener, if there is one, that the stored data changed."""
+        if self._change_listener is not None:
+            self._change_listener()
+
+    @callback
+    def async_snapshot(self) -> dict[str, dict[str, dict[str, str]]]:
+        """Return each device's appliance API manifests and the values of its supported ERDs, hex encoded by ERD."""
+        return {
+            device_name: {
+                "manifests": {
+                    f"{erd:#06x}": slot.value.hex()
+                    for erd, slot in device.erds.items()
+                    if erd in APPLIANCE_API_ERDS and slot.value is not None
+                },
+                "erds": {
+                    f"{erd:#06x}": slot.value.hex()
+                    for erd, slot in device.erds.items()
+                    if slot.supported and slot.value is not None
+                },
+            }
+            for device_name, device in self._data.items()
+        }
+
+    @callback
+    def async_schedule_state_write(self, device_name: str, entity: Any) -> None:
+        """Schedule a state write for the entity, folding it into any write already pending for the device's window."""
+        device = self._data[device_name]
+        device.state_write_requests += 1
+        if device.coalesce_window <= 0:
+            device.state_writes += 1
+            entity.async_schedule_update_ha_state(True)
+            return
+
+        device.pending_state_writes[entity] = None
+        if device.flush_handle is None:
+            device.flush_handle = asyncio.get_running_loop().call_later(
+                device.coalesce_window, self._write_pending_states, device
+            )
+
+    async def flush_state_writes(self, device_name: str) -> None:
+        """Write the states held for the device's coalescing window now."""
+        device = self._data[device_name]
+        if device.flush_handle is not None:
+            device.flush_handle.cancel()
+        self._write_pending_states(device)
+
+    @callback
+    def async_cancel_pending_writes(self) -> None:
+        """Drop the state writes held for every device's coalescing window and the ERD writes waiting to be published, so none happen after unload."""
+        for device in self._data.values():
+            for flush in device.erd_write_flushes.values():
+                flush.cancel()
+            device.erd_write_flushes.clear()
+            device.pending_erd_writes.clear()
+            if device.flush_handle is not None:
+                device.flush_handle.cancel()
+                device.flush_handle = None
+            device.pending_state_writes.clear()
+
+    def _write_pending_states(self, device: DeviceState) -> None:
+        """Write the latest state of every entity that updated during the device's window."""
+        device.flush_handle = None
+        pending = device.pending_state_writes
+        device.pending_state_writes = {}
+        for entity in pending:
+            device.state_writes += 1
+            entity.async_schedule_update_ha_state(True)
+
+    async def get_subscriber_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the call counts, latencies and failures of the subscribers to each device's ERDs."""
+        return {
+            device_name: {
+                f"{erd:#06x}": await slot.event.get_subscriber_stats()
+                for erd, slot in device.erds.items()
+                if await slot.event.has_subscribers()
+            }
+            for device_name, device in self._data.items()
+        }
+
+    async def get_ingest_stats(self, device_name: str) -> dict[str, int]:
+        """Return the depth of the device's ingest queue and how many of its messages were dropped or merged."""
+        return await self._mqtt_client.get_ingest_stats(device_name)
+
+    async def get_coalescing_stats(self) -> dict[str, dict[str, Any]]:
+        """Return how many state writes each device requested and how many were written after coalescing."""
+        return {
+            device_name: {
+                "coalesce_window": device.coalesce_window,
+                "state_write_requests": device.state_write_requests,
+                "state_writes": device.state_writes,
+                "coalescing_ratio": (
+                    device.state_write_requests / device.state_writes
+                    if device.state_writes
+                    else None
+                ),
+            }
+            for device_name, device in self._data.items()
+        }
 
     async def erd_publish(self, device_name: str, erd: Erd, value: bytes) -> None:
-        """Write a value to a given ERD on a device and publish to MQTT."""
-        if erd in self._data[device_name][SUPPORTED_ERDS]:
-            if await self._mqtt_client.publish_erd(device_name, erd, value):
-                await self.erd_write(device_name, erd, value)
-        else:
+        """Write a value to a given ERD on a device and publish to MQTT.
+
+        Values published for the same ERD within the write window replace each other and are sent as one publish. Since
+        erd_read returns the pending value, field edits made from it in the meantime are merged instead of lost.
+        """
+        if not await self.erd_is_supported_by_device(device_name, erd):
             await self.erd_write(device_name, erd, value)
+            return
+
+        device = self._data[device_name]
+        pending = device.pending_erd_writes.get(erd)
+        if pending is None:
+            device.pending_erd_writes[erd] = bytearray(value)
+        else:
+            pending[:] = value
+        await self._wait_for_erd_write(device_name, erd)
+
+    async def erd_publish_field(
+        self, device_name: str, erd: Erd, offset: int, field_bytes: bytes
+    ) -> None:
+        """Set a field of the given ERD and publish the ERD to MQTT like erd_publish.
+
+        Fields set within the write window are spliced into the ERD's pending buffer, so each edit only copies its own
+        bytes and the whole value is copied once per publish.
+        """
+        device = self._data[device_name]
+        end = offset + len(field_bytes)
+        if not await self.erd_is_supported_by_device(device_name, erd):
+            value = device.erds[erd].value
+            await self.erd_write(
+                device_name, erd, value[:offset] + field_bytes + value[end:]
+            )
+            return
+
+        pending = device.pending_erd_writes.get(erd)
+        if pending is None:
+            pending = device.pending_erd_writes[erd] = bytearray(device.erds[erd].value)
+        pending[offset:end] = field_bytes
+        await self._wait_for_erd_write(device_name, erd)
+
+    async def _wait_for_erd_write(self, device_name: str, erd: Erd) -> None:
+        """Wait for the publish of the ERD's pending value, starting it if needed."""
+        device = self._data[device_name]
+        flush = device.erd_write_flushes.get(erd)
+        if flush is None:
+            flush = device.erd_write_flushes[erd] = self._create_flush_task(
+                device_name, erd
+            )
+
+        await asyncio.shield(flush)
+
+    def _create_flush_task(self, device_name: str, erd: Erd) -> asyncio.Task[None]:
+        """Start the task that publishes the ERD's pending value."""
+        name = f"geappliances write {device_name} {erd:#06x}"
+        if self._create_task is None:
+            return asyncio.get_running_loop().create_task(
+                self._flush_erd_write(device_name, erd), name=name
+            )
+
+        return self._create_task(self._flush_erd_write(device_name, erd), name)
+
+    async def _flush_erd_write(self, device_name: str, erd: Erd) -> None:
+        """Publish the ERD's pending value once the write window has passed, again if it changed while publishing."""
+        device = self._data[device_name]
+        try:
+            await asyncio.sleep(self._write_window)
+            while True:
+                value = bytes(device.pending_erd_writes[erd])
+                if await self._mqtt_client.publish_erd(device_name, erd, value):
+                    await self.erd_write(device_name, erd, value)
+
+                if device.pending_erd_writes[erd] == value:
+                    break
+        finally:
+            # A cancelled flush may finish after another one took its place.
+            if device.erd_write_flushes.get(erd) is asyncio.current_task():
+                del device.pending_erd_writes[erd]
+                del device.erd_write_flushes[erd]
 
     async def erd_subscribe(
-        self, device_name: str, erd: Erd, callback: Callable[[bytes], Awaitable[None]]
+        self,
+        device_name: str,
+        erd: Erd,
+        callback: Callable[[bytes], Awaitable[None]],
+        interest: FieldInterest | None = None,
     ) -> None:
-        """Add the callback to the ERD's callback list."""
-        await (await self._get_erd_from_either_list(device_name, erd))[EVENT].subscribe(
-            callback
-        )
+        """Add the callback to the ERD's callback list. If an interest is given, the callback only runs when that field changes."""
+        await self._data[device_name].erds[erd].event.subscribe(callback, interest)
 
     async def erd_unsubscribe(
         self, device_name: str, erd: Erd, callback: Callable[[bytes], Awaitable[None]]
     ) -> None:
         """Remove the callback from the ERD's callback list."""
-        await (await self._get_erd_from_either_list(device_name, erd))[
-            EVENT
-        ].unsubscribe(callback)
-
-    async def _get_erd_or_none_from_either_list(
-        self, device_name: str, erd: Erd
-    ) -> dict[str, Any] | None:
-        """Return the given erd if it is present in either list."""
-        if erd in self._data[device_name][SUPPORTED_ERDS]:
-            return self._data[device_name][SUPPORTED_ERDS][erd]
-
-        return self._data[device_name][UNSUPPORTED_ERDS].get(erd)
+        await self._data[device_name].erds[erd].event.unsubscribe(callback)
 
     async def erd_has_subscribers(self, device_name: str, erd: Erd) -> bool:
         """Return true if the ERD has subscribers to its event."""
-        erd_val = await self._get_erd_or_none_from_either_list(device_name, erd)
-        if erd_val is not None:
-            return await erd_val[EVENT].has_subscribers()
+        slot = self._data[device_name].erds.get(erd)
+        if slot is not None:
+            return await slot.event.has_subscribers()
 
         return False
 
+    async def register_entity(self, unique_id: str, entity: Any) -> None:
+        """Make the entity available for lookup by its unique ID."""
+        self._entities[unique_id] = entity
+
+    async def unregister_entity(self, unique_id: str) -> None:
+        """Remove the entity with the unique ID from the lookup and drop any state write held for it."""
+        entity = self._entities.pop(unique_id, None)
+        if entity is not None:
+            for device in self._data.values():
+                device.pending_state_writes.pop(entity, None)
+
+    async def get_entity(self, unique_id: str) -> Any | None:
+        """Return the entity with the unique ID, or None if it isn't registered. Select option suffixes are ignored."""
+        entity = self._entities.get(unique_id)
+        if entity is None and "." in unique_id:
+            entity = self._entities.get(unique_id.split(".", 1)[0])
+
+        return entity
+
     async def get_common_appliance_api_version(
         self, version: str
     ) -> dict[str, Any] | None:
         """Return the dict for the requested common appliance API version, or None if it doesn't exist."""
-        return self._appliance_api["common"]["versions"].get(version)
+        return self._catalog.get_common_appliance_api_version(version)
 
     async def get_feature_api_version(
         self, feature_type: str, version: str
     ) -> dict[str, Any] | None:
         """Return the dict for the requested feature appliance API version, or None if it doesn't exist."""
-        feature_appliance_api = self._appliance_api["featureApis"].get(feature_type)
-        if feature_appliance_api is None:
-            return None
-
-        return feature_appliance_api["versions"].get(version)
+        return self._catalog.get_feature_api_version(feature_type, version)
 
     async def get_erd_def(self, erd: Erd) -> dict[str, Any] | None:
         """Find an ERD's fields in the appliance API ERD definitions."""
-        for erd_def in self._appliance_api_erd_definitions:
-            if erd_def["id"] == f"{erd:#06x}":
-                return erd_def
+        return self._catalog.get_erd_def(erd)
+
+    async def get_erd_decoder(self, erd: Erd) -> ErdDecoder | None:
+        """Return the compiled decoder for the ERD's fields, shared by every device, or None if the ERD isn't defined."""
+        decoder = self._decoders.get(erd)
+        if decoder is None:
+            if (erd_def := self._catalog.get_erd_def(erd)) is None:
+                return None
+            decoder = self._decoders[erd] = ErdDecoder(erd_def)
+
+        return decoder
+
+    @callback
+    def async_decode_field(
+        self, device_name: str, erd: Erd, value: bytes, decoder: FieldDecoder
+    ) -> Any:
+        """Return the field decoded from the ERD value. Every field of the ERD is decoded in one call, once per value, and shared by its entities."""
+        erd_decoder = decoder.erd_decoder
+        if erd_decoder is None:
+            return decoder(
+                memoryview(value)[decoder.offset : decoder.offset + decoder.size]
+            )
 
-        return None
+        slot = self._data[device_name].erds[erd]
+        decoded = slot.decoded
+        if decoded is None or decoded[0] is not erd_decoder or decoded[1] != value:
+            decoded = slot.decoded = (erd_decoder, value, erd_decoder.decode(value))
 
-    async def get_entity_id_for_unique_id(
-        self, device_name: str, erd: Erd, unique_id: str, unique_id_with_option: str
-    ) -> str | None:
-        """Return the entity ID of the entity associated with the given unique ID."""
-        erd_val = await self._get_erd_or_none_from_either_list(device_name, erd)
-        if erd_val is not None:
-            return await erd_val[EVENT].get_subscriber_with_unique_id(
-                unique_id, unique_id_with_option
-            )
+        return decoded[2][decoder.position]
+
+    async def get_erd_field_def(
+        self, erd: Erd, field_name: str
+    ) -> dict[str, Any] | None:
+        """Find the definition of a single named field of an ERD, or None if it doesn't exist."""
+        return self._catalog.get_erd_field_def(erd, field_name)
+
+    async def get_entity_id_for_unique_id(self, unique_id: str) -> str | None:
+        """Return the entity ID of the entity with the given unique ID, or None if it isn't registered."""
+        entity = await self.get_entity(unique_id)
+        if entity is not None:
+            return entity.entity_id
 
         return None
 
     async def get_erd_status_pair(self, erd: Erd) -> dict[str, Any] | None:
         """Return the status/request pair dict if the given ERD is part of a status/request pair, otherwise None."""
-        return self._status_pair_dict.get(f"{erd:#06x}", None)
+        return self._catalog.get_erd_status_pair(erd)
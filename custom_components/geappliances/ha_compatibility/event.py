@@ -1,40 +1,197 @@
 """Support for GE Appliances events."""
 
+import asyncio
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import inspect
+import logging
+import time
 from typing import Any
 
+from homeassistant.core import callback
+
+from ..const import SLOW_SUBSCRIBER_SECONDS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class FieldInterest:
+    """Class to describe the bytes of an ERD value that a subscriber depends on."""
+
+    offset: int
+    size: int
+    bit_mask: int | None = None
+
+    def changed(self, old: bytes, new: bytes) -> bool:
+        """Return true if the field differs between the two values."""
+        end = self.offset + self.size
+        old_bytes = memoryview(old)[self.offset : end]
+        new_bytes = memoryview(new)[self.offset : end]
+        if old_bytes == new_bytes:
+            return False
+
+        if self.bit_mask is None or len(old_bytes) != len(new_bytes):
+            return True
+
+        return (
+            int.from_bytes(old_bytes) ^ int.from_bytes(new_bytes)
+        ) & self.bit_mask != 0
+
+
+class SubscriberStats:
+    """Class to count how often a subscriber was called, how long it took and how often it failed."""
+
+    __slots__ = ("calls", "failures", "max_time", "total_time")
+
+    def __init__(self) -> None:
+        """Initialize with no calls."""
+        self.calls = 0
+        self.failures = 0
+        self.max_time = 0.0
+        self.total_time = 0.0
+
+    def record(self, elapsed: float, failed: bool) -> None:
+        """Add one call that took the given number of seconds."""
+        self.calls += 1
+        self.failures += failed
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+    def as_dict(self) -> dict[str, float | int]:
+        """Return the counters as a dict."""
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "max_time": self.max_time,
+            "mean_time": self.total_time / self.calls if self.calls else 0.0,
+        }
+
+
+def subscriber_name(callback: Callable[..., Any]) -> str:
+    """Return the unique ID of the entity the callback belongs to, or the callback's name if it isn't bound to one."""
+    unique_id = getattr(getattr(callback, "__self__", None), "unique_id", None)
+    if isinstance(unique_id, str):
+        return unique_id
+
+    return getattr(callback, "__qualname__", repr(callback))
+
 
 class Event:
     """Class to represent an event."""
 
-    def __init__(self) -> None:
-        """Initialize event."""
-        self._callbacks: set[Callable[[Any], Awaitable[None]]] = set()
+    def __init__(self, concurrent: bool = False) -> None:
+        """Initialize event. If concurrent, callbacks run at the same time instead of one after another."""
+        self._callbacks: dict[
+            Callable[[Any], Awaitable[None] | None], FieldInterest | None
+        ] = {}
+        self._stats: dict[Callable[[Any], Awaitable[None] | None], SubscriberStats] = {}
+        self._concurrent = concurrent
+        self._coroutine_callbacks = 0
+
+    async def subscribe(
+        self,
+        callback: Callable[[Any], Awaitable[None] | None],
+        interest: FieldInterest | None = None,
+    ) -> None:
+        """Add the function to the callbacks. If an interest is given, the function is only called when that field changes."""
+        if callback not in self._callbacks and inspect.iscoroutinefunction(callback):
+            self._coroutine_callbacks += 1
+        self._callbacks[callback] = interest
+        self._stats.setdefault(callback, SubscriberStats())
+
+    async def unsubscribe(
+        self, callback: Callable[[Any], Awaitable[None] | None]
+    ) -> None:
+        """Remove the function from the callbacks."""
+        del self._callbacks[callback]
+        self._stats.pop(callback, None)
+        if inspect.iscoroutinefunction(callback):
+            self._coroutine_callbacks -= 1
+
+    @property
+    def synchronous(self) -> bool:
+        """Return true if every callback is a plain function, so the event can be published without awaiting."""
+        return self._coroutine_callbacks == 0
 
-    async def subscribe(self, callback: Callable[[Any], Awaitable[None]]) -> None:
-        """Add the function to the callback set."""
-        self._callbacks.add(callback)
+    def _get_callbacks_to_call(
+        self, value: Any, previous: Any
+    ) -> list[Callable[[Any], Awaitable[None] | None]]:
+        """Return the callbacks whose field differs between the previous value and the new one."""
+        if isinstance(value, bytes) and isinstance(previous, bytes):
+            return [
+                callback
+                for callback, interest in self._callbacks.items()
+                if interest is None or interest.changed(previous, value)
+            ]
 
-    async def unsubscribe(self, callback: Callable[[Any], Awaitable[None]]) -> None:
-        """Remove the function from the callback set."""
-        self._callbacks.remove(callback)
+        return list(self._callbacks)
 
-    async def publish(self, value: Any) -> None:
-        """Call all callbacks in the set with the provided value."""
-        for callback in self._callbacks:
-            await callback(value)
+    async def publish(self, value: Any, previous: Any = None) -> None:
+        """Call the callbacks with the provided value, skipping those whose field is the same as in the previous value."""
+        callbacks = self._get_callbacks_to_call(value, previous)
+        if self._concurrent and len(callbacks) > 1:
+            await asyncio.gather(
+                *(self._call(callback, value) for callback in callbacks)
+            )
+        else:
+            for callback in callbacks:
+                await self._call(callback, value)
+
+    async def _call(
+        self, callback: Callable[[Any], Awaitable[None] | None], value: Any
+    ) -> None:
+        """Call one callback, logging instead of raising if it fails, and record how long it took."""
+        start = time.perf_counter()
+        failed = False
+        try:
+            result = callback(value)
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            failed = True
+            _LOGGER.exception("Subscriber %s failed", subscriber_name(callback))
+
+        self._record(callback, time.perf_counter() - start, failed)
+
+    @callback
+    def async_publish(self, value: Any, previous: Any = None) -> None:
+        """Call the callbacks with the provided value without awaiting. Only valid if the event is synchronous."""
+        for subscriber in self._get_callbacks_to_call(value, previous):
+            start = time.perf_counter()
+            failed = False
+            try:
+                subscriber(value)
+            except Exception:
+                failed = True
+                _LOGGER.exception("Subscriber %s failed", subscriber_name(subscriber))
+
+            self._record(subscriber, time.perf_counter() - start, failed)
+
+    def _record(
+        self,
+        callback: Callable[[Any], Awaitable[None] | None],
+        elapsed: float,
+        failed: bool,
+    ) -> None:
+        """Record one call of the callback and warn if it was slow."""
+        if (stats := self._stats.get(callback)) is not None:
+            stats.record(elapsed, failed)
+
+        if elapsed > SLOW_SUBSCRIBER_SECONDS:
+            _LOGGER.warning(
+                "Subscriber %s took %.3f s to handle an update",
+                subscriber_name(callback),
+                elapsed,
+            )
 
     async def has_subscribers(self) -> bool:
-        """Return true if the callback set is not empty."""
+        """Return true if there are any callbacks."""
         return len(self._callbacks) != 0
 
-    async def get_subscriber_with_unique_id(
-        self, unique_id: str, unique_id_with_option: str
-    ) -> str | None:
-        """Return the subscriber with the given unique ID, if it exists."""
-        for callback in self._callbacks:
-            entity = callback.__self__  # type:ignore [attr-defined]
-            if entity.unique_id in (unique_id, unique_id_with_option):
-                return entity.entity_id
-
-        return None
+    async def get_subscriber_stats(self) -> dict[str, dict[str, float | int]]:
+        """Return the call counts, latencies and failures of each subscriber."""
+        return {
+            subscriber_name(callback): stats.as_dict()
+            for callback, stats in self._stats.items()
+        }
@@ -0,0 +1,138 @@
+"""Per-device queues for GE Appliances MQTT messages that need the async handlers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from ..const import (
+    COMMON_APPLIANCE_API_ERD,
+    FEATURE_API_ERD_HIGH_END,
+    FEATURE_API_ERD_HIGH_START,
+    FEATURE_API_ERD_LOW_END,
+    FEATURE_API_ERD_LOW_START,
+    INGEST_QUEUE_DEPTH,
+    TOPIC_VALUE,
+)
+from ..topic import parse_topic
+
+if TYPE_CHECKING:
+    from .mqtt_client import MQTTMessage
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def is_stale_value(msg: MQTTMessage) -> bool:
+    """Return true if the message is an ERD value that a newer value makes obsolete. Appliance API manifests never are."""
+    topic = parse_topic(msg.topic)
+    if topic.kind != TOPIC_VALUE or topic.erd is None:
+        return False
+
+    erd = topic.erd
+    return not (
+        erd == COMMON_APPLIANCE_API_ERD
+        or FEATURE_API_ERD_LOW_START <= erd <= FEATURE_API_ERD_LOW_END
+        or FEATURE_API_ERD_HIGH_START <= erd <= FEATURE_API_ERD_HIGH_END
+    )
+
+
+class IngestQueue:
+    """Class to hold the messages waiting to be handled for one device."""
+
+    __slots__ = ("dropped", "merged", "pending", "task")
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self.pending: dict[str, MQTTMessage] = {}
+        self.task: asyncio.Task[None] | None = None
+        self.dropped = 0
+        self.merged = 0
+
+
+class IngestQueues:
+    """Class to handle each device's messages in order, on its own task, so one busy device doesn't hold up the others."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        handler: Callable[[MQTTMessage], Awaitable[None]],
+        max_depth: int = INGEST_QUEUE_DEPTH,
+    ) -> None:
+        """Initialize with no queues. Each device's task runs in the background of the config entry, which cancels it on unload."""
+        self._hass = hass
+        self._entry = entry
+        self._handler = handler
+        self._max_depth = max_depth
+        self._queues: dict[str, IngestQueue] = {}
+
+    @callback
+    def async_is_idle(self, device_name: str) -> bool:
+        """Return true if the device has no messages waiting or being handled."""
+        queue = self._queues.get(device_name)
+        return queue is None or (queue.task is None and not queue.pending)
+
+    @callback
+    def async_enqueue(self, device_name: str, msg: MQTTMessage) -> None:
+        """Queue the message for the device, replacing an older message on the same topic and dropping stale values when full."""
+        queue = self._queues.get(device_name)
+        if queue is None:
+            queue = self._queues[device_name] = IngestQueue()
+
+        if queue.pending.pop(msg.topic, None) is not None:
+            queue.merged += 1
+        elif len(queue.pending) >= self._max_depth and not self._drop_stale_value(
+            queue
+        ):
+            queue.dropped += 1
+            return
+
+        queue.pending[msg.topic] = msg
+        if queue.task is None:
+            # Not started eagerly, since a drain that finishes before the
+            # task is stored would leave a finished task marking the queue busy.
+            queue.task = self._entry.async_create_background_task(
+                self._hass,
+                self._drain(queue),
+                f"geappliances ingest {device_name}",
+                eager_start=False,
+            )
+
+    def _drop_stale_value(self, queue: IngestQueue) -> bool:
+        """Drop the oldest waiting value message. Return false if only manifests and other messages are waiting."""
+        for topic, pending_msg in queue.pending.items():
+            if is_stale_value(pending_msg):
+                del queue.pending[topic]
+                queue.dropped += 1
+                return True
+
+        return False
+
+    async def _drain(self, queue: IngestQueue) -> None:
+        """Handle the queued messages in order until the queue is empty. A message that fails is logged and skipped."""
+        try:
+            while queue.pending:
+                msg = queue.pending.pop(next(iter(queue.pending)))
+                try:
+                    await self._handler(msg)
+                except Exception:
+                    _LOGGER.exception("Could not handle message on %s", msg.topic)
+        finally:
+            queue.task = None
+
+    async def get_stats(self, device_name: str) -> dict[str, int]:
+        """Return how many messages are waiting for the device and how many were dropped or merged."""
+        queue = self._queues.get(device_name)
+        if queue is None:
+            return {"depth": 0, "dropped": 0, "merged": 0}
+
+        return {
+            "depth": len(queue.pending),
+            "dropped": queue.dropped,
+            "merged": queue.merged,
+        }
@@ -1,133 +1,116 @@
 """Module to manage meta ERDs."""
 
+import json
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
-from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 
-from ..const import (
-    ATTR_ALLOWABLE,
-    ATTR_ENABLED,
-    ATTR_MAX_VAL,
-    ATTR_MIN_VAL,
-    ATTR_UNIQUE_ID,
-    ATTR_UNIT,
-    COMMON_APPLIANCE_API_ERD,
-    DOMAIN,
-    FEATURE_API_ERD_HIGH_END,
-    FEATURE_API_ERD_HIGH_START,
-    FEATURE_API_ERD_LOW_END,
-    FEATURE_API_ERD_LOW_START,
-    SERVICE_ENABLE_OR_DISABLE_BASE,
-    SERVICE_SET_ALLOWABLES,
-    SERVICE_SET_MAX,
-    SERVICE_SET_MIN,
-    SERVICE_SET_UNIT,
-    Erd,
-)
+from ..const import Erd
 from .data_source import DataSource
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def set_min(
-    hass: HomeAssistant,
-    _data_source: DataSource,
+    _hass: HomeAssistant,
+    data_source: DataSource,
     _meta_erd: Erd,
-    min_val_bytes: bytes,
-    entity_id: str,
+    min_val_bytes: bytes | memoryview,
+    _entity_id: str | None,
     unique_id: str,
 ) -> None:
-    """Set the min value for the number entity."""
-    min_val = int.from_bytes(min_val_bytes)
-    await hass.services.async_call(
-        DOMAIN,
-        SERVICE_SET_MIN,
-        {ATTR_ENTITY_ID: entity_id, ATTR_UNIQUE_ID: unique_id, ATTR_MIN_VAL: min_val},
-    )
+    """Set the min value for the number entity, if it is registered."""
+    if (entity := await data_source.get_entity(unique_id)) is not None:
+        await entity.set_min(int.from_bytes(min_val_bytes))
 
 
 async def set_max(
-    hass: HomeAssistant,
-    _data_source: DataSource,
+    _hass: HomeAssistant,
+    data_source: DataSource,
     _meta_erd: Erd,
-    max_val_bytes: bytes,
-    entity_id: str,
+    max_val_bytes: bytes | memoryview,
+    _entity_id: str | None,
     unique_id: str,
 ) -> None:
-    """Set the max value for the number entity."""
-    max_val = int.from_bytes(max_val_bytes)
-    await hass.services.async_call(
-        DOMAIN,
-        SERVICE_SET_MAX,
-        {ATTR_ENTITY_ID: entity_id, ATTR_UNIQUE_ID: unique_id, ATTR_MAX_VAL: max_val},
-    )
+    """Set the max value for the number entity, if it is registered."""
+    if (entity := await data_source.get_entity(unique_id)) is not None:
+        await entity.set_max(int.from_bytes(max_val_bytes))
 
 
 async def set_unit(
-    hass: HomeAssistant,
+    _hass: HomeAssistant,
     data_source: DataSource,
     meta_erd: Erd,
-    unit_selection_bytes: bytes,
-    entity_id: str,
+    unit_selection_bytes: bytes | memoryview,
+    _entity_id: str | None,
     unique_id: str,
 ) -> None:
-    """Set the unit for the number entity."""
-    unit_selection = int.from_bytes(unit_selection_bytes)
+    """Set the unit for the number entity, if it is registered."""
+    if (entity := await data_source.get_entity(unique_id)) is None:
+        return
+
     unit = await data_source.get_erd_def(meta_erd)
     if unit is not None:
-        unit = unit["data"][0]["values"][f"{unit_selection}"]
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_SET_UNIT,
-            {ATTR_ENTITY_ID: entity_id, ATTR_UNIQUE_ID: unique_id, ATTR_UNIT: unit},
-        )
+        unit_selection = int.from_bytes(unit_selection_bytes)
+        await entity.set_unit(unit["data"][0]["values"][f"{unit_selection}"])
 
 
 async def enable_or_disable(
-    hass: HomeAssistant,
-    _data_source: DataSource,
+    _hass: HomeAssistant,
+    data_source: DataSource,
     _meta_erd: Erd,
-    enabled_bytes: bytes,
-    entity_id: str,
+    enabled_bytes: bytes | memoryview,
+    _entity_id: str | None,
     unique_id: str,
 ) -> None:
-    """Enable or disable the entity."""
-    if entity_id:
-        await hass.services.async_call(
-            DOMAIN,
-            f"{SERVICE_ENABLE_OR_DISABLE_BASE}_{entity_id.split(".")[0]}",
-            {
-                ATTR_ENTITY_ID: entity_id,
-                ATTR_UNIQUE_ID: unique_id,
-                ATTR_ENABLED: enabled_bytes != b"\x00",
-            },
-        )
+    """Enable or disable the entity, if it is registered."""
+    if (entity := await data_source.get_entity(unique_id)) is not None:
+        await entity.enable_or_disable(enabled_bytes != b"\x00")
 
 
 async def set_allowables(
-    hass: HomeAssistant,
-    _data_source: DataSource,
+    _hass: HomeAssistant,
+    data_source: DataSource,
     _meta_erd: Erd,
-    allowables_bytes: bytes,
-    entity_id: str,
+    allowables_bytes: bytes | memoryview,
+    _entity_id: str | None,
     unique_id: str,
 ) -> None:
-    """Set the allowable options for the select entity."""
-    split = unique_id.split(".")
-    option = split[1]
-    await hass.services.async_call(
-        DOMAIN,
-        SERVICE_SET_ALLOWABLES,
-        {
-            ATTR_ENTITY_ID: entity_id,
-            ATTR_UNIQUE_ID: split[0],
-            ATTR_ALLOWABLE: option,
-            ATTR_ENABLED: (int.from_bytes(allowables_bytes) & 0xFF) != 0,
-        },
-    )
+    """Set the allowable options for the select entity, if it is registered."""
+    if (entity := await data_source.get_entity(unique_id)) is not None:
+        await entity.set_allowables(
+            unique_id.split(".")[1], (int.from_bytes(allowables_bytes) & 0xFF) != 0
+        )
+
+
+def create_transform_table(meta_erd_json: dict[Any, Any]) -> dict[str, Any]:
+    """Convert meta_erd_json (from meta_erds.json) into the format expected by the coordinator."""
+    transform_table: dict[str, Any] = {}
+
+    for feature_type, versions in meta_erd_json.items():
+        ft = str(feature_type)
+        transform_table.setdefault(ft, {})
+        for version, erds in versions.items():
+            v = str(version)
+            transform_table[ft].setdefault(v, {})
+            for meta_erd, fields in erds.items():
+                meta_erd_int = int(meta_erd, 16)
+                meta_erd_entry = {}
+                for meta_field, transform in fields.items():
+                    meta_erd_entry[meta_field] = {
+                        "fields": transform["fields"],
+                        "func": globals()[transform["func"]],
+                    }
+                transform_table[ft][v][meta_erd_int] = meta_erd_entry
+
+    return transform_table
+
+
+def load_transform_table(meta_erds: str) -> dict[str, Any]:
+    """Parse the meta ERD JSON and build the transform table. Blocking, so run it in the executor."""
+    return create_transform_table(json.loads(meta_erds))
 
 
 class MetaErdCoordinator:
@@ -136,35 +119,25 @@ class MetaErdCoordinator:
     def __init__(
         self,
         data_source: DataSource,
-        meta_erd_json: dict[Any, Any],
+        transform_table: dict[str, Any],
         hass: HomeAssistant,
     ) -> None:
-        """Create the meta ERD coordinator."""
+        """Create the meta ERD coordinator from a transform table built by create_transform_table."""
         self._entity_registry = er.async_get(hass)
         self._hass = hass
         self._data_source = data_source
-        self._create_transform_table(meta_erd_json)
+        self._transform_table = transform_table
+        self._appliance_apis: dict[str, dict[Erd, tuple[str, str, set[Erd]]]] = {}
+        self._meta_erd_features: dict[str, dict[Erd, tuple[str, str]]] = {}
+        self._create_meta_erd_set()
         self._create_entities_to_meta_erds_dict()
 
     def _create_transform_table(self, meta_erd_json: dict[Any, Any]) -> None:
-        """Convert meta_erd_json (from meta_erds.json) into the format expected by the coordinator."""
-        self._transform_table = {}
-
-        for feature_type, versions in meta_erd_json.items():
-            ft = str(feature_type)
-            self._transform_table.setdefault(ft, {})
-            for version, erds in versions.items():
-                v = str(version)
-                self._transform_table[ft].setdefault(v, {})
-                for meta_erd, fields in erds.items():
-                    meta_erd_int = int(meta_erd, 16)
-                    meta_erd_entry = {}
-                    for meta_field, transform in fields.items():
-                        meta_erd_entry[meta_field] = {
-                            "fields": transform["fields"],
-                            "func": globals()[transform["func"]],
-                        }
-                    self._transform_table[ft][v][meta_erd_int] = meta_erd_entry
+        """Replace the transform table with one built from meta_erd_json."""
+        self._transform_table = create_transform_table(meta_erd_json)
+        self._create_meta_erd_set()
+        for device_name in self._appliance_apis:
+            self._index_meta_erds_for_device(device_name)
 
     def _create_entities_to_meta_erds_dict(self) -> None:
         self._entities_to_meta_erds: dict[str, list[Erd]] = {}
@@ -180,79 +153,60 @@ class MetaErdCoordinator:
                             elif meta_erd not in self._entities_to_meta_erds[entity_id]:
                                 self._entities_to_meta_erds[entity_id].append(meta_erd)
 
+    def _create_meta_erd_set(self) -> None:
+        """Collect every meta ERD in the transform table into a flat set."""
+        self._meta_erds: set[Erd] = {
+            meta_erd
+            for versions in self._transform_table.values()
+            for meta_erds in versions.values()
+            for meta_erd in meta_erds
+        }
+
+    def _index_meta_erds_for_device(self, device_name: str) -> None:
+        """Map each meta ERD the device's appliance APIs list to the feature type and version whose transforms apply to it."""
+        meta_erd_features: dict[Erd, tuple[str, str]] = {}
+        for _, (feature_type, version, erds) in sorted(
+            self._appliance_apis[device_name].items()
+        ):
+            transforms = self._transform_table.get(feature_type, {}).get(version)
+            if not transforms:
+                continue
+
+            for meta_erd in erds.intersection(transforms):
+                meta_erd_features.setdefault(meta_erd, (feature_type, version))
+
+        self._meta_erd_features[device_name] = meta_erd_features
+
+    async def update_appliance_api(
+        self,
+        device_name: str,
+        api_erd: Erd,
+        feature_type: str,
+        version: str,
+        erds: list[dict[str, Any]],
+    ) -> None:
+        """Record the ERDs an appliance API manifest lists for the device and re-index its meta ERDs."""
+        self._appliance_apis.setdefault(device_name, {})[api_erd] = (
+            feature_type,
+            version,
+            {int(erd["erd"], base=16) for erd in erds},
+        )
+        self._index_meta_erds_for_device(device_name)
+
     async def is_meta_erd(self, erd: Erd) -> bool:
         """Return true if the given ERD is a meta ERD."""
-        for feature_type in self._transform_table:
-            for feature_version in self._transform_table[feature_type]:
-                if erd in self._transform_table[feature_type][feature_version]:
-                    return True
-
-        return False
+        return self.async_is_meta_erd(erd)
 
-    async def _look_for_erd_def_in_appliance_api(
-        self, device_name: str, api_erd: Erd, meta_erd: Erd
-    ) -> tuple[str, str] | None:
-        """Check the given appliance API ERD and return a tuple containing the feature type and version if it contains the given meta ERD."""
-        try:
-            api_value = await self._data_source.erd_read(device_name, api_erd)
-        except KeyError:
-            return None
-        else:
-            if api_erd == 0x0092:
-                feature_type = "common"
-                feature_version = f"{int.from_bytes(api_value[0:4])}"
-                feature_mask = int.from_bytes(api_value[4:8])
-                feature_def = await self._data_source.get_common_appliance_api_version(
-                    feature_version
-                )
-            else:
-                feature_type = f"{int.from_bytes(api_value[0:2])}"
-                feature_version = f"{int.from_bytes(api_value[2:4])}"
-                feature_mask = int.from_bytes(api_value[4:8])
-                feature_def = await self._data_source.get_feature_api_version(
-                    feature_type, feature_version
-                )
-
-            if TYPE_CHECKING:
-                assert feature_def is not None
-
-            for erd_def in feature_def["required"]:
-                if erd_def["erd"] == f"{meta_erd:#06x}":
-                    return (feature_type, feature_version)
-
-            for feature in feature_def["features"]:
-                if int(feature["mask"], base=16) & feature_mask:
-                    for erd_def in feature["required"]:
-                        if erd_def["erd"] == f"{meta_erd:#06x}":
-                            return (feature_type, feature_version)
-
-            return None
+    @callback
+    def async_is_meta_erd(self, erd: Erd) -> bool:
+        """Return true if the given ERD is a meta ERD, without awaiting."""
+        return erd in self._meta_erds
 
     async def _get_meta_erd_feature_type_and_version(
         self, device_name: str, meta_erd: Erd
     ) -> tuple[str, str] | None:
         """Return a tuple containing the feature type and version associated with the meta ERD on this device."""
-        feature_type_and_version = await self._look_for_erd_def_in_appliance_api(
-            device_name, COMMON_APPLIANCE_API_ERD, meta_erd
-        )
-        if feature_type_and_version is not None:
-            return feature_type_and_version
-
-        for api_erd in range(FEATURE_API_ERD_LOW_START, FEATURE_API_ERD_LOW_END):
-            feature_type_and_version = await self._look_for_erd_def_in_appliance_api(
-                device_name, api_erd, meta_erd
-            )
-            if feature_type_and_version is not None:
-                return feature_type_and_version
-
-        for api_erd in range(FEATURE_API_ERD_HIGH_START, FEATURE_API_ERD_HIGH_END):
-            feature_type_and_version = await self._look_for_erd_def_in_appliance_api(
-                device_name, api_erd, meta_erd
-            )
-            if feature_type_and_version is not None:
-                return feature_type_and_version
-
-        return None
+        return self._meta_erd_features.get(device_name, {}).get(meta_erd)
 
     async def apply_transforms_for_meta_erd(
         self, device_name: str, meta_erd: Erd
@@ -272,21 +226,14 @@ class MetaErdCoordinator:
             )
             if field_bytes is not None:
                 for target_entity in transform_row["fields"]:
-                    erd_str = target_entity.split("_", 2)[1]
-                    select_option_removed = target_entity.split(".")[0]
-
+                    unique_id = target_entity.format(device_name)
                     await transform_row["func"](
                         self._hass,
                         self._data_source,
                         meta_erd,
                         field_bytes,
-                        await self._data_source.get_entity_id_for_unique_id(
-                            device_name,
-                            int(erd_str, base=16),
-                            select_option_removed.format(device_name),
-                            target_entity.format(device_name),
-                        ),
-                        target_entity.format(device_name),
+                        await self._data_source.get_entity_id_for_unique_id(unique_id),
+                        unique_id,
                     )
 
     async def apply_transforms_to_entity(
@@ -301,8 +248,8 @@ class MetaErdCoordinator:
 
     async def get_bytes_for_field(
         self, device_name: str, erd: Erd, field: str
-    ) -> bytes | None:
-        """Return the bytes associated with the given field."""
+    ) -> bytes | memoryview | None:
+        """Return the bytes associated with the given field, as a view of the ERD value unless it is a bitfield."""
         try:
             erd_bytes = await self._data_source.erd_read(device_name, erd)
         except KeyError:  # If the meta ERD has not been added to the device yet, erd_read will raise a KeyError.
@@ -311,28 +258,25 @@ class MetaErdCoordinator:
         if erd_bytes is None:
             return None
 
-        erd_def = await self._data_source.get_erd_def(erd)
-        if erd_def is None:
+        field_def = await self._data_source.get_erd_field_def(erd, field)
+        if field_def is None:
             _LOGGER.error(
                 "Could not find ERD definition for meta ERD %s", f"{erd:#06x}"
             )
             return None
 
-        for field_item in erd_def["data"]:
-            if field_item["name"] == field:
-                field_def = field_item
-
-                field_bytes = erd_bytes[
-                    field_def["offset"] : field_def["offset"] + field_def["size"]
-                ]
+        field_bytes = memoryview(erd_bytes)[
+            field_def["offset"] : field_def["offset"] + field_def["size"]
+        ]
 
-        if field_bytes is not None:
-            if "bits" in field_def:
-                field_bytes = await self._get_bits_from_bytes(field_def, field_bytes)
+        if "bits" in field_def:
+            field_bytes = await self._get_bits_from_bytes(field_def, field_bytes)
 
         return field_bytes
 
-    async def _get_bits_from_bytes(self, field_def: dict, field_bytes: bytes) -> bytes:
+    async def _get_bits_from_bytes(
+        self, field_def: dict, field_bytes: bytes | memoryview
+    ) -> bytes:
         """Return the bits from the bitfield for the specified ERD field."""
         offset = field_def["bits"]["offset"]
         size = field_def["bits"]["size"]
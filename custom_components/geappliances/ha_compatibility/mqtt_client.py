@@ -1,20 +1,26 @@
 """GE Appliances MQTT client."""
 
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterable
 from dataclasses import dataclass
 import logging
 from typing import Any, cast
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt.models import ReceiveMessage
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 
+from ..const import APPLIANCE_API_ERDS, TOPIC_VALUE, Erd
+from ..topic import ParsedTopic, parse_topic
 from .event import Event
+from .ingest_queue import IngestQueues
 
 _LOGGER = logging.getLogger()
 
 ERD_WRITE_TOPIC = "geappliances/{}/erd/{}/write"
+ERD_VALUE_TOPIC = "geappliances/{}/erd/{}/value"
+DEVICE_DISCOVERY_TOPIC = "geappliances/+"
 
 
 @dataclass
@@ -32,10 +38,14 @@ class MQTTMessage:
 class GeaMQTTClient:
     """Class to publish ERDs."""
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize client."""
         self._hass = hass
         self._event = Event()
+        self._value_handler: Callable[[ParsedTopic, bytes], bool] | None = None
+        self._queues = IngestQueues(hass, entry, self._event.publish)
+        self._discovery_subscriptions: list[CALLBACK_TYPE] = []
+        self._erd_subscriptions: dict[str, dict[Erd, CALLBACK_TYPE]] = {}
 
     async def publish_erd(self, device_name: str, erd: int, value: bytes) -> bool:
         """Publish an ERD and return true if successful."""
@@ -53,20 +63,88 @@ class GeaMQTTClient:
         else:
             return True
 
-    async def handle_message(self, msg: ReceiveMessage):
-        """Convert MQTT message to our message type and pass it on to discovery."""
-        casted_msg = MQTTMessage(
-            msg.topic,
-            bytes.fromhex(cast(str, msg.payload)),
-            msg.qos,
-            msg.retain,
-            msg.subscribed_topic,
-            msg.timestamp,
+    @callback
+    def handle_message(self, msg: ReceiveMessage) -> None:
+        """Handle the message in place if the value handler accepts it, otherwise convert it to our message type and queue it for discovery."""
+        topic = parse_topic(msg.topic)
+        payload = bytes.fromhex(cast(str, msg.payload))
+        if (
+            topic.kind == TOPIC_VALUE
+            and self._value_handler is not None
+            and self._queues.async_is_idle(topic.device_name)
+            and self._value_handler(topic, payload)
+        ):
+            return
+
+        self._queues.async_enqueue(
+            topic.device_name,
+            MQTTMessage(
+                msg.topic,
+                payload,
+                msg.qos,
+                msg.retain,
+                msg.subscribed_topic,
+                msg.timestamp,
+            ),
         )
-        await self._event.publish(casted_msg)
+
+    @callback
+    def async_set_value_handler(
+        self, handler: Callable[[ParsedTopic, bytes], bool]
+    ) -> None:
+        """Set the function that handles messages without awaiting. It returns false for messages that need the async handlers."""
+        self._value_handler = handler
 
     async def async_subscribe(
         self, handler: Callable[[MQTTMessage], Coroutine[Any, Any, None]]
     ) -> None:
         """Add function to handler list."""
         await self._event.subscribe(handler)
+
+    async def subscribe_for_discovery(self) -> None:
+        """Subscribe to the topics that announce devices and their appliance API manifests on every device."""
+        topics = [
+            DEVICE_DISCOVERY_TOPIC,
+            *(
+                ERD_VALUE_TOPIC.format("+", f"{erd:#06x}")
+                for erd in sorted(APPLIANCE_API_ERDS)
+            ),
+        ]
+        for topic in topics:
+            self._discovery_subscriptions.append(
+                await mqtt.client.async_subscribe(
+                    self._hass, topic, self.handle_message
+                )
+            )
+
+    async def subscribe_to_device_erds(
+        self, device_name: str, erds: Iterable[Erd]
+    ) -> None:
+        """Subscribe to the values of the device's ERDs and unsubscribe from those no longer listed. Appliance API ERDs are left to the discovery subscriptions."""
+        subscriptions = self._erd_subscriptions.setdefault(device_name, {})
+        wanted = {erd for erd in erds if erd not in APPLIANCE_API_ERDS}
+        for erd in subscriptions.keys() - wanted:
+            subscriptions.pop(erd)()
+
+        for erd in sorted(wanted - subscriptions.keys()):
+            subscriptions[erd] = await mqtt.client.async_subscribe(
+                self._hass,
+                ERD_VALUE_TOPIC.format(device_name, f"{erd:#06x}"),
+                self.handle_message,
+            )
+
+    @callback
+    def async_unsubscribe_all(self) -> None:
+        """Remove every MQTT subscription made by the client."""
+        for unsubscribe in self._discovery_subscriptions:
+            unsubscribe()
+        self._discovery_subscriptions.clear()
+
+        for subscriptions in self._erd_subscriptions.values():
+            for unsubscribe in subscriptions.values():
+                unsubscribe()
+        self._erd_subscriptions.clear()
+
+    async def get_ingest_stats(self, device_name: str) -> dict[str, int]:
+        """Return the depth of the device's ingest queue and how many of its messages were dropped or merged."""
+        return await self._queues.get_stats(device_name)
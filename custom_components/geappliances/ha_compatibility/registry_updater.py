@@ -1,14 +1,16 @@
 """Home Assistant compatibility class for adding and updating devices and entities."""
 
+from collections.abc import Iterable
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import Entity
 
-from ..const import DOMAIN, GEA_ENTITY_NEW
-from ..models import GeaEntityConfig
+from ..const import DOMAIN, GEA_DIAGNOSTICS_NEW, GEA_ENTITY_NEW
+from ..models import GeaEntityConfig, GeaIngestSensorConfig
 
 _LOGGER = logging.getLogger()
 
@@ -22,16 +24,33 @@ class RegistryUpdater:
         self._hass = hass
         self._entry = entry
 
-    async def add_entity_to_device(
-        self, config: GeaEntityConfig, device_name: str
+    async def add_entities_to_device(
+        self, configs: list[GeaEntityConfig], device_name: str
     ) -> None:
-        """Create an entity from the config and add it to the device."""
-        _LOGGER.debug("Adding %s to %s", config.platform, device_name)
-        if "reserved" not in config.name and "Reserved" not in config.name:
+        """Create entities from the configs and add them to the device, sending each platform a single batch."""
+        configs_by_platform: dict[str, list[GeaEntityConfig]] = {}
+        for config in configs:
+            if "reserved" not in config.name and "Reserved" not in config.name:
+                configs_by_platform.setdefault(config.platform, []).append(config)
+
+        for platform, platform_configs in configs_by_platform.items():
+            _LOGGER.debug(
+                "Adding %d %s entities to %s",
+                len(platform_configs),
+                platform,
+                device_name,
+            )
             async_dispatcher_send(
-                self._hass, GEA_ENTITY_NEW.format(config.platform), config
+                self._hass, GEA_ENTITY_NEW.format(platform), platform_configs
             )
 
+    async def add_diagnostic_sensors(
+        self, configs: list[GeaIngestSensorConfig], device_name: str
+    ) -> None:
+        """Create the device's diagnostic sensors from the configs."""
+        _LOGGER.debug("Adding %d diagnostic sensors to %s", len(configs), device_name)
+        async_dispatcher_send(self._hass, GEA_DIAGNOSTICS_NEW, configs)
+
     async def create_device(self, device_name: str) -> str:
         """Create a device and add it to the registry."""
         return self._device_registry.async_get_or_create(
@@ -39,3 +58,16 @@ class RegistryUpdater:
             identifiers={(DOMAIN, device_name)},
             name=device_name,
         ).id
+
+
+@callback
+def async_update_entity_devices(
+    entity_registry: er.EntityRegistry, entities: Iterable[tuple[Entity, str]]
+) -> None:
+    """Link each entity to its device, skipping entities the registry already has on that device."""
+    for entity, device_id in entities:
+        entry = entity_registry.async_get(entity.entity_id)
+        if entry is not None and entry.device_id == device_id:
+            continue
+
+        entity_registry.async_update_entity(entity.entity_id, device_id=device_id)
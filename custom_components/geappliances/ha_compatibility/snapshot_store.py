@@ -0,0 +1,62 @@
+"""Home Assistant compatibility class for saving discovered devices across restarts."""
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from ..const import (
+    SNAPSHOT_SAVE_DELAY_SECONDS,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+)
+from .data_source import DataSource
+
+
+def create_store(hass: HomeAssistant) -> Store[dict[str, Any]]:
+    """Return the store the snapshot is saved in."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_STORAGE_KEY)
+
+
+async def remove_snapshot(hass: HomeAssistant) -> None:
+    """Delete the saved snapshot, so removed devices aren't restored."""
+    await create_store(hass).async_remove()
+
+
+class SnapshotStore:
+    """Class to save the data source's manifests and ERD values so devices can be restored before they report again."""
+
+    def __init__(self, hass: HomeAssistant, data_source: DataSource) -> None:
+        """Initialize the store with no save scheduled."""
+        self._store = create_store(hass)
+        self._data_source = data_source
+        self._save_scheduled = False
+
+    async def load(self) -> dict[str, Any]:
+        """Return the saved snapshot, or an empty one if nothing was saved."""
+        return await self._store.async_load() or {}
+
+    async def remove(self) -> None:
+        """Delete the saved snapshot and any save scheduled for it."""
+        self._save_scheduled = False
+        await self._store.async_remove()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save a snapshot once the save delay has passed. Changes made before then are part of the same save."""
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self._store.async_delay_save(
+                self._async_get_snapshot, SNAPSHOT_SAVE_DELAY_SECONDS
+            )
+
+    async def flush(self) -> None:
+        """Save the scheduled snapshot now instead of after the delay."""
+        if self._save_scheduled:
+            await self._store.async_save(self._async_get_snapshot())
+
+    @callback
+    def _async_get_snapshot(self) -> dict[str, Any]:
+        """Return the snapshot to write and allow the next change to schedule another save."""
+        self._save_scheduled = False
+        return self._data_source.async_snapshot()
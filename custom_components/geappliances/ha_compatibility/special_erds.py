@@ -7,7 +7,7 @@ from custom_components.geappliances.models import GeaEntityConfig, GeaTimeConfig
 from homeassistant.const import Platform
 
 from ..config_factory import ConfigFactory
-from ..const import CONF_DEVICE_ID, Erd
+from ..const import Erd
 from .data_source import DataSource
 
 _LOGGER = logging.getLogger(__name__)
@@ -20,7 +20,7 @@ async def build_clock_time(
     return [
         GeaTimeConfig(
             f"{device_name}_0005_Clock_Time",
-            (await data_source.get_device(device_name))[CONF_DEVICE_ID],
+            (await data_source.get_device(device_name)).device_id,
             device_name,
             "Clock Time",
             Platform.TIME,
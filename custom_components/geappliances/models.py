@@ -1,12 +1,12 @@
 """Models to represent GE Appliances configurations from MQTT."""
 
-from collections.abc import Callable
 from dataclasses import dataclass
 
 from homeassistant.components.number import NumberDeviceClass
 from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
 
 from .const import Erd
+from .decoder import FieldDecoder
 from .ha_compatibility.data_source import DataSource
 
 
@@ -42,7 +42,7 @@ class GeaNumberConfig(GeaEntityConfig):
     scale: int
     min: float
     max: float
-    value_func: Callable
+    decoder: FieldDecoder
     bit_mask: int | None
     bit_size: int
     bit_offset: int
@@ -63,7 +63,7 @@ class GeaSensorConfig(GeaEntityConfig):
     state_class: SensorStateClass | None
     unit: str | None
     scale: int
-    value_func: Callable
+    decoder: FieldDecoder
     enum_vals: dict[int, str] | None
     bit_mask: int | None
     bit_size: int
@@ -90,3 +90,14 @@ class GeaTimeConfig(GeaEntityConfig):
     """Dataclass for holding configuration info for a time input."""
 
     is_read_only: bool
+
+
+@dataclass
+class GeaIngestSensorConfig:
+    """Dataclass for holding configuration info for a device's ingest queue diagnostic sensor."""
+
+    unique_identifier: str
+    device_name: str
+    name: str
+    data_source: DataSource
+    key: str
@@ -1,6 +1,6 @@
 """Support for GE Appliances number inputs."""
 
-from collections.abc import Callable
+from functools import cache
 import logging
 import re
 from typing import Any
@@ -31,6 +31,7 @@ from .const import (
     SERVICE_SET_UNIT_SCHEMA,
 )
 from .entity import GeaEntity
+from .ha_compatibility.registry_updater import async_update_entity_devices
 from .models import GeaNumberConfig
 
 _LOGGER = logging.getLogger(__name__)
@@ -53,12 +54,22 @@ class NumberConfigAttributes:
         r"Voltage": NumberDeviceClass.VOLTAGE,
         r"Hz": NumberDeviceClass.FREQUENCY,
     }
+    device_class_patterns: list[tuple[re.Pattern[str], NumberDeviceClass]] = [
+        (re.compile(pattern), device_class)
+        for pattern, device_class in device_class_mapping.items()
+    ]
 
     @classmethod
     async def get_device_class(cls, field: dict[str, Any]) -> NumberDeviceClass | None:
         """Determine the appropriate number device class for the given field."""
-        for name_substring, device_class in cls.device_class_mapping.items():
-            if re.search(name_substring, field["name"]) is not None:
+        return cls.find_device_class(field["name"])
+
+    @classmethod
+    @cache
+    def find_device_class(cls, field_name: str) -> NumberDeviceClass | None:
+        """Return the device class for the first pattern that matches the field name."""
+        for pattern, device_class in cls.device_class_patterns:
+            if pattern.search(field_name) is not None:
                 return device_class
 
         return None
@@ -109,19 +120,6 @@ class NumberConfigAttributes:
 
         return 0.0
 
-    @classmethod
-    async def is_value_signed(cls, field: dict[str, Any]) -> bool:
-        """Return true if the field is a signed integer and false otherwise."""
-        return field["type"] in ["i8", "i16", "i32"]
-
-    @classmethod
-    async def get_value_function(cls, field: dict[str, Any]) -> Callable[[bytes], Any]:
-        """Return the appropriate function to format the number's value."""
-        if await cls.is_value_signed(field):
-            return lambda value: int.from_bytes(value, signed=True)
-
-        return lambda value: int.from_bytes(value)  # pylint: disable=unnecessary-lambda
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -170,16 +168,20 @@ async def async_setup_entry(
     entity_registry = er.async_get(hass)
 
     @callback
-    async def async_discover(config: GeaNumberConfig) -> None:
-        """Discover and add a GE Appliances number input."""
-        _LOGGER.debug("Adding number with name: %s", config.name)
+    async def async_discover(configs: list[GeaNumberConfig]) -> None:
+        """Discover and add a batch of GE Appliances number inputs."""
+        _LOGGER.debug("Adding %d numbers", len(configs))
 
         nonlocal entity_registry
-        entity = GeaNumber(config)
-        async_add_entities([entity])
-
-        entity_registry.async_update_entity(
-            entity.entity_id, device_id=config.device_id
+        entities = [GeaNumber(config) for config in configs]
+        async_add_entities(entities)
+
+        async_update_entity_devices(
+            entity_registry,
+            [
+                (entity, config.device_id)
+                for entity, config in zip(entities, configs, strict=True)
+            ],
         )
 
     async_dispatcher_connect(
@@ -199,7 +201,6 @@ class GeaNumber(NumberEntity, GeaEntity):
         self._attr_name = config.name
         self._attr_should_poll = False
         self._attr_device_class = config.device_class
-        self._field_bytes: bytes | None = None
         self._attr_native_unit_of_measurement = config.unit
         self._attr_suggested_unit_of_measurement = config.unit
         self._attr_native_min_value = config.min
@@ -212,7 +213,7 @@ class GeaNumber(NumberEntity, GeaEntity):
         self._data_source = config.data_source
         self._offset = config.offset
         self._size = config.size
-        self._value_fn = config.value_func
+        self._decoder = config.decoder
         self._bit_mask = config.bit_mask
         self._bit_size = config.bit_size
         self._bit_offset = config.bit_offset
@@ -228,28 +229,33 @@ class GeaNumber(NumberEntity, GeaEntity):
     async def async_added_to_hass(self) -> None:
         """Set initial state from ERD and set up callback for updates."""
         value = await self._data_source.erd_read(self._device_name, self._status_erd)
-        await self.erd_updated(value)
+        self.erd_updated(value)
 
         await self._data_source.erd_subscribe(
-            self._device_name, self._status_erd, self.erd_updated
+            self._device_name, self._status_erd, self.erd_updated, self.field_interest
         )
+        await self._data_source.register_entity(self.unique_id, self)
         await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from the ERD."""
+        """Unsubscribe from the ERD and remove the entity from the unique ID lookup."""
         await self._data_source.erd_unsubscribe(
             self._device_name, self._status_erd, self.erd_updated
         )
+        await self._data_source.unregister_entity(self.unique_id)
 
     @callback
-    async def erd_updated(self, value: bytes | None) -> None:
-        """Update state from ERD."""
+    def erd_updated(self, value: bytes | None) -> None:
+        """Decode the entity's field from the ERD and update state if its value changed."""
         if value is None:
-            self._field_bytes = None
-        else:
-            self._field_bytes = await self.get_field_bytes(value)
+            self.async_set_decoded_value(None)
+            return
 
-        self.async_schedule_update_ha_state(True)
+        self.async_set_decoded_value(
+            self._data_source.async_decode_field(
+                self._device_name, self._status_erd, value, self._decoder
+            )
+        )
 
     async def _get_bytes_from_value(self, value: float) -> bytes:
         """Cast the value to bytes depending on whether the number is signed or unsigned."""
@@ -270,25 +276,12 @@ class GeaNumber(NumberEntity, GeaEntity):
                     | (int(value) << (self._bit_size - self._bit_offset))
                 ).to_bytes()
 
-            await self._data_source.erd_publish(
-                self._device_name,
-                self._erd,
-                await self.set_field_bytes(erd_value, value_bytes),
-            )
+            await self.publish_field_bytes(value_bytes)
 
     @property
     def native_value(self) -> int | None:
         """Return value of the number."""
-        if self._field_bytes is None:
-            return None
-
-        val = self._value_fn(self._field_bytes)
-
-        if self._bit_mask is not None:
-            shift = (self._size * 8) - self._bit_size - self._bit_offset
-            val = (val & self._bit_mask) >> shift
-
-        return (val / self._scale) if self._scale > 1 else val
+        return self._decoded_value
 
     async def set_min(self, min_val: float) -> None:
         """Set the minimum value."""
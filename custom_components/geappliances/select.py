@@ -23,6 +23,7 @@ from .const import (
     SERVICE_SET_ALLOWABLES_SCHEMA,
 )
 from .entity import GeaEntity
+from .ha_compatibility.registry_updater import async_update_entity_devices
 from .models import GeaSelectConfig
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,16 +73,20 @@ async def async_setup_entry(
     entity_registry = er.async_get(hass)
 
     @callback
-    async def async_discover(config: GeaSelectConfig) -> None:
-        """Discover and add a GE Appliances select dropdown."""
-        _LOGGER.debug("Adding select with name: %s", config.name)
+    async def async_discover(configs: list[GeaSelectConfig]) -> None:
+        """Discover and add a batch of GE Appliances select dropdowns."""
+        _LOGGER.debug("Adding %d selects", len(configs))
 
         nonlocal entity_registry
-        entity = GeaSelect(config)
-        async_add_entities([entity])
-
-        entity_registry.async_update_entity(
-            entity.entity_id, device_id=config.device_id
+        entities = [GeaSelect(config) for config in configs]
+        async_add_entities(entities)
+
+        async_update_entity_devices(
+            entity_registry,
+            [
+                (entity, config.device_id)
+                for entity, config in zip(entities, configs, strict=True)
+            ],
         )
 
     async_dispatcher_connect(
@@ -100,7 +105,6 @@ class GeaSelect(SelectEntity, GeaEntity):
         self._attr_has_entity_name = True
         self._attr_name = config.name
         self._attr_should_poll = False
-        self._field_bytes: bytes | None = None
         self._enum_vals = config.enum_vals
         self._attr_options = list(config.enum_vals.values())
         self._erd = config.erd
@@ -120,28 +124,31 @@ class GeaSelect(SelectEntity, GeaEntity):
     async def async_added_to_hass(self) -> None:
         """Set initial state from ERD and set up callback for updates."""
         value = await self._data_source.erd_read(self._device_name, self._status_erd)
-        await self.erd_updated(value)
+        self.erd_updated(value)
 
         await self._data_source.erd_subscribe(
-            self._device_name, self._status_erd, self.erd_updated
+            self._device_name, self._status_erd, self.erd_updated, self.field_interest
         )
+        await self._data_source.register_entity(self.unique_id, self)
         await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from the ERD."""
+        """Unsubscribe from the ERD and remove the entity from the unique ID lookup."""
         await self._data_source.erd_unsubscribe(
             self._device_name, self._status_erd, self.erd_updated
         )
+        await self._data_source.unregister_entity(self.unique_id)
 
     @callback
-    async def erd_updated(self, value: bytes | None) -> None:
-        """Update state from ERD."""
+    def erd_updated(self, value: bytes | None) -> None:
+        """Decode the entity's field from the ERD and update state if its value changed."""
         if value is None:
-            self._field_bytes = None
-        else:
-            self._field_bytes = await self.get_field_bytes(value)
+            self.async_set_decoded_value(None)
+            return
 
-        self.async_schedule_update_ha_state(True)
+        self.async_set_decoded_value(
+            self._enum_vals[int.from_bytes(self.field_bytes(value))]
+        )
 
     async def _get_bytes_from_option(self, value: str) -> bytes:
         """Get the correct enum value for the selected option."""
@@ -156,19 +163,12 @@ class GeaSelect(SelectEntity, GeaEntity):
         erd_value = await self._data_source.erd_read(self._device_name, self._erd)
         if erd_value is not None:
             option_bytes = await self._get_bytes_from_option(option)
-            await self._data_source.erd_publish(
-                self._device_name,
-                self._erd,
-                await self.set_field_bytes(erd_value, option_bytes),
-            )
+            await self.publish_field_bytes(option_bytes)
 
     @property
     def current_option(self) -> str | None:
         """Return value of the select."""
-        if self._field_bytes is None:
-            return None
-
-        return self._enum_vals[int.from_bytes(self._field_bytes)]
+        return self._decoded_value
 
     async def set_allowables(self, allowable: str, enabled: bool) -> None:
         """Update the allowable list of options."""
@@ -1,8 +1,8 @@
 """Support for GE Appliances sensors."""
 
-from collections.abc import Callable
 from datetime import date, datetime
 from decimal import Decimal
+from functools import cache
 import logging
 import math
 import re
@@ -12,20 +12,25 @@ from homeassistant.components import sensor
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import entity_platform, entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     ATTR_ENABLED,
     ATTR_UNIQUE_ID,
+    DOMAIN,
+    GEA_DIAGNOSTICS_NEW,
     GEA_ENTITY_NEW,
     SERVICE_ENABLE_OR_DISABLE_BASE,
     SERVICE_ENABLE_OR_DISABLE_SCHEMA,
 )
 from .entity import GeaEntity
-from .models import GeaSensorConfig
+from .ha_compatibility.registry_updater import async_update_entity_devices
+from .models import GeaIngestSensorConfig, GeaSensorConfig
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,6 +53,10 @@ class SensorConfigAttributes:
         r"Voltage": SensorDeviceClass.VOLTAGE,
         r"Hz": SensorDeviceClass.FREQUENCY,
     }
+    device_class_patterns: list[tuple[re.Pattern[str], SensorDeviceClass]] = [
+        (re.compile(pattern), device_class)
+        for pattern, device_class in device_class_mapping.items()
+    ]
 
     @classmethod
     async def get_device_class(cls, field: dict[str, Any]) -> SensorDeviceClass | None:
@@ -58,8 +67,14 @@ class SensorConfigAttributes:
         if field["type"] == "enum":
             return SensorDeviceClass.ENUM
 
-        for name_substring, device_class in cls.device_class_mapping.items():
-            if re.search(name_substring, field["name"]) is not None:
+        return cls.find_device_class(field["name"])
+
+    @classmethod
+    @cache
+    def find_device_class(cls, field_name: str) -> SensorDeviceClass | None:
+        """Return the device class for the first pattern that matches the field name."""
+        for pattern, device_class in cls.device_class_patterns:
+            if pattern.search(field_name) is not None:
                 return device_class
 
         return None
@@ -74,11 +89,6 @@ class SensorConfigAttributes:
 
         return None
 
-    @classmethod
-    async def is_value_signed(cls, field: dict[str, Any]) -> bool:
-        """Return true if the field is a signed integer and false otherwise."""
-        return field["type"] in ["i8", "i16", "i32"]
-
     @classmethod
     async def get_enum_values(cls, field: dict[str, Any]) -> dict[int, str] | None:
         """Return possible enum values or none if field is not an enum."""
@@ -90,20 +100,6 @@ class SensorConfigAttributes:
             vals[int(key, base=10)] = val
         return vals
 
-    @classmethod
-    async def get_value_function(cls, field: dict[str, Any]) -> Callable[[bytes], Any]:
-        """Return the appropriate function to format the sensor's value."""
-        if await cls.is_value_signed(field):
-            return lambda value: int.from_bytes(value, signed=True)
-
-        if field["type"] == "string":
-            return lambda value: value.decode("utf-8")
-
-        if field["type"] == "raw":
-            return lambda value: value.hex()
-
-        return lambda value: int.from_bytes(value)  # pylint: disable=unnecessary-lambda
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -128,16 +124,20 @@ async def async_setup_entry(
     entity_registry = er.async_get(hass)
 
     @callback
-    async def async_discover(config: GeaSensorConfig) -> None:
-        """Discover and add a GE Appliances binary sensor."""
-        _LOGGER.debug("Adding binary sensor with name: %s", config.name)
+    async def async_discover(configs: list[GeaSensorConfig]) -> None:
+        """Discover and add a batch of GE Appliances sensors."""
+        _LOGGER.debug("Adding %d sensors", len(configs))
 
         nonlocal entity_registry
-        entity = GeaSensor(config)
-        async_add_entities([entity])
-
-        entity_registry.async_update_entity(
-            entity.entity_id, device_id=config.device_id
+        entities = [GeaSensor(config) for config in configs]
+        async_add_entities(entities)
+
+        async_update_entity_devices(
+            entity_registry,
+            [
+                (entity, config.device_id)
+                for entity, config in zip(entities, configs, strict=True)
+            ],
         )
 
     async_dispatcher_connect(
@@ -146,6 +146,13 @@ async def async_setup_entry(
         async_discover,
     )
 
+    @callback
+    def async_discover_diagnostics(configs: list[GeaIngestSensorConfig]) -> None:
+        """Add a device's diagnostic sensors."""
+        async_add_entities(GeaIngestSensor(config) for config in configs)
+
+    async_dispatcher_connect(hass, GEA_DIAGNOSTICS_NEW, async_discover_diagnostics)
+
 
 class GeaSensor(SensorEntity, GeaEntity):
     """Representation of a GE Appliances binary sensor."""
@@ -158,7 +165,6 @@ class GeaSensor(SensorEntity, GeaEntity):
         self._attr_should_poll = False
         self._attr_device_class = config.device_class
         self._attr_state_class = config.state_class
-        self._field_bytes: bytes | None = None
         self._attr_native_unit_of_measurement = config.unit
         if config.device_class not in [
             SensorDeviceClass.BATTERY,
@@ -176,7 +182,7 @@ class GeaSensor(SensorEntity, GeaEntity):
         self._data_source = config.data_source
         self._offset = config.offset
         self._size = config.size
-        self._value_fn = config.value_func
+        self._decoder = config.decoder
         self._bit_mask = config.bit_mask
         self._bit_size = config.bit_size
         self._bit_offset = config.bit_offset
@@ -205,47 +211,64 @@ class GeaSensor(SensorEntity, GeaEntity):
     async def async_added_to_hass(self) -> None:
         """Set initial state from ERD and set up callback for updates."""
         value = await self._data_source.erd_read(self._device_name, self._erd)
-        await self.erd_updated(value)
+        self.erd_updated(value)
 
         await self._data_source.erd_subscribe(
-            self._device_name, self._erd, self.erd_updated
+            self._device_name, self._erd, self.erd_updated, self.field_interest
         )
+        await self._data_source.register_entity(self.unique_id, self)
         await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from the ERD."""
+        """Unsubscribe from the ERD and remove the entity from the unique ID lookup."""
         await self._data_source.erd_unsubscribe(
             self._device_name, self._erd, self.erd_updated
         )
+        await self._data_source.unregister_entity(self.unique_id)
 
     @callback
-    async def erd_updated(self, value: bytes | None) -> None:
-        """Update state from ERD."""
+    def erd_updated(self, value: bytes | None) -> None:
+        """Decode the entity's field from the ERD and update state if its value changed."""
         if value is None:
-            self._field_bytes = None
-        else:
-            self._field_bytes = await self.get_field_bytes(value)
+            self.async_set_decoded_value(None)
+            return
 
-        self.async_schedule_update_ha_state(True)
+        decoded_value = self._data_source.async_decode_field(
+            self._device_name, self._erd, value, self._decoder
+        )
+        if self._attr_device_class == SensorDeviceClass.ENUM:
+            if TYPE_CHECKING:
+                assert self._enum_vals is not None
+            decoded_value = self._enum_vals.get(decoded_value)
+
+        self.async_set_decoded_value(decoded_value)
 
     @property
     def native_value(self) -> str | int | float | date | datetime | Decimal | None:
         """Return value of the sensor."""
-        if self._field_bytes is None:
-            return None
+        return self._decoded_value
 
-        if self._attr_device_class == SensorDeviceClass.ENUM:
-            if TYPE_CHECKING:
-                assert self._enum_vals is not None
-            return self._enum_vals.get(self._value_fn(self._field_bytes))
 
-        val = self._value_fn(self._field_bytes)
+class GeaIngestSensor(SensorEntity):
+    """Representation of a diagnostic sensor for a GE Appliances device's ingest queue."""
 
-        if self._bit_mask is not None:
-            shift = (self._size * 8) - self._bit_size - self._bit_offset
-            val = (val & self._bit_mask) >> shift
-
-        if self._type not in ("string", "raw", "enum"):
-            return (val / self._scale) if self._scale > 1 else val
+    def __init__(self, config: GeaIngestSensorConfig) -> None:
+        """Initialize the sensor."""
+        self._attr_unique_id = config.unique_identifier
+        self._attr_has_entity_name = True
+        self._attr_name = config.name
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_state_class = (
+            SensorStateClass.MEASUREMENT
+            if config.key == "depth"
+            else SensorStateClass.TOTAL_INCREASING
+        )
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, config.device_name)})
+        self._device_name = config.device_name
+        self._data_source = config.data_source
+        self._key = config.key
 
-        return val
+    async def async_update(self) -> None:
+        """Read the counter from the device's ingest queue."""
+        stats = await self._data_source.get_ingest_stats(self._device_name)
+        self._attr_native_value = stats[self._key]
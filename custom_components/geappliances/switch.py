@@ -19,6 +19,7 @@ from .const import (
     SERVICE_ENABLE_OR_DISABLE_SCHEMA,
 )
 from .entity import GeaEntity
+from .ha_compatibility.registry_updater import async_update_entity_devices
 from .models import GeaSwitchConfig
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,16 +48,20 @@ async def async_setup_entry(
     entity_registry = er.async_get(hass)
 
     @callback
-    async def async_discover(config: GeaSwitchConfig) -> None:
-        """Discover and add a GE Appliances switch."""
-        _LOGGER.debug("Adding switch with name: %s", config.name)
+    async def async_discover(configs: list[GeaSwitchConfig]) -> None:
+        """Discover and add a batch of GE Appliances switches."""
+        _LOGGER.debug("Adding %d switches", len(configs))
 
         nonlocal entity_registry
-        entity = GeaSwitch(config)
-        async_add_entities([entity])
-
-        entity_registry.async_update_entity(
-            entity.entity_id, device_id=config.device_id
+        entities = [GeaSwitch(config) for config in configs]
+        async_add_entities(entities)
+
+        async_update_entity_devices(
+            entity_registry,
+            [
+                (entity, config.device_id)
+                for entity, config in zip(entities, configs, strict=True)
+            ],
         )
 
     async_dispatcher_connect(
@@ -93,30 +98,32 @@ class GeaSwitch(SwitchEntity, GeaEntity):
     async def async_added_to_hass(self) -> None:
         """Set initial state from ERD and set up callback for updates."""
         value = await self._data_source.erd_read(self._device_name, self._status_erd)
-        await self.erd_updated(value)
+        self.erd_updated(value)
 
         await self._data_source.erd_subscribe(
-            self._device_name, self._status_erd, self.erd_updated
+            self._device_name, self._status_erd, self.erd_updated, self.field_interest
         )
+        await self._data_source.register_entity(self.unique_id, self)
         await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from the ERD."""
+        """Unsubscribe from the ERD and remove the entity from the unique ID lookup."""
         await self._data_source.erd_unsubscribe(
             self._device_name, self._status_erd, self.erd_updated
         )
+        await self._data_source.unregister_entity(self.unique_id)
 
     @callback
-    async def erd_updated(self, value: bytes | None) -> None:
-        """Update state from ERD."""
+    def erd_updated(self, value: bytes | None) -> None:
+        """Update state from ERD if the entity's bit changed."""
         if value is None:
-            self._attr_is_on = None
+            is_on = None
         else:
-            self._attr_is_on = (
-                int.from_bytes(await self.get_field_bytes(value)) & self._bit_mask != 0
-            )
+            is_on = int.from_bytes(self.field_bytes(value)) & self._bit_mask != 0
 
-        self.async_schedule_update_ha_state(True)
+        if is_on != self._attr_is_on:
+            self._attr_is_on = is_on
+            self.async_schedule_state_write()
 
     @property
     async def async_is_on(self) -> bool | None:
@@ -128,24 +135,19 @@ class GeaSwitch(SwitchEntity, GeaEntity):
         value = await self._data_source.erd_read(self._device_name, self._erd)
         if value is not None:
             if self._bit_mask == 0xFF:
-                value = await self.set_field_bytes(value, bytes.fromhex("01"))
+                await self.publish_field_bytes(bytes.fromhex("01"))
             else:
-                value = await self.set_field_bytes(
-                    value,
-                    (value[self._offset] | self._bit_mask).to_bytes(),
+                await self.publish_field_bytes(
+                    (value[self._offset] | self._bit_mask).to_bytes()
                 )
 
-            await self._data_source.erd_publish(self._device_name, self._erd, value)
-
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         value = await self._data_source.erd_read(self._device_name, self._erd)
         if value is not None:
-            value = await self.set_field_bytes(
-                value,
-                (value[self._offset] & ~self._bit_mask).to_bytes(),
+            await self.publish_field_bytes(
+                (value[self._offset] & ~self._bit_mask).to_bytes()
             )
-            await self._data_source.erd_publish(self._device_name, self._erd, value)
 
     async def async_toggle(self, **kwargs: Any) -> None:
         """Toggle the switch."""
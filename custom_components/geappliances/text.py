@@ -19,6 +19,7 @@ from .const import (
     SERVICE_ENABLE_OR_DISABLE_SCHEMA,
 )
 from .entity import GeaEntity
+from .ha_compatibility.registry_updater import async_update_entity_devices
 from .models import GeaTextConfig
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,16 +48,20 @@ async def async_setup_entry(
     entity_registry = er.async_get(hass)
 
     @callback
-    async def async_discover(config: GeaTextConfig) -> None:
-        """Discover and add a GE Appliances text input."""
-        _LOGGER.debug("Adding text with name: %s", config.name)
+    async def async_discover(configs: list[GeaTextConfig]) -> None:
+        """Discover and add a batch of GE Appliances text inputs."""
+        _LOGGER.debug("Adding %d text inputs", len(configs))
 
         nonlocal entity_registry
-        entity = GeaText(config)
-        async_add_entities([entity])
-
-        entity_registry.async_update_entity(
-            entity.entity_id, device_id=config.device_id
+        entities = [GeaText(config) for config in configs]
+        async_add_entities(entities)
+
+        async_update_entity_devices(
+            entity_registry,
+            [
+                (entity, config.device_id)
+                for entity, config in zip(entities, configs, strict=True)
+            ],
         )
 
     async_dispatcher_connect(
@@ -75,7 +80,6 @@ class GeaText(TextEntity, GeaEntity):
         self._attr_has_entity_name = True
         self._attr_name = config.name
         self._attr_should_poll = False
-        self._field_bytes: bytes | None = None
         self._attr_native_max = config.size * 2 if config.is_raw_bytes else config.size
         self._erd = config.erd
         self._status_erd = config.status_erd or config.erd
@@ -95,28 +99,33 @@ class GeaText(TextEntity, GeaEntity):
     async def async_added_to_hass(self) -> None:
         """Set initial state from ERD and set up callback for updates."""
         value = await self._data_source.erd_read(self._device_name, self._status_erd)
-        await self.erd_updated(value)
+        self.erd_updated(value)
 
         await self._data_source.erd_subscribe(
-            self._device_name, self._status_erd, self.erd_updated
+            self._device_name, self._status_erd, self.erd_updated, self.field_interest
         )
+        await self._data_source.register_entity(self.unique_id, self)
         await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from the ERD."""
+        """Unsubscribe from the ERD and remove the entity from the unique ID lookup."""
         await self._data_source.erd_unsubscribe(
             self._device_name, self._status_erd, self.erd_updated
         )
+        await self._data_source.unregister_entity(self.unique_id)
 
     @callback
-    async def erd_updated(self, value: bytes | None) -> None:
-        """Update state from ERD."""
+    def erd_updated(self, value: bytes | None) -> None:
+        """Decode the entity's field from the ERD and update state if its value changed."""
         if value is None:
-            self._field_bytes = None
-        else:
-            self._field_bytes = await self.get_field_bytes(value)
+            self.async_set_decoded_value(None)
+            return
 
-        self.async_schedule_update_ha_state(True)
+        field_bytes = self.field_bytes(value)
+        if self._is_raw_bytes:
+            self.async_set_decoded_value(field_bytes.hex())
+        else:
+            self.async_set_decoded_value(str(field_bytes, "utf-8"))
 
     async def _get_bytes_from_value(self, value: str) -> bytes:
         """Convert the string value to bytes."""
@@ -131,18 +140,9 @@ class GeaText(TextEntity, GeaEntity):
             else:
                 value_bytes = await self._get_bytes_from_value(value)
 
-            await self._data_source.erd_publish(
-                self._device_name,
-                self._erd,
-                await self.set_field_bytes(erd_value, value_bytes),
-            )
+            await self.publish_field_bytes(value_bytes)
 
     @property
     def native_value(self) -> str | None:
         """Return value of the text."""
-        if self._field_bytes is None:
-            return None
-        if self._is_raw_bytes:
-            return self._field_bytes.hex()
-
-        return self._field_bytes.decode()
+        return self._decoded_value
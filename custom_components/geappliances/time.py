@@ -19,6 +19,7 @@ from .const import (
     SERVICE_ENABLE_OR_DISABLE_SCHEMA,
 )
 from .entity import GeaEntity
+from .ha_compatibility.registry_updater import async_update_entity_devices
 from .models import GeaTimeConfig
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,16 +48,20 @@ async def async_setup_entry(
     entity_registry = er.async_get(hass)
 
     @callback
-    async def async_discover(config: GeaTimeConfig) -> None:
-        """Discover and add a GE Appliances time input."""
-        _LOGGER.debug("Adding time with name: %s", config.name)
+    async def async_discover(configs: list[GeaTimeConfig]) -> None:
+        """Discover and add a batch of GE Appliances time inputs."""
+        _LOGGER.debug("Adding %d times", len(configs))
 
         nonlocal entity_registry
-        entity = GeaTime(config)
-        async_add_entities([entity])
-
-        entity_registry.async_update_entity(
-            entity.entity_id, device_id=config.device_id
+        entities = [GeaTime(config) for config in configs]
+        async_add_entities(entities)
+
+        async_update_entity_devices(
+            entity_registry,
+            [
+                (entity, config.device_id)
+                for entity, config in zip(entities, configs, strict=True)
+            ],
         )
 
     async_dispatcher_connect(
@@ -75,7 +80,6 @@ class GeaTime(TimeEntity, GeaEntity):
         self._attr_has_entity_name = True
         self._attr_name = config.name
         self._attr_should_poll = False
-        self._field_bytes: bytes | None = None
         self._erd = config.erd
         self._status_erd = config.status_erd or config.erd
         self._device_name = config.device_name
@@ -97,28 +101,36 @@ class GeaTime(TimeEntity, GeaEntity):
     async def async_added_to_hass(self) -> None:
         """Set initial state from ERD and set up callback for updates."""
         value = await self._data_source.erd_read(self._device_name, self._status_erd)
-        await self.erd_updated(value)
+        self.erd_updated(value)
 
         await self._data_source.erd_subscribe(
-            self._device_name, self._status_erd, self.erd_updated
+            self._device_name, self._status_erd, self.erd_updated, self.field_interest
         )
+        await self._data_source.register_entity(self.unique_id, self)
         await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from the ERD."""
+        """Unsubscribe from the ERD and remove the entity from the unique ID lookup."""
         await self._data_source.erd_unsubscribe(
             self._device_name, self._status_erd, self.erd_updated
         )
+        await self._data_source.unregister_entity(self.unique_id)
 
     @callback
-    async def erd_updated(self, value: bytes | None) -> None:
-        """Update state from ERD."""
+    def erd_updated(self, value: bytes | None) -> None:
+        """Decode the entity's field from the ERD and update state if its value changed."""
         if value is None:
-            self._field_bytes = None
-        else:
-            self._field_bytes = await self.get_field_bytes(value)
+            self.async_set_decoded_value(None)
+            return
 
-        self.async_schedule_update_ha_state(True)
+        field_bytes = self.field_bytes(value)
+        self.async_set_decoded_value(
+            time(
+                int.from_bytes(field_bytes[0:1]),
+                int.from_bytes(field_bytes[1:2]),
+                int.from_bytes(field_bytes[2:3]),
+            )
+        )
 
     async def _get_bytes_from_value(self, value: time) -> bytes:
         """Cast the time to bytes."""
@@ -135,20 +147,9 @@ class GeaTime(TimeEntity, GeaEntity):
         erd_value = await self._data_source.erd_read(self._device_name, self._erd)
         if erd_value is not None:
             value_bytes = await self._get_bytes_from_value(value)
-            await self._data_source.erd_publish(
-                self._device_name,
-                self._erd,
-                await self.set_field_bytes(erd_value, value_bytes),
-            )
+            await self.publish_field_bytes(value_bytes)
 
     @property
     def native_value(self) -> time | None:
         """Return value of the time."""
-        if self._field_bytes is None:
-            return None
-
-        hour = int.from_bytes(self._field_bytes[0:1])
-        minute = int.from_bytes(self._field_bytes[1:2])
-        second = int.from_bytes(self._field_bytes[2:3])
-
-        return time(hour, minute, second)
+        return self._decoded_value
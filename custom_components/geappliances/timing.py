@@ -0,0 +1,32 @@
+"""Timing instrumentation for the GE Appliances integration's staged startup."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import logging
+import time
+
+
+class StageTimings:
+    """Class to record how long each stage of a staged build took."""
+
+    def __init__(self) -> None:
+        """Initialize with no recorded stages."""
+        self._durations: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the body of the with block and record it under the stage name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._durations[name] = time.perf_counter() - start
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the recorded stage durations in seconds, in the order they finished."""
+        return dict(self._durations)
+
+    def log(self, logger: logging.Logger) -> None:
+        """Log each recorded stage duration at debug level."""
+        for name, duration in self._durations.items():
+            logger.debug("Startup stage '%s' took %.3f s", name, duration)
@@ -0,0 +1,41 @@
+"""Parsing of GE Appliances MQTT topics."""
+
+from functools import lru_cache
+import sys
+from typing import NamedTuple
+
+from .const import (
+    TOPIC_CACHE_SIZE,
+    TOPIC_DEVICE,
+    TOPIC_INVALID,
+    TOPIC_VALUE,
+    TOPIC_WRITE,
+    Erd,
+)
+
+
+class ParsedTopic(NamedTuple):
+    """Device, ERD and kind of message an MQTT topic addresses."""
+
+    device_name: str
+    erd: Erd | None
+    kind: str
+
+
+@lru_cache(maxsize=TOPIC_CACHE_SIZE)
+def parse_topic(topic: str) -> ParsedTopic:
+    """Split a topic into its device, ERD and kind. The result for each topic is cached, since there is one per device ERD."""
+    split_topic = topic.split("/")
+    device_name = sys.intern(split_topic[1]) if len(split_topic) > 1 else ""
+    if len(split_topic) == 2:
+        return ParsedTopic(device_name, None, TOPIC_DEVICE)
+
+    if len(split_topic) == 5 and split_topic[4] in (TOPIC_VALUE, TOPIC_WRITE):
+        try:
+            erd = int(split_topic[3], base=16)
+        except ValueError:
+            return ParsedTopic(device_name, None, TOPIC_INVALID)
+
+        return ParsedTopic(device_name, erd, sys.intern(split_topic[4]))
+
+    return ParsedTopic(device_name, None, TOPIC_INVALID)
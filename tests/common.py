@@ -1,9 +1,15 @@
 """Common values and helpers for tests."""
 
+from datetime import datetime
 import json
 from unittest.mock import patch
 
-from custom_components.geappliances.const import DISCOVERY, DOMAIN, Erd
+from custom_components.geappliances.catalog import (
+    ApplianceApiCatalog,
+    LazyApplianceApiCatalog,
+)
+from custom_components.geappliances.const import DATA_SOURCE, DISCOVERY, DOMAIN, Erd
+import pytest
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
     async_fire_mqtt_message,
@@ -11,6 +17,7 @@ from pytest_homeassistant_custom_component.common import (
 from pytest_homeassistant_custom_component.typing import MqttMockHAClient
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM, UnitSystem
 
 ERD_VALUE_TOPIC = "geappliances/test/erd/{}/value"
@@ -56,23 +63,29 @@ async def given_integration_is_initialized(
         given_the_special_erd_map_is({}, hass)
 
 
+def given_the_catalog_is_in_memory(hass: HomeAssistant) -> ApplianceApiCatalog:
+    """Replace a lazy catalog with an in-memory one so its contents can be overridden."""
+    data_source = hass.data[DOMAIN][DISCOVERY]._data_source
+    if isinstance(data_source._catalog, LazyApplianceApiCatalog):
+        data_source._catalog = data_source._catalog.materialize()
+    return data_source._catalog
+
+
 def given_the_appliance_api_is(appliance_api: str, hass: HomeAssistant) -> None:
     """Set the appliance API for the integration."""
-    hass.data[DOMAIN][DISCOVERY]._data_source._appliance_api = json.loads(appliance_api)
+    given_the_catalog_is_in_memory(hass)._appliance_api = json.loads(appliance_api)
 
 
 def given_the_appliance_api_erd_defs_are(erd_defs: str, hass: HomeAssistant) -> None:
     """Set the appliance API ERDs definitions for the integration."""
-    hass.data[DOMAIN][
-        DISCOVERY
-    ]._data_source._appliance_api_erd_definitions = json.loads(erd_defs)["erds"]
+    catalog = given_the_catalog_is_in_memory(hass)
+    catalog._appliance_api_erd_definitions = json.loads(erd_defs)["erds"]
+    catalog._create_erd_def_index()
 
 
 def given_the_status_pair_dict_is(status_pair_str: str, hass: HomeAssistant) -> None:
     """Set the status pair dictionary for the integration."""
-    hass.data[DOMAIN][DISCOVERY]._data_source._status_pair_dict = json.loads(
-        status_pair_str
-    )
+    given_the_catalog_is_in_memory(hass)._status_pair_dict = json.loads(status_pair_str)
 
 
 def given_the_special_erd_map_is(special_erd_map: dict, hass: HomeAssistant) -> None:
@@ -85,7 +98,7 @@ def given_the_special_erd_map_is(special_erd_map: dict, hass: HomeAssistant) ->
 async def given_the_erd_is_set_to(erd: Erd, state: str, hass: HomeAssistant) -> None:
     """Fire MQTT message."""
     async_fire_mqtt_message(hass, ERD_VALUE_TOPIC.format(f"{erd:#06x}"), state)
-    await hass.async_block_till_done()
+    await hass.async_block_till_done(wait_background_tasks=True)
 
 
 async def when_the_erd_is_set_to(erd: Erd, state: str, hass: HomeAssistant) -> None:
@@ -105,3 +118,30 @@ def the_mqtt_topic_value_should_be(
 def mqtt_client_should_not_publish(mqtt_client_mock: MqttMockHAClient) -> None:
     """Assert MQTT has not published anything."""
     mqtt_client_mock.async_publish.assert_not_called()
+
+
+async def when_the_entity_receives_erd_value(
+    name: str, state: str, hass: HomeAssistant
+) -> None:
+    """Pass an ERD value straight to the entity, even if its field is unchanged."""
+    if (registry_entry := er.async_get(hass).async_get(name)) is None:
+        pytest.fail(f"Could not find entity {name}")
+    data_source = hass.data[DOMAIN][DATA_SOURCE]
+    (await data_source.get_entity(registry_entry.unique_id)).erd_updated(
+        bytes.fromhex(state)
+    )
+    await hass.async_block_till_done()
+
+
+def given_the_state_was_last_written(name: str, hass: HomeAssistant) -> datetime:
+    """Return when the entity's state was last written."""
+    if (state := hass.states.get(name)) is None:
+        pytest.fail(f"Could not find entity {name}")
+    return state.last_reported
+
+
+def the_state_should_not_be_written_since(
+    name: str, last_written: datetime, hass: HomeAssistant
+) -> None:
+    """Assert the entity's state hasn't been written since the given time."""
+    assert given_the_state_was_last_written(name, hass) == last_written
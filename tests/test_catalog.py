@@ -0,0 +1,400 @@
+"""Tests for the GE Appliances compiled appliance API catalog."""
+
+import json
+from pathlib import Path
+
+from custom_components.geappliances.catalog import (
+    ERD,
+    STATUS_PAIRS,
+    ApplianceApiCatalog,
+    CatalogError,
+    CatalogReader,
+    LazyApplianceApiCatalog,
+    hash_sources,
+    load_catalog,
+    write_catalog,
+)
+from custom_components.geappliances.const import Erd
+from custom_components.geappliances.timing import StageTimings
+import pytest
+
+APPLIANCE_API_JSON = """
+{
+    "common": {
+        "versions": {
+            "1": {
+                "description": "",
+                "required": [
+                    { "erd": "0x0001", "name": "Test", "length": 1 }
+                ],
+                "features": [
+                    {
+                        "mask": "0x00000001",
+                        "name": "Primary",
+                        "description": "",
+                        "dependencies": [],
+                        "required": [
+                            { "erd": "0x0002", "name": "Test Request", "length": 1 }
+                        ]
+                    }
+                ]
+            }
+        }
+    },
+    "featureApis": {
+        "0": {
+            "featureType": "0",
+            "versions": {
+                "1": {
+                    "description": "",
+                    "required": [
+                        { "erd": "0x0003", "name": "Test Status", "length": 1 }
+                    ],
+                    "features": []
+                }
+            }
+        }
+    }
+}"""
+
+APPLIANCE_API_DEFINTION_JSON = """
+{
+    "erds" :[
+        {
+            "name": "Test",
+            "id": "0x0001",
+            "operations": ["read"],
+            "description": "Test x10",
+            "updateClass": { "type": "legacy" },
+            "data": [
+                {
+                    "name": "Test",
+                    "type": "u8",
+                    "offset": 0,
+                    "size": 1
+                }
+            ]
+        },
+        {
+            "name": "Test Request",
+            "id": "0x0002",
+            "operations": ["read", "write"],
+            "description": "",
+            "updateClass": { "type": "legacy" },
+            "data": [
+                {
+                    "name": "Test",
+                    "type": "bool",
+                    "offset": 0,
+                    "size": 1
+                }
+            ]
+        },
+        {
+            "name": "Test Status",
+            "id": "0x0003",
+            "operations": ["read"],
+            "description": "",
+            "updateClass": { "type": "legacy" },
+            "data": [
+                {
+                    "name": "Test",
+                    "type": "bool",
+                    "offset": 0,
+                    "size": 1
+                }
+            ]
+        }
+    ]
+}"""
+
+COMPACT_COMMON_APPLIANCE_API_V1 = {
+    "required": [{"erd": "0x0001"}],
+    "features": [{"mask": "0x00000001", "required": [{"erd": "0x0002"}]}],
+}
+
+COMPACT_FEATURE_APPLIANCE_API_0_V1 = {
+    "required": [{"erd": "0x0003"}],
+    "features": [],
+}
+
+COMPACT_ERD_1_DEFINITION = {
+    "name": "Test",
+    "id": "0x0001",
+    "operations": ["read"],
+    "description": "Test x10",
+    "data": [{"name": "Test", "type": "u8", "offset": 0, "size": 1}],
+}
+
+STATUS_PAIR = {"name": "Test", "status": 3, "request": 2}
+
+
+@pytest.fixture
+def catalog_path(tmp_path: Path) -> str:
+    """Return the path to a compiled catalog in a temporary directory."""
+    return str(tmp_path / "geappliances.catalog")
+
+
+def given_the_catalog_is_compiled(catalog_path: str) -> ApplianceApiCatalog:
+    """Compile the module's appliance API into a catalog file."""
+    return load_catalog(APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON, catalog_path)
+
+
+def given_the_catalog_is_loaded_lazily(catalog_path: str) -> LazyApplianceApiCatalog:
+    """Load the catalog for the module's appliance API in lazy mode."""
+    catalog = load_catalog(
+        APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON, catalog_path, lazy=True
+    )
+    assert isinstance(catalog, LazyApplianceApiCatalog)
+    return catalog
+
+
+def given_the_catalog_file_contains(contents: bytes, catalog_path: str) -> None:
+    """Write raw bytes to the catalog file."""
+    Path(catalog_path).write_bytes(contents)
+
+
+def given_the_catalog_entry_is_overwritten(key: tuple, catalog_path: str) -> None:
+    """Replace the bytes of a compiled catalog entry with ones that can't be decoded."""
+    with CatalogReader(catalog_path) as reader:
+        offset, size = reader._index[key]
+        start = reader._body_offset + offset
+
+    contents = bytearray(Path(catalog_path).read_bytes())
+    contents[start : start + size] = bytes(size)
+    given_the_catalog_file_contains(bytes(contents), catalog_path)
+
+
+def when_the_catalog_is_loaded(catalog_path: str) -> ApplianceApiCatalog:
+    """Load the catalog for the module's appliance API."""
+    return given_the_catalog_is_compiled(catalog_path)
+
+
+def the_catalog_should_be_compact(catalog: ApplianceApiCatalog) -> None:
+    """Assert the catalog only holds the fields used by the integration."""
+    assert (
+        catalog.get_common_appliance_api_version("1") == COMPACT_COMMON_APPLIANCE_API_V1
+    )
+    assert (
+        catalog.get_feature_api_version("0", "1") == COMPACT_FEATURE_APPLIANCE_API_0_V1
+    )
+    assert catalog.get_erd_def(0x0001) == COMPACT_ERD_1_DEFINITION
+
+
+def the_status_pair_should_be(
+    erd: Erd, status_pair: dict, catalog: ApplianceApiCatalog
+) -> None:
+    """Assert the catalog has the given status pair for the ERD."""
+    assert catalog.get_erd_status_pair(erd) == status_pair
+
+
+def the_catalog_should_be_keyed_to(source_hash: bytes, catalog_path: str) -> None:
+    """Assert the catalog file on disk was built from sources with the given hash."""
+    with CatalogReader(catalog_path) as reader:
+        assert reader.source_hash == source_hash
+
+
+def opening_the_catalog_should_raise_error(catalog_path: str) -> None:
+    """Assert that reading the catalog file raises CatalogError."""
+    with pytest.raises(CatalogError):
+        CatalogReader(catalog_path)
+
+
+class TestCatalog:
+    """Hold compiled catalog tests."""
+
+    async def test_parses_json(self) -> None:
+        """Test catalog holds the full parsed JSON when built from source."""
+        catalog = ApplianceApiCatalog.from_json(
+            APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON
+        )
+        assert (
+            catalog.get_common_appliance_api_version("1")
+            == json.loads(APPLIANCE_API_JSON)["common"]["versions"]["1"]
+        )
+        the_status_pair_should_be(0x0002, STATUS_PAIR, catalog)
+
+    async def test_compiles_catalog_when_missing(self, catalog_path) -> None:
+        """Test loading the catalog writes a compiled file keyed by the source hash."""
+        given_the_catalog_is_compiled(catalog_path)
+        the_catalog_should_be_keyed_to(
+            hash_sources(APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON),
+            catalog_path,
+        )
+
+    async def test_loads_compact_catalog_from_compiled_file(self, catalog_path) -> None:
+        """Test catalog loaded from a compiled file only holds the fields the integration uses."""
+        given_the_catalog_is_compiled(catalog_path)
+
+        catalog = when_the_catalog_is_loaded(catalog_path)
+        the_catalog_should_be_compact(catalog)
+        the_status_pair_should_be(0x0002, STATUS_PAIR, catalog)
+        the_status_pair_should_be(0x0003, STATUS_PAIR, catalog)
+
+    async def test_rebuilds_catalog_when_source_changes(self, catalog_path) -> None:
+        """Test catalog is recompiled when the source JSON no longer matches its hash."""
+        write_catalog(catalog_path, bytes(32), {})
+
+        catalog = when_the_catalog_is_loaded(catalog_path)
+        assert catalog.get_erd_def(0x0001) is not None
+        the_catalog_should_be_keyed_to(
+            hash_sources(APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON),
+            catalog_path,
+        )
+
+    async def test_rebuilds_corrupt_catalog(self, catalog_path) -> None:
+        """Test a corrupt catalog file is rejected and recompiled."""
+        given_the_catalog_file_contains(b"not a catalog", catalog_path)
+        opening_the_catalog_should_raise_error(catalog_path)
+
+        catalog = when_the_catalog_is_loaded(catalog_path)
+        assert catalog.get_erd_def(0x0001) is not None
+        the_catalog_should_be_keyed_to(
+            hash_sources(APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON),
+            catalog_path,
+        )
+
+    async def test_rebuilds_truncated_catalog(self, catalog_path) -> None:
+        """Test a catalog file cut short in its entries is rejected and recompiled."""
+        given_the_catalog_is_compiled(catalog_path)
+        contents = Path(catalog_path).read_bytes()
+        given_the_catalog_file_contains(contents[:-1], catalog_path)
+        opening_the_catalog_should_raise_error(catalog_path)
+
+        catalog = given_the_catalog_is_loaded_lazily(catalog_path)
+        the_catalog_should_be_compact(catalog)
+
+    async def test_reader_raises_error_for_corrupt_entry(self, catalog_path) -> None:
+        """Test the reader raises CatalogError for an entry that can't be decoded."""
+        given_the_catalog_is_compiled(catalog_path)
+        given_the_catalog_entry_is_overwritten((ERD, 0x0001), catalog_path)
+
+        with CatalogReader(catalog_path) as reader, pytest.raises(CatalogError):
+            reader.get((ERD, 0x0001))
+
+    async def test_rebuilds_catalog_with_corrupt_entry(self, catalog_path) -> None:
+        """Test loading a catalog that has an entry that can't be decoded recompiles it."""
+        given_the_catalog_is_compiled(catalog_path)
+        given_the_catalog_entry_is_overwritten((ERD, 0x0001), catalog_path)
+
+        catalog = when_the_catalog_is_loaded(catalog_path)
+        assert catalog.get_erd_def(0x0001) is not None
+        with CatalogReader(catalog_path) as reader:
+            assert reader.get((ERD, 0x0001)) == COMPACT_ERD_1_DEFINITION
+
+    async def test_lazy_catalog_logs_corrupt_entry(
+        self, catalog_path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test a lazy catalog returns None and logs an error for an entry that can't be decoded."""
+        given_the_catalog_is_compiled(catalog_path)
+        given_the_catalog_entry_is_overwritten((ERD, 0x0001), catalog_path)
+
+        catalog = given_the_catalog_is_loaded_lazily(catalog_path)
+        assert catalog.get_erd_def(0x0001) is None
+        assert catalog.get_erd_field_def(0x0001, "Test") is None
+        assert "Could not read appliance API catalog entry" in caplog.text
+        assert catalog.get_erd_def(0x0002) is not None
+
+    async def test_lazy_catalog_closes_reader_with_corrupt_status_pairs(
+        self, catalog_path
+    ) -> None:
+        """Test a lazy catalog that can't decode its status/request pairs closes its reader and is rebuilt."""
+        given_the_catalog_is_compiled(catalog_path)
+        given_the_catalog_entry_is_overwritten((STATUS_PAIRS,), catalog_path)
+
+        reader = CatalogReader(catalog_path)
+        with pytest.raises(CatalogError):
+            LazyApplianceApiCatalog(reader)
+        assert reader._mmap.closed
+
+        catalog = given_the_catalog_is_loaded_lazily(catalog_path)
+        the_status_pair_should_be(0x0002, STATUS_PAIR, catalog)
+
+    async def test_closes_lazy_catalog(self, catalog_path) -> None:
+        """Test closing a lazy catalog unmaps the compiled file."""
+        catalog = given_the_catalog_is_loaded_lazily(catalog_path)
+        catalog.close()
+        assert catalog._reader._mmap.closed
+
+    async def test_reader_decodes_single_entries(self, catalog_path) -> None:
+        """Test the reader decodes individual entries and returns None for unknown ones."""
+        given_the_catalog_is_compiled(catalog_path)
+
+        with CatalogReader(catalog_path) as reader:
+            assert (ERD, 0x0001) in reader
+            assert reader.get((ERD, 0x0001)) == COMPACT_ERD_1_DEFINITION
+            assert reader.get((ERD, 0x1234)) is None
+
+    async def test_records_build_stages(self, catalog_path) -> None:
+        """Test building the catalog records how long each stage took."""
+        timings = StageTimings()
+        load_catalog(
+            APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON, catalog_path, timings
+        )
+
+        assert list(timings.as_dict()) == [
+            "hash appliance API sources",
+            "read compiled catalog",
+            "parse appliance API JSON",
+            "find status/request pairs",
+            "index ERD definitions",
+            "write compiled catalog",
+        ]
+
+    async def test_records_only_read_stages_when_compiled(self, catalog_path) -> None:
+        """Test loading an up-to-date compiled catalog skips the parsing stages."""
+        given_the_catalog_is_compiled(catalog_path)
+
+        timings = StageTimings()
+        load_catalog(
+            APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON, catalog_path, timings
+        )
+
+        assert list(timings.as_dict()) == [
+            "hash appliance API sources",
+            "read compiled catalog",
+        ]
+
+    async def test_lazy_catalog_matches_compiled_catalog(self, catalog_path) -> None:
+        """Test a lazy catalog returns the same entries as one loaded into memory."""
+        given_the_catalog_is_compiled(catalog_path)
+
+        catalog = given_the_catalog_is_loaded_lazily(catalog_path)
+        the_catalog_should_be_compact(catalog)
+        the_status_pair_should_be(0x0002, STATUS_PAIR, catalog)
+        assert catalog.get_erd_field_def(0x0002, "Test") == {
+            "name": "Test",
+            "type": "bool",
+            "offset": 0,
+            "size": 1,
+        }
+        assert catalog.get_erd_def(0x1234) is None
+        assert catalog.get_feature_api_version("1", "1") is None
+
+    async def test_lazy_catalog_compiles_catalog_when_missing(
+        self, catalog_path
+    ) -> None:
+        """Test lazy mode compiles the catalog first and then reads from it."""
+        catalog = given_the_catalog_is_loaded_lazily(catalog_path)
+        the_catalog_should_be_compact(catalog)
+
+    async def test_lazy_catalog_only_decodes_entries_on_first_use(
+        self, catalog_path
+    ) -> None:
+        """Test lazy mode decodes each entry once and bounds how many it keeps."""
+        given_the_catalog_is_compiled(catalog_path)
+
+        with CatalogReader(catalog_path) as reader:
+            catalog = LazyApplianceApiCatalog(reader, cache_size=1)
+            catalog.get_erd_def(0x0001)
+            catalog.get_erd_def(0x0001)
+            assert catalog._get_erd_entry.cache_info().misses == 1
+
+            catalog.get_erd_def(0x0002)
+            assert catalog._get_erd_entry.cache_info().currsize == 1
+
+    async def test_materializes_lazy_catalog(self, catalog_path) -> None:
+        """Test a lazy catalog can be turned into an in-memory catalog."""
+        catalog = given_the_catalog_is_loaded_lazily(catalog_path).materialize()
+        assert not isinstance(catalog, LazyApplianceApiCatalog)
+        the_catalog_should_be_compact(catalog)
@@ -1,9 +1,20 @@
 """Test GE Appliances configuration flow."""
 
+from custom_components.geappliances.const import (
+    CONF_COALESCE_WINDOW,
+    CONF_SUPPRESS_UNCHANGED_ERDS,
+    CONF_UNSUPPRESSED_DEVICES,
+    DOMAIN,
+)
+import pytest
+
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigFlowResult
 from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.data_entry_flow import FlowResultType, InvalidData
+from homeassistant.helpers import device_registry as dr
+
+from .common import config_entry_stub
 
 
 async def when_the_user_starts_config_flow(
@@ -43,6 +54,22 @@ def the_entry_should_be_created(result: ConfigFlowResult) -> None:
         assert data["type"] == "user"
 
 
+async def when_the_user_opens_the_options(
+    hass: HomeAssistant, entry_id: str
+) -> ConfigFlowResult:
+    """Start the options flow for the config entry and return result."""
+    return await hass.config_entries.options.async_init(entry_id)
+
+
+async def when_the_user_submits_the_options(
+    hass: HomeAssistant, result: ConfigFlowResult, options: dict
+) -> ConfigFlowResult:
+    """Submit the options form and return result."""
+    return await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input=options
+    )
+
+
 class TestConfigFlow:
     """Hold config flow tests."""
 
@@ -53,3 +80,78 @@ class TestConfigFlow:
 
         result = await when_the_user_confirms(hass, result)
         the_entry_should_be_created(result)
+
+    async def test_options_set_coalescing_window(self, hass: HomeAssistant) -> None:
+        """Test the options flow stores the state write coalescing window, keeping change suppression on by default."""
+        entry = config_entry_stub()
+        entry.add_to_hass(hass)
+
+        result = await when_the_user_opens_the_options(hass, entry.entry_id)
+        assert result.get("type") is FlowResultType.FORM
+        assert result.get("step_id") == "init"
+
+        result = await when_the_user_submits_the_options(
+            hass, result, {CONF_COALESCE_WINDOW: 50}
+        )
+        assert result.get("type") is FlowResultType.CREATE_ENTRY
+        assert entry.options == {
+            CONF_COALESCE_WINDOW: 50,
+            CONF_SUPPRESS_UNCHANGED_ERDS: True,
+            CONF_UNSUPPRESSED_DEVICES: [],
+        }
+
+    async def test_options_disable_change_suppression(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test the options flow stores whether unchanged ERD values are skipped."""
+        entry = config_entry_stub()
+        entry.add_to_hass(hass)
+
+        result = await when_the_user_opens_the_options(hass, entry.entry_id)
+        result = await when_the_user_submits_the_options(
+            hass,
+            result,
+            {CONF_COALESCE_WINDOW: 0, CONF_SUPPRESS_UNCHANGED_ERDS: False},
+        )
+        assert result.get("type") is FlowResultType.CREATE_ENTRY
+        assert entry.options == {
+            CONF_COALESCE_WINDOW: 0,
+            CONF_SUPPRESS_UNCHANGED_ERDS: False,
+            CONF_UNSUPPRESSED_DEVICES: [],
+        }
+
+    async def test_options_disable_change_suppression_per_device(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test the options flow offers the discovered devices and stores those that keep unchanged ERD values."""
+        entry = config_entry_stub()
+        entry.add_to_hass(hass)
+        dr.async_get(hass).async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, "loud")},
+            name="Loud Fridge",
+        )
+
+        result = await when_the_user_opens_the_options(hass, entry.entry_id)
+        result = await when_the_user_submits_the_options(
+            hass,
+            result,
+            {
+                CONF_COALESCE_WINDOW: 0,
+                CONF_SUPPRESS_UNCHANGED_ERDS: True,
+                CONF_UNSUPPRESSED_DEVICES: ["loud"],
+            },
+        )
+        assert result.get("type") is FlowResultType.CREATE_ENTRY
+        assert entry.options[CONF_UNSUPPRESSED_DEVICES] == ["loud"]
+
+    async def test_options_reject_unknown_device(self, hass: HomeAssistant) -> None:
+        """Test the options flow only accepts discovered devices."""
+        entry = config_entry_stub()
+        entry.add_to_hass(hass)
+
+        result = await when_the_user_opens_the_options(hass, entry.entry_id)
+        with pytest.raises(InvalidData):
+            await when_the_user_submits_the_options(
+                hass, result, {CONF_UNSUPPRESSED_DEVICES: ["missing"]}
+            )
@@ -1,15 +1,16 @@
 """Tests for GE Appliances data source."""
 
+import asyncio
 from collections.abc import Callable, Generator
 import json
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from custom_components.geappliances.catalog import ApplianceApiCatalog
 from custom_components.geappliances.const import Erd
-from custom_components.geappliances.ha_compatibility.data_source import (
-    UNSUPPORTED_ERDS,
-    DataSource,
-)
+from custom_components.geappliances.decoder import ErdDecoder, FieldDecoder
+from custom_components.geappliances.ha_compatibility.data_source import DataSource
+from custom_components.geappliances.ha_compatibility.event import FieldInterest
 from custom_components.geappliances.ha_compatibility.mqtt_client import GeaMQTTClient
 import pytest
 
@@ -333,7 +334,8 @@ def mqtt_client_mock() -> MqttClientMock:
 def data_source(mqtt_client_mock) -> DataSource:
     """Return an initialized DataSource instance."""
     return DataSource(
-        APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON, mqtt_client_mock
+        ApplianceApiCatalog.from_json(APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON),
+        mqtt_client_mock,
     )
 
 
@@ -375,6 +377,35 @@ async def given_erd_is_set_to(
     await data_source.erd_write(device_name, erd, value)
 
 
+async def given_change_suppression_is_set_to(
+    enabled: bool, device_name: str, data_source: DataSource
+) -> None:
+    """Enable or disable change suppression for the given device."""
+    data_source._data[device_name].suppress_unchanged = enabled
+
+
+async def given_the_coalescing_window_is(
+    window: float, device_name: str, data_source: DataSource
+) -> None:
+    """Set the state write coalescing window for the given device."""
+    data_source._data[device_name].coalesce_window = window
+
+
+async def when_state_writes_are_scheduled_for(
+    entities: list[MagicMock], device_name: str, data_source: DataSource
+) -> None:
+    """Schedule a state write for each of the entities in order."""
+    for entity in entities:
+        data_source.async_schedule_state_write(device_name, entity)
+
+
+async def when_erd_is_updated_to(
+    erd: Erd, value: bytes, device_name: str, data_source: DataSource
+) -> bool:
+    """Update the given ERD with a value reported by the device."""
+    return await data_source.erd_update(device_name, erd, value)
+
+
 async def given_function_is_subscribed_to_erd(
     fn: Callable, erd: Erd, device_name: str, data_source: DataSource
 ) -> None:
@@ -382,6 +413,17 @@ async def given_function_is_subscribed_to_erd(
     await data_source.erd_subscribe(device_name, erd, fn)
 
 
+async def given_function_is_subscribed_to_field(
+    fn: Callable,
+    interest: FieldInterest,
+    erd: Erd,
+    device_name: str,
+    data_source: DataSource,
+) -> None:
+    """Subscribe the function to changes in one field of the ERD."""
+    await data_source.erd_subscribe(device_name, erd, fn, interest)
+
+
 async def given_function_is_unsubscribed_from_erd(
     fn: Callable, erd: Erd, device_name: str, data_source: DataSource
 ) -> None:
@@ -422,22 +464,6 @@ async def when_erd_is_set_to(
     await given_erd_is_set_to(erd, value, device_name, data_source)
 
 
-async def when_the_erds_are_moved_to_unsupported_for_common_api(
-    device_name: str, data_source: DataSource
-) -> None:
-    """Move all ERDs for the common appliance API to the unsupported list."""
-    await data_source.move_all_erds_to_unsupported_for_api_erd(device_name, None, "1")
-
-
-async def when_the_erds_are_moved_to_unsupported_for_feature_api(
-    device_name: str, feature_type: str, data_source: DataSource
-) -> None:
-    """Move all ERDs for the given feature API to the unsupported list."""
-    await data_source.move_all_erds_to_unsupported_for_api_erd(
-        device_name, feature_type, "1"
-    )
-
-
 def the_device_dict_should_be_empty(data_source: DataSource) -> None:
     """Assert the device dictionary is empty."""
     assert data_source._data == {}
@@ -445,7 +471,7 @@ def the_device_dict_should_be_empty(data_source: DataSource) -> None:
 
 def the_appliance_api_should_be(appliance_api: str, data_source: DataSource) -> None:
     """Assert the appliance API is correct."""
-    assert data_source._appliance_api == json.loads(appliance_api)
+    assert data_source._catalog._appliance_api == json.loads(appliance_api)
 
 
 def the_appliance_api_erd_defs_should_be(
@@ -453,7 +479,7 @@ def the_appliance_api_erd_defs_should_be(
 ) -> None:
     """Assert the appliance API is correct."""
     assert (
-        data_source._appliance_api_erd_definitions
+        data_source._catalog._appliance_api_erd_definitions
         == json.loads(appliance_api_erd_defs)["erds"]
     )
 
@@ -462,7 +488,7 @@ def the_status_pair_dict_should_be(
     data_source: DataSource, status_pair_str: str
 ) -> None:
     """Assert the status pair dictionary contains the given ERD and status pair."""
-    assert data_source._status_pair_dict == json.loads(status_pair_str)
+    assert data_source._catalog._status_pair_dict == json.loads(status_pair_str)
 
 
 def the_device_should_exist(device_name: str, data_source: DataSource) -> None:
@@ -482,7 +508,7 @@ async def the_device_should_not_support_erd(
 ) -> None:
     """Assert that the device does not support the given ERD but has it listed."""
     assert not await data_source.erd_is_supported_by_device(device_name, erd)
-    assert data_source._data[device_name][UNSUPPORTED_ERDS].get(erd) is not None
+    assert erd in data_source._data[device_name].erds
 
 
 async def adding_erd_should_raise_error(
@@ -541,6 +567,34 @@ def mqtt_should_publish(
     mqtt_client_mock.publish_erd.assert_called_with(device_name, erd, value)
 
 
+async def when_fields_are_published_at_once(
+    fields: dict[int, bytes], erd: Erd, device_name: str, data_source: DataSource
+) -> None:
+    """Set several fields of the ERD from concurrent tasks, each reading the ERD and publishing it with its field changed."""
+
+    async def publish_field(offset: int, field: bytes) -> None:
+        value = await data_source.erd_read(device_name, erd)
+        await data_source.erd_publish(
+            device_name, erd, value[:offset] + field + value[offset + len(field) :]
+        )
+
+    await asyncio.gather(
+        *(publish_field(offset, field) for offset, field in fields.items())
+    )
+
+
+async def when_fields_are_spliced_at_once(
+    fields: dict[int, bytes], erd: Erd, device_name: str, data_source: DataSource
+) -> None:
+    """Set several fields of the ERD from concurrent tasks, each splicing its field into the pending value."""
+    await asyncio.gather(
+        *(
+            data_source.erd_publish_field(device_name, erd, offset, field)
+            for offset, field in fields.items()
+        )
+    )
+
+
 def mqtt_should_not_publish(mqtt_client_mock: MqttClientMock) -> None:
     """Assert MQTT has not published anything."""
     mqtt_client_mock.publish_erd.assert_not_called()
@@ -599,20 +653,47 @@ async def the_erd_def_should_be(
     assert await data_source.get_erd_def(erd) == json.loads(definition_json)
 
 
+async def the_erd_def_should_not_exist(erd: Erd, data_source: DataSource) -> None:
+    """Assert that there is no ERD definition for the given ERD."""
+    assert await data_source.get_erd_def(erd) is None
+
+
+async def the_erd_field_def_should_be(
+    erd: Erd, field_name: str, definition_json: str, data_source: DataSource
+) -> None:
+    """Assert that the field definition JSON for the given ERD field is correct."""
+    assert await data_source.get_erd_field_def(erd, field_name) == json.loads(
+        definition_json
+    )
+
+
+async def the_erd_field_def_should_not_exist(
+    erd: Erd, field_name: str, data_source: DataSource
+) -> None:
+    """Assert that there is no field definition for the given ERD field."""
+    assert await data_source.get_erd_field_def(erd, field_name) is None
+
+
 class TestDataSource:
     """Hold data source tests."""
 
     async def test_empty_when_initialized(self, mqtt_client_mock) -> None:
         """Test data source creates empty dictionary on init."""
         data_source = DataSource(
-            APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON, mqtt_client_mock
+            ApplianceApiCatalog.from_json(
+                APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON
+            ),
+            mqtt_client_mock,
         )
         the_device_dict_should_be_empty(data_source)
 
     async def test_parses_appliance_api_on_init(self, mqtt_client_mock) -> None:
         """Test data source parses the appliance API JSON on init."""
         data_source = DataSource(
-            APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON, mqtt_client_mock
+            ApplianceApiCatalog.from_json(
+                APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON
+            ),
+            mqtt_client_mock,
         )
         the_appliance_api_should_be(APPLIANCE_API_JSON, data_source)
         the_appliance_api_erd_defs_should_be(APPLIANCE_API_DEFINTION_JSON, data_source)
@@ -620,14 +701,20 @@ class TestDataSource:
     async def test_parses_status_pair_dict_on_init(self, mqtt_client_mock) -> None:
         """Test data source parses the status pair dictionary on init."""
         data_source = DataSource(
-            APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON, mqtt_client_mock
+            ApplianceApiCatalog.from_json(
+                APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON
+            ),
+            mqtt_client_mock,
         )
         the_status_pair_dict_should_be(data_source, STATUS_PAIR_DICT)
 
     async def test_retrieves_status_pair_for_erd(self, mqtt_client_mock) -> None:
         """Test data source retrieves the status pair for a given ERD."""
         data_source = DataSource(
-            APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON, mqtt_client_mock
+            ApplianceApiCatalog.from_json(
+                APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON
+            ),
+            mqtt_client_mock,
         )
         status_pair = await data_source.get_erd_status_pair(0x0006)
         assert status_pair == {
@@ -717,60 +804,13 @@ class TestDataSource:
         await the_device_should_not_support_erd("test", 0x0001, data_source)
         await the_erd_should_be(0x0001, bytes.fromhex("01"), "test", data_source)
 
-    async def test_transitions_common_api_erds_from_supported_to_unsupported(
-        self, data_source
-    ) -> None:
-        """Test data source retains ERD states when moving all ERDs for the common appliance API from supported to unsupported."""
-        await given_a_device_is_added("test", data_source)
-        await given_a_supported_erd_is_added(0x0001, "test", data_source)
-        await given_erd_is_set_to(0x0001, bytes.fromhex("01"), "test", data_source)
-        await given_a_supported_erd_is_added(0x0002, "test", data_source)
-        await given_erd_is_set_to(0x0002, bytes.fromhex("01"), "test", data_source)
-
-        await when_the_erds_are_moved_to_unsupported_for_common_api("test", data_source)
-        await the_device_should_not_support_erd("test", 0x0001, data_source)
-        await the_erd_should_be(0x0001, bytes.fromhex("01"), "test", data_source)
-        await the_device_should_not_support_erd("test", 0x0002, data_source)
-        await the_erd_should_be(0x0002, bytes.fromhex("01"), "test", data_source)
-
-    async def test_transitions_feature_api_erds_from_supported_to_unsupported(
-        self, data_source
-    ) -> None:
-        """Test data source retains ERD states when moving all ERDs for a feature appliance API from supported to unsupported."""
-        await given_a_device_is_added("test", data_source)
-        await given_a_supported_erd_is_added(0x0003, "test", data_source)
-        await given_erd_is_set_to(0x0003, bytes.fromhex("01"), "test", data_source)
-        await given_a_supported_erd_is_added(0x0004, "test", data_source)
-        await given_erd_is_set_to(0x0004, bytes.fromhex("01"), "test", data_source)
-
-        await when_the_erds_are_moved_to_unsupported_for_feature_api(
-            "test", "0", data_source
-        )
-        await the_device_should_not_support_erd("test", 0x0003, data_source)
-        await the_erd_should_be(0x0003, bytes.fromhex("01"), "test", data_source)
-        await the_device_should_not_support_erd("test", 0x0004, data_source)
-        await the_erd_should_be(0x0004, bytes.fromhex("01"), "test", data_source)
-
-    async def test_does_not_move_erds_for_bad_appliance_api(self, data_source) -> None:
-        """Test data source does not move any ERDs when a bad appliance API number is given."""
-        await given_a_device_is_added("test", data_source)
-        await given_a_supported_erd_is_added(0x0003, "test", data_source)
-        await given_erd_is_set_to(0x0003, bytes.fromhex("01"), "test", data_source)
-        await given_a_supported_erd_is_added(0x0004, "test", data_source)
-        await given_erd_is_set_to(0x0004, bytes.fromhex("01"), "test", data_source)
-
-        await when_the_erds_are_moved_to_unsupported_for_feature_api(
-            "test", "2", data_source
-        )
-        nothing_should_happen()
-
-        await the_device_should_support_erd("test", 0x0003, data_source)
-        await the_device_should_support_erd("test", 0x0004, data_source)
-
     async def test_publishes_erd(self, mqtt_client_mock) -> None:
         """Test data source successfully publishes an ERD to MQTT."""
         data_source = DataSource(
-            APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON, mqtt_client_mock
+            ApplianceApiCatalog.from_json(
+                APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON
+            ),
+            mqtt_client_mock,
         )
         await given_a_device_is_added("test", data_source)
         await when_a_supported_erd_is_added(0x0001, "test", data_source)
@@ -784,7 +824,10 @@ class TestDataSource:
     async def test_only_publishes_supported_erd(self, mqtt_client_mock) -> None:
         """Test data source only publishes a supported ERD to MQTT."""
         data_source = DataSource(
-            APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON, mqtt_client_mock
+            ApplianceApiCatalog.from_json(
+                APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON
+            ),
+            mqtt_client_mock,
         )
         await given_a_device_is_added("test", data_source)
         await given_an_unsupported_erd_is_added(0x0001, "test", data_source)
@@ -795,6 +838,91 @@ class TestDataSource:
         mqtt_should_not_publish(mqtt_client_mock)
         await the_erd_should_be(0x0001, bytes.fromhex("01"), "test", data_source)
 
+    async def test_merges_field_edits_into_one_publish(
+        self, data_source, mqtt_client_mock
+    ) -> None:
+        """Test fields of one ERD set within the write window are published together once."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0005, "test", data_source)
+        await given_erd_is_set_to(0x0005, bytes.fromhex("0000"), "test", data_source)
+
+        await when_fields_are_published_at_once(
+            {0: bytes.fromhex("01"), 1: bytes.fromhex("02")},
+            0x0005,
+            "test",
+            data_source,
+        )
+        mqtt_client_mock.publish_erd.assert_called_once_with(
+            "test", 0x0005, bytes.fromhex("0102")
+        )
+        await the_erd_should_be(0x0005, bytes.fromhex("0102"), "test", data_source)
+
+    async def test_splices_field_edits_into_one_publish(
+        self, data_source, mqtt_client_mock
+    ) -> None:
+        """Test fields spliced into one ERD within the write window share its pending buffer and are published once."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0005, "test", data_source)
+        await given_erd_is_set_to(0x0005, bytes.fromhex("000000"), "test", data_source)
+
+        await when_fields_are_spliced_at_once(
+            {0: bytes.fromhex("01"), 2: bytes.fromhex("03")},
+            0x0005,
+            "test",
+            data_source,
+        )
+        mqtt_client_mock.publish_erd.assert_called_once_with(
+            "test", 0x0005, bytes.fromhex("010003")
+        )
+        await the_erd_should_be(0x0005, bytes.fromhex("010003"), "test", data_source)
+        assert data_source._data["test"].pending_erd_writes == {}
+
+    async def test_splices_field_into_unsupported_erd_without_publishing(
+        self, data_source, mqtt_client_mock
+    ) -> None:
+        """Test setting a field of an unsupported ERD only writes it locally."""
+        await given_a_device_is_added("test", data_source)
+        await given_an_unsupported_erd_is_added(0x0001, "test", data_source)
+        await given_erd_is_set_to(0x0001, bytes.fromhex("0000"), "test", data_source)
+
+        await data_source.erd_publish_field("test", 0x0001, 1, bytes.fromhex("02"))
+        mqtt_should_not_publish(mqtt_client_mock)
+        await the_erd_should_be(0x0001, bytes.fromhex("0002"), "test", data_source)
+
+    async def test_cancels_pending_erd_writes(
+        self, data_source, mqtt_client_mock
+    ) -> None:
+        """Test cancelling pending writes drops ERD values still waiting for the write window."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0005, "test", data_source)
+        publish = asyncio.create_task(
+            data_source.erd_publish("test", 0x0005, bytes.fromhex("0102"))
+        )
+        await asyncio.sleep(0)
+
+        data_source.async_cancel_pending_writes()
+        with pytest.raises(asyncio.CancelledError):
+            await publish
+
+        mqtt_client_mock.publish_erd.assert_not_called()
+        assert data_source._data["test"].erd_write_flushes == {}
+
+    async def test_updates_subscriptions_when_erd_support_changes(
+        self, data_source, mqtt_client_mock
+    ) -> None:
+        """Test moving an ERD between the supported and unsupported lists subscribes to exactly the supported ERDs."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        await given_a_supported_erd_is_added(0x0002, "test", data_source)
+
+        await data_source.move_erd_to_unsupported("test", 0x0002)
+        mqtt_client_mock.subscribe_to_device_erds.assert_awaited_with("test", [0x0001])
+
+        await data_source.move_erd_to_supported("test", 0x0002)
+        mqtt_client_mock.subscribe_to_device_erds.assert_awaited_with(
+            "test", [0x0001, 0x0002]
+        )
+
     async def test_raises_when_publishing_nonexistent_erd(self, data_source) -> None:
         """Test data source raises error when trying to publish a nonexistent ERD."""
         await given_a_device_is_added("test", data_source)
@@ -821,6 +949,149 @@ class TestDataSource:
         await when_erd_is_set_to(0x0001, bytes.fromhex("01"), "test", data_source)
         nothing_should_happen()
 
+    async def test_keeps_subscribers_when_erd_becomes_supported(
+        self, data_source, must_be_called_mock
+    ) -> None:
+        """Test data source keeps subscribers of an unsupported ERD once it becomes supported."""
+        await given_a_device_is_added("test", data_source)
+        await given_an_unsupported_erd_is_added(0x0001, "test", data_source)
+        await given_function_is_subscribed_to_erd(
+            must_be_called_mock, 0x0001, "test", data_source
+        )
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+
+        await when_erd_is_set_to(0x0001, bytes.fromhex("01"), "test", data_source)
+
+    async def test_suppresses_unchanged_erd_updates(self, data_source) -> None:
+        """Test data source does not call subscribers when a device reports the value they already have."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        await given_erd_is_set_to(0x0001, bytes.fromhex("01"), "test", data_source)
+        await given_function_is_subscribed_to_erd(
+            fail_when_called, 0x0001, "test", data_source
+        )
+
+        assert not await when_erd_is_updated_to(
+            0x0001, bytes.fromhex("01"), "test", data_source
+        )
+
+    async def test_publishes_changed_erd_updates(
+        self, data_source, must_be_called_mock
+    ) -> None:
+        """Test data source calls subscribers when a device reports a new value."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        await given_erd_is_set_to(0x0001, bytes.fromhex("01"), "test", data_source)
+        await given_function_is_subscribed_to_erd(
+            must_be_called_mock, 0x0001, "test", data_source
+        )
+
+        assert await when_erd_is_updated_to(
+            0x0001, bytes.fromhex("02"), "test", data_source
+        )
+        await the_erd_should_be(0x0001, bytes.fromhex("02"), "test", data_source)
+
+    async def test_publishes_unchanged_erd_updates_when_suppression_disabled(
+        self, data_source, must_be_called_mock
+    ) -> None:
+        """Test data source calls subscribers for repeated values when the device has change suppression disabled."""
+        await given_a_device_is_added("test", data_source)
+        await given_change_suppression_is_set_to(False, "test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        await given_erd_is_set_to(0x0001, bytes.fromhex("01"), "test", data_source)
+        await given_function_is_subscribed_to_erd(
+            must_be_called_mock, 0x0001, "test", data_source
+        )
+
+        assert await when_erd_is_updated_to(
+            0x0001, bytes.fromhex("01"), "test", data_source
+        )
+
+    async def test_disables_change_suppression_for_unsuppressed_devices(
+        self, mqtt_client_mock
+    ) -> None:
+        """Test devices named as unsuppressed get change suppression turned off while other devices keep it."""
+        data_source = DataSource(
+            ApplianceApiCatalog.from_json(
+                APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON
+            ),
+            mqtt_client_mock,
+            unsuppressed_devices=["loud"],
+        )
+        await given_a_device_is_added("loud", data_source)
+        await given_a_device_is_added("test", data_source)
+
+        assert not (await data_source.get_device("loud")).suppress_unchanged
+        assert (await data_source.get_device("test")).suppress_unchanged
+
+    async def test_publishes_unchanged_erd_update_after_erd_is_resupported(
+        self, data_source
+    ) -> None:
+        """Test data source republishes a repeated value once subscribers were cleared by the ERD becoming unsupported."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        await given_erd_is_set_to(0x0001, bytes.fromhex("01"), "test", data_source)
+        await given_an_unsupported_erd_is_added(0x0001, "test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+
+        assert await when_erd_is_updated_to(
+            0x0001, bytes.fromhex("01"), "test", data_source
+        )
+
+    async def test_calls_field_subscribers_when_field_changes(
+        self, data_source, must_be_called_mock
+    ) -> None:
+        """Test data source calls a field subscriber when its bytes change."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        await given_erd_is_set_to(0x0001, bytes.fromhex("0102"), "test", data_source)
+        await given_function_is_subscribed_to_field(
+            must_be_called_mock, FieldInterest(1, 1), 0x0001, "test", data_source
+        )
+
+        await when_erd_is_set_to(0x0001, bytes.fromhex("0103"), "test", data_source)
+
+    async def test_skips_field_subscribers_when_field_is_unchanged(
+        self, data_source
+    ) -> None:
+        """Test data source does not call a field subscriber when only other fields change."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        await given_erd_is_set_to(0x0001, bytes.fromhex("0102"), "test", data_source)
+        await given_function_is_subscribed_to_field(
+            fail_when_called, FieldInterest(1, 1), 0x0001, "test", data_source
+        )
+
+        await when_erd_is_set_to(0x0001, bytes.fromhex("0202"), "test", data_source)
+        nothing_should_happen()
+
+    async def test_skips_field_subscribers_when_masked_bits_are_unchanged(
+        self, data_source
+    ) -> None:
+        """Test data source does not call a bitfield subscriber when only bits outside its mask change."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        await given_erd_is_set_to(0x0001, bytes.fromhex("F0"), "test", data_source)
+        await given_function_is_subscribed_to_field(
+            fail_when_called, FieldInterest(0, 1, 0x0F), 0x0001, "test", data_source
+        )
+
+        await when_erd_is_set_to(0x0001, bytes.fromhex("00"), "test", data_source)
+        nothing_should_happen()
+
+    async def test_calls_field_subscribers_when_erd_becomes_unsupported(
+        self, data_source, must_be_called_mock
+    ) -> None:
+        """Test data source tells field subscribers when the ERD stops being supported."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        await given_erd_is_set_to(0x0001, bytes.fromhex("01"), "test", data_source)
+        await given_function_is_subscribed_to_field(
+            must_be_called_mock, FieldInterest(0, 1), 0x0001, "test", data_source
+        )
+
+        await when_an_unsupported_erd_is_added(0x0001, "test", data_source)
+
     async def test_unsubscribes(self, data_source) -> None:
         """Test data source does not call a subscriber that's been removed."""
         await given_a_device_is_added("test", data_source)
@@ -835,6 +1106,193 @@ class TestDataSource:
         await when_erd_is_set_to(0x0001, bytes.fromhex("01"), "test", data_source)
         nothing_should_happen()
 
+    async def test_isolates_failing_subscriber(self, data_source) -> None:
+        """Test a subscriber that raises doesn't stop the others from getting the value."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        failing = AsyncMock(side_effect=RuntimeError)
+        working = AsyncMock()
+        await given_function_is_subscribed_to_erd(failing, 0x0001, "test", data_source)
+        await given_function_is_subscribed_to_erd(working, 0x0001, "test", data_source)
+
+        await when_erd_is_set_to(0x0001, bytes.fromhex("01"), "test", data_source)
+        working.assert_awaited_once_with(bytes.fromhex("01"))
+
+        stats = list(
+            (await data_source.get_subscriber_stats())["test"]["0x0001"].values()
+        )
+        assert [stat["calls"] for stat in stats] == [1, 1]
+        assert [stat["failures"] for stat in stats] == [1, 0]
+
+    async def test_calls_plain_function_subscribers(self, data_source) -> None:
+        """Test subscribers that aren't coroutine functions are called with the value."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        subscriber = MagicMock(return_value=None)
+        await given_function_is_subscribed_to_erd(
+            subscriber, 0x0001, "test", data_source
+        )
+
+        await when_erd_is_set_to(0x0001, bytes.fromhex("01"), "test", data_source)
+        subscriber.assert_called_once_with(bytes.fromhex("01"))
+
+    async def test_updates_erd_without_awaiting_when_subscribers_are_synchronous(
+        self, data_source
+    ) -> None:
+        """Test values for supported ERDs with only plain function subscribers are published in place."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        await given_an_unsupported_erd_is_added(0x0002, "test", data_source)
+        subscriber = MagicMock(return_value=None)
+        await given_function_is_subscribed_to_erd(
+            subscriber, 0x0001, "test", data_source
+        )
+
+        assert data_source.async_erd_update("test", 0x0001, bytes.fromhex("01"))
+        subscriber.assert_called_once_with(bytes.fromhex("01"))
+        assert data_source.async_erd_update("test", 0x0001, bytes.fromhex("01"))
+        subscriber.assert_called_once()
+
+        assert not data_source.async_erd_update("test", 0x0002, bytes.fromhex("01"))
+        assert not data_source.async_erd_update("unknown", 0x0001, bytes.fromhex("01"))
+
+    async def test_leaves_erd_with_coroutine_subscribers_to_async_path(
+        self, data_source
+    ) -> None:
+        """Test values for ERDs with coroutine subscribers are not handled in place."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        subscriber = AsyncMock()
+        await given_function_is_subscribed_to_erd(
+            subscriber, 0x0001, "test", data_source
+        )
+
+        assert not data_source.async_erd_update("test", 0x0001, bytes.fromhex("01"))
+        subscriber.assert_not_called()
+
+        await given_function_is_unsubscribed_from_erd(
+            subscriber, 0x0001, "test", data_source
+        )
+        assert data_source.async_erd_update("test", 0x0001, bytes.fromhex("01"))
+
+    async def test_writes_state_immediately_without_coalescing_window(
+        self, data_source
+    ) -> None:
+        """Test every scheduled state write is written right away when the device has no window."""
+        await given_a_device_is_added("test", data_source)
+        entity = MagicMock()
+
+        await when_state_writes_are_scheduled_for([entity, entity], "test", data_source)
+        assert entity.async_schedule_update_ha_state.call_count == 2
+
+    async def test_coalesces_state_writes_within_window(self, data_source) -> None:
+        """Test state writes scheduled within the window are written once per entity."""
+        await given_a_device_is_added("test", data_source)
+        await given_the_coalescing_window_is(60, "test", data_source)
+        first = MagicMock()
+        second = MagicMock()
+
+        await when_state_writes_are_scheduled_for(
+            [first, second, first, first], "test", data_source
+        )
+        first.async_schedule_update_ha_state.assert_not_called()
+
+        await data_source.flush_state_writes("test")
+        first.async_schedule_update_ha_state.assert_called_once_with(True)
+        second.async_schedule_update_ha_state.assert_called_once_with(True)
+        assert (await data_source.get_coalescing_stats())["test"] == {
+            "coalesce_window": 60,
+            "state_write_requests": 4,
+            "state_writes": 2,
+            "coalescing_ratio": 2,
+        }
+
+    async def test_cancels_pending_state_writes(self, data_source) -> None:
+        """Test cancelling pending writes stops the window's timer and drops the states held for it."""
+        await given_a_device_is_added("test", data_source)
+        await given_the_coalescing_window_is(60, "test", data_source)
+        entity = MagicMock()
+
+        await when_state_writes_are_scheduled_for([entity], "test", data_source)
+        data_source.async_cancel_pending_writes()
+        await data_source.flush_state_writes("test")
+
+        assert data_source._data["test"].flush_handle is None
+        entity.async_schedule_update_ha_state.assert_not_called()
+
+    async def test_drops_pending_state_write_for_unregistered_entity(
+        self, data_source
+    ) -> None:
+        """Test an entity removed during the window is not written when the window ends."""
+        await given_a_device_is_added("test", data_source)
+        await given_the_coalescing_window_is(60, "test", data_source)
+        entity = MagicMock()
+        await data_source.register_entity("test_0001_Test", entity)
+
+        await when_state_writes_are_scheduled_for([entity], "test", data_source)
+        await data_source.unregister_entity("test_0001_Test")
+        await data_source.flush_state_writes("test")
+        entity.async_schedule_update_ha_state.assert_not_called()
+
+    async def test_snapshots_manifests_and_supported_erd_values(
+        self, data_source
+    ) -> None:
+        """Test the snapshot holds each device's manifests and supported ERD values and every stored value is reported to the change listener."""
+        listener = MagicMock()
+        data_source.async_set_change_listener(listener)
+        await given_a_device_is_added("test", data_source)
+        await given_an_unsupported_erd_is_added(0x0003, "test", data_source)
+        await data_source.add_unsupported_erd_to_device(
+            "test", 0x0092, bytes.fromhex("0000000100000001")
+        )
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        await given_erd_is_set_to(0x0001, bytes.fromhex("01"), "test", data_source)
+
+        assert listener.call_count == 2
+        assert data_source.async_snapshot() == {
+            "test": {
+                "manifests": {"0x0092": "0000000100000001"},
+                "erds": {"0x0001": "01"},
+            }
+        }
+
+    async def test_reports_only_changed_values_to_change_listener(
+        self, data_source
+    ) -> None:
+        """Test repeated ERD values, on either update path, don't tell the change listener the stored data changed."""
+        listener = MagicMock()
+        data_source.async_set_change_listener(listener)
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        await given_erd_is_set_to(0x0001, bytes.fromhex("01"), "test", data_source)
+        listener.reset_mock()
+
+        assert data_source.async_erd_update("test", 0x0001, bytes.fromhex("01"))
+        await when_erd_is_updated_to(0x0001, bytes.fromhex("01"), "test", data_source)
+        await given_change_suppression_is_set_to(False, "test", data_source)
+        await when_erd_is_updated_to(0x0001, bytes.fromhex("01"), "test", data_source)
+        listener.assert_not_called()
+
+        assert data_source.async_erd_update("test", 0x0001, bytes.fromhex("02"))
+        listener.assert_called_once()
+
+    async def test_looks_up_registered_entities_by_unique_id(self, data_source) -> None:
+        """Test data source returns the entity and entity ID registered for a unique ID until it is removed."""
+        entity = MagicMock()
+        entity.entity_id = "select.test"
+        await data_source.register_entity("test_0001_Test", entity)
+        assert await data_source.get_entity("test_0001_Test") is entity
+        assert await data_source.get_entity("test_0001_Test.Option") is entity
+        assert (
+            await data_source.get_entity_id_for_unique_id("test_0001_Test")
+            == "select.test"
+        )
+        assert await data_source.get_entity("test_0002_Test") is None
+        assert await data_source.get_entity_id_for_unique_id("test_0002_Test") is None
+
+        await data_source.unregister_entity("test_0001_Test")
+        assert await data_source.get_entity("test_0001_Test") is None
+
     async def test_get_common_appliance_api_version(self, data_source) -> None:
         """Test data source returns correct JSON for given common appliance API version."""
         await the_common_appliance_api_version_should_be(
@@ -850,3 +1308,79 @@ class TestDataSource:
     async def test_get_erd_definition(self, data_source) -> None:
         """Test data source returns correct definition JSON for given ERD."""
         await the_erd_def_should_be(0x0001, ERD_1_DEFINITION_JSON, data_source)
+
+    async def test_shares_compiled_erd_decoder(self, data_source) -> None:
+        """Test data source compiles an ERD's decoder once and returns None for unknown ERDs."""
+        decoder = await data_source.get_erd_decoder(0x0001)
+        assert decoder is not None
+        assert await data_source.get_erd_decoder(0x0001) is decoder
+        assert await data_source.get_erd_decoder(0x1234) is None
+
+    async def test_decodes_erd_once_per_value(self, data_source) -> None:
+        """Test every field of an ERD value is decoded in one call shared by its fields until the value changes."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        erd_decoder = await data_source.get_erd_decoder(0x0001)
+        assert erd_decoder is not None
+        field_decoder = erd_decoder.decoders[0]
+
+        with patch.object(
+            ErdDecoder, "decode", autospec=True, side_effect=ErdDecoder.decode
+        ) as decode:
+            for _ in range(2):
+                assert (
+                    data_source.async_decode_field(
+                        "test", 0x0001, bytes.fromhex("01"), field_decoder
+                    )
+                    == 1
+                )
+            assert decode.call_count == 1
+
+            assert (
+                data_source.async_decode_field(
+                    "test", 0x0001, bytes.fromhex("00"), field_decoder
+                )
+                == 0
+            )
+            assert decode.call_count == 2
+
+    async def test_decodes_field_without_erd_decoder(self, data_source) -> None:
+        """Test a field decoder compiled on its own decodes the field's bytes directly."""
+        await given_a_device_is_added("test", data_source)
+        await given_a_supported_erd_is_added(0x0001, "test", data_source)
+        field_decoder = FieldDecoder(
+            {"name": "Test", "type": "u8", "offset": 1, "size": 1}, 1
+        )
+
+        assert (
+            data_source.async_decode_field(
+                "test", 0x0001, bytes.fromhex("0102"), field_decoder
+            )
+            == 2
+        )
+
+    async def test_get_erd_definition_for_uppercase_id(self, data_source) -> None:
+        """Test data source finds definitions whose IDs use uppercase hex digits."""
+        erd_def = await data_source.get_erd_def(0x000A)
+        assert erd_def is not None
+        assert erd_def["name"] == "Test Three Desired"
+
+    async def test_returns_none_for_unknown_erd_definition(self, data_source) -> None:
+        """Test data source returns None for an ERD without a definition."""
+        await the_erd_def_should_not_exist(0x1234, data_source)
+
+    async def test_get_erd_field_definition(self, data_source) -> None:
+        """Test data source returns the correct definition JSON for a named ERD field."""
+        await the_erd_field_def_should_be(
+            0x0005,
+            "Field Two",
+            '{"name": "Field Two", "type": "bool", "offset": 1, "size": 1}',
+            data_source,
+        )
+
+    async def test_returns_none_for_unknown_erd_field_definition(
+        self, data_source
+    ) -> None:
+        """Test data source returns None for a field that isn't in the ERD definition."""
+        await the_erd_field_def_should_not_exist(0x0005, "Field Three", data_source)
+        await the_erd_field_def_should_not_exist(0x1234, "Field One", data_source)
@@ -0,0 +1,114 @@
+"""Tests for GE Appliances compiled ERD field decoders."""
+
+from custom_components.geappliances.decoder import ErdDecoder, get_field_key
+
+ERD_DEF = {
+    "name": "Decoder Test",
+    "id": "0x0001",
+    "operations": ["read"],
+    "description": "",
+    "data": [
+        {"name": "Signed", "type": "i16", "offset": 0, "size": 2},
+        {"name": "Temperature x10", "type": "u16", "offset": 2, "size": 2},
+        {
+            "name": "Flag",
+            "type": "u8",
+            "bits": {"offset": 4, "size": 3},
+            "offset": 4,
+            "size": 1,
+        },
+        {
+            "name": "Mode",
+            "type": "enum",
+            "values": {"0": "Off", "1": "On"},
+            "offset": 5,
+            "size": 1,
+        },
+        {"name": "Serial", "type": "raw", "offset": 6, "size": 3},
+        {"name": "Odd Size", "type": "u32", "offset": 9, "size": 3},
+    ],
+}
+
+PAYLOAD = bytes.fromhex("FFFE 00FA 0A 01 ABCDEF 010203")
+
+
+class TestDecoder:
+    """Hold field decoder tests."""
+
+    async def test_decodes_every_field_in_one_call(self) -> None:
+        """Test the ERD decoder returns each field decoded, masked and scaled in definition order."""
+        assert ErdDecoder(ERD_DEF).decode(PAYLOAD) == (
+            -2,
+            25.0,
+            5,
+            1,
+            "abcdef",
+            0x010203,
+        )
+
+    async def test_decodes_bit_fields_of_the_same_bytes(self) -> None:
+        """Test bit fields sharing their bytes are each masked and shifted from one unpacked integer."""
+        erd_def = {
+            "data": [
+                {
+                    "name": "High",
+                    "type": "u8",
+                    "bits": {"offset": 0, "size": 4},
+                    "offset": 0,
+                    "size": 1,
+                },
+                {
+                    "name": "Low",
+                    "type": "u8",
+                    "bits": {"offset": 4, "size": 4},
+                    "offset": 0,
+                    "size": 1,
+                },
+                {"name": "Whole", "type": "u8", "offset": 0, "size": 1},
+            ]
+        }
+        assert ErdDecoder(erd_def).decode(bytes.fromhex("A5")) == (0xA, 0x5, 0xA5)
+
+    async def test_decodes_short_payload(self) -> None:
+        """Test fields past the end of a short payload are decoded from the bytes present."""
+        assert ErdDecoder(ERD_DEF).decode(bytes.fromhex("0001"))[:2] == (1, 0)
+
+    async def test_field_decoders_know_their_place_in_erd_decoder(self) -> None:
+        """Test each field's decoder points at the value the ERD decoder returns for it."""
+        decoder = ErdDecoder(ERD_DEF)
+        values = decoder.decode(PAYLOAD)
+        for field in ERD_DEF["data"]:
+            field_decoder = decoder.fields[get_field_key(field)]
+            assert field_decoder.erd_decoder is decoder
+            assert (
+                field_decoder(
+                    PAYLOAD[field["offset"] : field["offset"] + field["size"]]
+                )
+                == values[field_decoder.position]
+            )
+
+    async def test_decodes_each_field(self) -> None:
+        """Test each field's decoder returns its value decoded, masked and scaled."""
+        decoder = ErdDecoder(ERD_DEF)
+        assert [
+            decoder.fields[get_field_key(field)](
+                PAYLOAD[field["offset"] : field["offset"] + field["size"]]
+            )
+            for field in ERD_DEF["data"]
+        ] == [-2, 25.0, 5, 1, "abcdef", 0x010203]
+
+    async def test_decodes_short_field(self) -> None:
+        """Test a field cut short by the payload is decoded from the bytes present."""
+        field = ERD_DEF["data"][0]
+        assert ErdDecoder(ERD_DEF).fields[get_field_key(field)](b"\x01") == 1
+
+    async def test_decodes_views_of_payload(self) -> None:
+        """Test fields decode the same from memoryview slices as from bytes slices."""
+        decoder = ErdDecoder(ERD_DEF)
+        view = memoryview(PAYLOAD)
+        for field in ERD_DEF["data"]:
+            field_decoder = decoder.fields[get_field_key(field)]
+            end = field["offset"] + field["size"]
+            assert field_decoder(view[field["offset"] : end]) == field_decoder(
+                PAYLOAD[field["offset"] : end]
+            )
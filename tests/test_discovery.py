@@ -3,14 +3,20 @@
 import logging
 from unittest.mock import MagicMock
 
+from custom_components.geappliances.catalog import ApplianceApiCatalog
 from custom_components.geappliances.const import Erd
 from custom_components.geappliances.discovery import GeaDiscovery
 from custom_components.geappliances.ha_compatibility.data_source import DataSource
 from custom_components.geappliances.ha_compatibility.meta_erds import MetaErdCoordinator
-from custom_components.geappliances.ha_compatibility.mqtt_client import MQTTMessage
+from custom_components.geappliances.ha_compatibility.mqtt_client import (
+    GeaMQTTClient,
+    MQTTMessage,
+)
 from custom_components.geappliances.ha_compatibility.registry_updater import (
     RegistryUpdater,
 )
+from custom_components.geappliances.models import GeaEntityConfig
+from custom_components.geappliances.topic import parse_topic
 import pytest
 
 from .common import ERD_VALUE_TOPIC
@@ -153,11 +159,18 @@ APPLIANCE_API_DEFINTION_JSON = """
 }"""
 
 
+@pytest.fixture
+def mqtt_client_mock() -> MqttClientMock:
+    """Return a mock instance of GeaMQTTClient."""
+    return MagicMock(GeaMQTTClient)
+
+
 @pytest.fixture
 def data_source(mqtt_client_mock: MqttClientMock) -> DataSource:
     """Create a data source using the module's appliance API."""
     return DataSource(
-        APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON, mqtt_client_mock
+        ApplianceApiCatalog.from_json(APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON),
+        mqtt_client_mock,
     )
 
 
@@ -177,7 +190,10 @@ def registry_updater_mock() -> RegistryUpdaterMock:
 @pytest.fixture
 def meta_erd_coordinator_mock() -> MetaErdCoordinatorMock:
     """Return a mock instance of MetaErdCoordinator."""
-    attrs = {"is_meta_erd.return_value": False}
+    attrs = {
+        "is_meta_erd.return_value": False,
+        "async_is_meta_erd.return_value": False,
+    }
     meta_erd_coordinator_mock = MagicMock(MetaErdCoordinator)
     meta_erd_coordinator_mock.configure_mock(**attrs)
     return meta_erd_coordinator_mock
@@ -249,17 +265,44 @@ async def when_an_mqtt_message_is_received_on_topic(
     )
 
 
+def the_value_should_be_handled_in_place(
+    erd: Erd, payload: bytes, handled: bool, discovery: GeaDiscovery
+) -> None:
+    """Assert whether the synchronous value handler accepts the message."""
+    assert (
+        discovery.async_handle_value(
+            parse_topic(ERD_VALUE_TOPIC.format(f"{erd:#06x}")), payload
+        )
+        is handled
+    )
+
+
 def the_device_should_exist(registry_updater_mock: RegistryUpdaterMock) -> None:
     """Check the device has been registered."""
     registry_updater_mock.create_device.assert_called_with("test")
 
 
+def entities_added_to_the_device(
+    registry_updater_mock: RegistryUpdaterMock,
+) -> list[GeaEntityConfig]:
+    """Return the configs of every entity added to the test device."""
+    return [
+        config
+        for configs, device_name in (
+            call.args
+            for call in registry_updater_mock.add_entities_to_device.call_args_list
+        )
+        if device_name == "test"
+        for config in configs
+    ]
+
+
 def the_entity_should_be_added_to_the_device(
     entity_name: str, registry_updater_mock: RegistryUpdaterMock
 ) -> None:
     """Check the entity has been registered with the device."""
-    registry_updater_mock.add_entity_to_device.assert_any_call(
-        AnyConfigWithName(entity_name), "test"
+    assert AnyConfigWithName(entity_name) in entities_added_to_the_device(
+        registry_updater_mock
     )
 
 
@@ -267,24 +310,36 @@ def the_entity_should_not_exist(
     entity_name: str, registry_updater_mock: RegistryUpdaterMock
 ) -> None:
     """Assert the given entity does not exist."""
-    try:
-        registry_updater_mock.add_entity_to_device.assert_any_call(
-            AnyConfigWithName(entity_name), "test"
-        )
-    except AssertionError:
-        return
+    if AnyConfigWithName(entity_name) in entities_added_to_the_device(
+        registry_updater_mock
+    ):
+        pytest.fail(f"Entity with name {entity_name} was found on device 'test'")
 
-    pytest.fail(f"Entity with name {entity_name} was found on device 'test'")
+
+def the_entities_should_be_added_in_batches(
+    count: int, registry_updater_mock: RegistryUpdaterMock
+) -> None:
+    """Assert entities were added to the device in the given number of batches."""
+    assert registry_updater_mock.add_entities_to_device.call_count == count
 
 
 def the_erd_should_be_unsupported(erd: Erd, data_source: DataSource) -> None:
     """Assert that the ERD exists but is listed as unsupported."""
-    assert data_source._data["test"]["unsupported_erds"].get(erd) is not None
+    assert not data_source._data["test"].erds[erd].supported
 
 
 def the_erd_should_be_supported(erd: Erd, data_source: DataSource) -> None:
     """Assert that the ERD exists but and is listed as supported."""
-    assert data_source._data["test"]["supported_erds"].get(erd) is not None
+    assert data_source._data["test"].erds[erd].supported
+
+
+def the_device_should_be_subscribed_to(
+    erds: list[Erd], mqtt_client_mock: MqttClientMock
+) -> None:
+    """Assert the last subscription update for the test device listed exactly the given ERDs."""
+    device_name, subscribed = mqtt_client_mock.subscribe_to_device_erds.call_args.args
+    assert device_name == "test"
+    assert sorted(subscribed) == erds
 
 
 def the_error_log_should_be(msg: str, caplog: pytest.LogCaptureFixture) -> None:
@@ -307,6 +362,21 @@ class TestDiscovery:
 
         the_device_should_exist(registry_updater_mock)
 
+    async def test_adds_ingest_diagnostics_for_new_device(
+        self, registry_updater_mock, discovery
+    ) -> None:
+        """Test discovery adds the ingest queue diagnostic sensors once when it finds a device."""
+        await when_the_device_is_discovered(discovery)
+        await when_the_device_is_discovered(discovery)
+
+        registry_updater_mock.add_diagnostic_sensors.assert_called_once()
+        configs = registry_updater_mock.add_diagnostic_sensors.call_args.args[0]
+        assert [config.unique_identifier for config in configs] == [
+            "test_ingest_depth",
+            "test_ingest_dropped",
+            "test_ingest_merged",
+        ]
+
     async def test_does_not_create_entity_until_appliance_api_confirms(
         self, registry_updater_mock, data_source, discovery
     ) -> None:
@@ -372,6 +442,19 @@ class TestDiscovery:
             "Another Test: Another Test_2", registry_updater_mock
         )
 
+    async def test_adds_entities_for_manifest_in_one_batch(
+        self, registry_updater_mock, discovery
+    ) -> None:
+        """Test discovery adds the entities for a manifest and its features in one batch."""
+        await when_the_erd_is_set_to(
+            0x0092, bytes.fromhex("0000 0001 0000 0001"), discovery
+        )
+        the_entities_should_be_added_in_batches(1, registry_updater_mock)
+        the_entity_should_be_added_to_the_device("Test: Test", registry_updater_mock)
+        the_entity_should_be_added_to_the_device(
+            "Another Test: Another Test", registry_updater_mock
+        )
+
     async def test_creates_sensor_for_each_field(
         self, registry_updater_mock, discovery
     ) -> None:
@@ -400,6 +483,113 @@ class TestDiscovery:
         the_erd_should_be_supported(0x0001, data_source)
         the_erd_should_be_unsupported(0x0002, data_source)
 
+    async def test_skips_manifest_identical_to_last_one(
+        self, registry_updater_mock, data_source, discovery
+    ) -> None:
+        """Test discovery ignores a manifest that is byte-identical to the one it already processed."""
+        await given_the_erd_is_set_to(
+            0x0092, bytes.fromhex("0000 0001 0000 0001"), discovery
+        )
+        subscriber = MagicMock()
+        await data_source.erd_subscribe("test", 0x0001, subscriber)
+
+        await when_the_erd_is_set_to(
+            0x0092, bytes.fromhex("0000 0001 0000 0001"), discovery
+        )
+        the_entities_should_be_added_in_batches(1, registry_updater_mock)
+        subscriber.assert_not_called()
+
+    async def test_only_moves_erds_dropped_from_manifest(
+        self, data_source, discovery
+    ) -> None:
+        """Test discovery leaves ERDs the new manifest still lists supported and their subscribers untouched."""
+        await given_the_erd_is_set_to(
+            0x0092, bytes.fromhex("0000 0001 0000 0001"), discovery
+        )
+        kept = MagicMock()
+        dropped = MagicMock()
+        await data_source.erd_subscribe("test", 0x0001, kept)
+        await data_source.erd_subscribe("test", 0x0002, dropped)
+
+        await when_the_erd_is_set_to(
+            0x0092, bytes.fromhex("0000 0001 0000 0000"), discovery
+        )
+        kept.assert_not_called()
+        dropped.assert_called_once_with(None)
+        assert await data_source.erd_has_subscribers("test", 0x0001)
+
+    async def test_restores_devices_from_snapshot(
+        self, registry_updater_mock, data_source, discovery
+    ) -> None:
+        """Test discovery recreates the entities and values in a snapshot and skips the manifest when the device reports it again."""
+        assert await discovery.restore(
+            {
+                "test": {
+                    "manifests": {"0x0092": "0000000100000001"},
+                    "erds": {"0x0001": "05"},
+                }
+            }
+        )
+        the_device_should_exist(registry_updater_mock)
+        the_entity_should_be_added_to_the_device("Test: Test", registry_updater_mock)
+        assert await data_source.erd_read("test", 0x0001) == bytes.fromhex("05")
+
+        await when_the_erd_is_set_to(
+            0x0092, bytes.fromhex("0000 0001 0000 0001"), discovery
+        )
+        the_entities_should_be_added_in_batches(1, registry_updater_mock)
+
+    async def test_discards_unreadable_snapshot(
+        self, registry_updater_mock, discovery, capture_errors
+    ) -> None:
+        """Test discovery restores nothing from a snapshot with a missing section or a bad value, and reports it can't be used."""
+        assert not await discovery.restore({"test": {"erds": {"0x0001": "05"}}})
+        capture_errors.clear()
+        assert not await discovery.restore(
+            {"test": {"manifests": {"0x0092": "not hex"}, "erds": {}}}
+        )
+
+        registry_updater_mock.create_device.assert_not_called()
+        the_error_log_should_be(
+            "Could not read the snapshot of discovered devices", capture_errors
+        )
+
+    async def test_subscribes_to_supported_erds_for_manifest(
+        self, mqtt_client_mock, discovery
+    ) -> None:
+        """Test discovery narrows the device's subscriptions to the ERDs its manifests support."""
+        await when_the_erd_is_set_to(0x0001, bytes.fromhex("01"), discovery)
+        mqtt_client_mock.subscribe_to_device_erds.assert_not_called()
+
+        await when_the_erd_is_set_to(
+            0x0092, bytes.fromhex("0000 0001 0000 0001"), discovery
+        )
+        the_device_should_be_subscribed_to([0x0001, 0x0002], mqtt_client_mock)
+
+        await when_the_erd_is_set_to(
+            0x0092, bytes.fromhex("0000 0001 0000 0000"), discovery
+        )
+        the_device_should_be_subscribed_to([0x0001], mqtt_client_mock)
+
+    async def test_handles_values_for_supported_erds_in_place(
+        self, data_source, discovery
+    ) -> None:
+        """Test values for supported ERDs are handled without awaiting and everything else is left to the async handler."""
+        the_value_should_be_handled_in_place(
+            0x0092, bytes.fromhex("0000 0001 0000 0001"), False, discovery
+        )
+        await given_the_erd_is_set_to(
+            0x0092, bytes.fromhex("0000 0001 0000 0001"), discovery
+        )
+
+        the_value_should_be_handled_in_place(
+            0x0001, bytes.fromhex("01"), True, discovery
+        )
+        assert data_source._data["test"].erds[0x0001].value == bytes.fromhex("01")
+        the_value_should_be_handled_in_place(
+            0x0003, bytes.fromhex("01"), False, discovery
+        )
+
     async def test_logs_when_mqtt_topic_is_bad(self, capture_errors, discovery) -> None:
         """Test discovery logs an error for a bad MQTT topic."""
         await when_an_mqtt_message_is_received_on_topic(
@@ -1,10 +1,11 @@
 """Tests for GE Appliances ERD factory."""
 
 import logging
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from numpy import empty
 
+from custom_components.geappliances.catalog import ApplianceApiCatalog
 from custom_components.geappliances.const import Erd
 from custom_components.geappliances.erd_factory import ERDFactory
 from custom_components.geappliances.ha_compatibility.data_source import DataSource
@@ -13,6 +14,9 @@ from custom_components.geappliances.ha_compatibility.mqtt_client import GeaMQTTC
 from custom_components.geappliances.ha_compatibility.registry_updater import (
     RegistryUpdater,
 )
+from custom_components.geappliances.ha_compatibility.special_erds import (
+    build_clock_time,
+)
 from custom_components.geappliances.models import (
     GeaBinarySensorConfig,
     GeaEntityConfig,
@@ -164,7 +168,8 @@ def mqtt_client_mock() -> MqttClientMock:
 def data_source(mqtt_client_mock) -> DataSource:
     """Create a data source using the module's appliance API."""
     return DataSource(
-        APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON, mqtt_client_mock
+        ApplianceApiCatalog.from_json(APPLIANCE_API_JSON, APPLIANCE_API_DEFINTION_JSON),
+        mqtt_client_mock,
     )
 
 
@@ -220,6 +225,16 @@ async def when_configs_are_created_for_appliance_api(
         await erd_factory.set_up_erds(erd_list, DEVICE_NAME)
 
 
+async def when_configs_are_created_for_appliance_api_with_plan(
+    device_name: str, data_source: DataSource, erd_factory: ERDFactory
+) -> None:
+    """Create the configs for the common appliance API, caching its entity plan."""
+    if (
+        erd_list := await data_source.get_common_appliance_api_version("1")
+    ) is not None:
+        await erd_factory.set_up_erds(erd_list["required"], device_name, (None, "1", 0))
+
+
 def get_configs_for_erd(
     erd: Erd, data_source: DataSource
 ) -> list[GeaBinarySensorConfig]:
@@ -339,11 +354,30 @@ async def the_configs_should_be_correct_for_appliance_api(
 
         expected_lists = [get_configs_for_erd(erd, data_source) for erd in erd_list]
 
-        for config_list in expected_lists:
-            for config in config_list:
-                registry_updater_mock.add_entity_to_device.assert_any_call(
-                    config, DEVICE_NAME
-                )
+        registry_updater_mock.add_entities_to_device.assert_called_once_with(
+            [config for config_list in expected_lists for config in config_list],
+            DEVICE_NAME,
+        )
+
+
+def the_configs_should_be_stamped_for_device(
+    device_name: str, device_id: str, registry_updater_mock: RegistryUpdaterMock
+) -> None:
+    """Assert the last batch of configs was created for the given device from the first device's plan."""
+    configs, batch_device_name = (
+        registry_updater_mock.add_entities_to_device.call_args.args
+    )
+    first_configs = registry_updater_mock.add_entities_to_device.call_args_list[0].args[
+        0
+    ]
+
+    assert batch_device_name == device_name
+    assert [config.unique_identifier for config in configs] == [
+        config.unique_identifier.replace(DEVICE_NAME, device_name.replace(" ", "_"), 1)
+        for config in first_configs
+    ]
+    assert all(config.device_id == device_id for config in configs)
+    assert all(config.device_name == device_name for config in configs)
 
 
 def the_error_log_should_be(msg: str, caplog: pytest.LogCaptureFixture) -> None:
@@ -401,3 +435,60 @@ class TestERDFactory:
         empty_list = await when_configs_are_created_for_erd(0x0006, erd_factory)
         await the_configs_should_be_correct_for_erd(0x0005, config_list, data_source)
         await the_configs_should_be_correct_for_erd(0x0006, empty_list, data_source)
+
+    async def test_reuses_entity_plan_for_identical_device(
+        self, data_source, registry_updater_mock, erd_factory
+    ) -> None:
+        """Test factory stamps a cached entity plan for a second device with the same manifest."""
+        await data_source.add_device("other", "other_id")
+        await when_configs_are_created_for_appliance_api_with_plan(
+            DEVICE_NAME, data_source, erd_factory
+        )
+
+        with patch.object(
+            erd_factory, "get_entity_configs", side_effect=AssertionError
+        ):
+            await when_configs_are_created_for_appliance_api_with_plan(
+                "other", data_source, erd_factory
+            )
+
+        the_configs_should_be_stamped_for_device(
+            "other", "other_id", registry_updater_mock
+        )
+
+    async def test_stamps_unique_ids_with_spaces_replaced(
+        self, data_source, registry_updater_mock, erd_factory
+    ) -> None:
+        """Test stamped unique IDs replace spaces in the device name, as freshly built ones do."""
+        await data_source.add_device("my other", "other_id")
+        await when_configs_are_created_for_appliance_api_with_plan(
+            DEVICE_NAME, data_source, erd_factory
+        )
+        await when_configs_are_created_for_appliance_api_with_plan(
+            "my other", data_source, erd_factory
+        )
+
+        the_configs_should_be_stamped_for_device(
+            "my other", "other_id", registry_updater_mock
+        )
+
+    async def test_stamps_special_erd_unique_ids_with_device_name(
+        self, data_source, registry_updater_mock, erd_factory
+    ) -> None:
+        """Test stamped special ERD unique IDs keep the spaces in the device name, as freshly built ones do."""
+        erd_factory._special_erd_coordinator._special_erds_map = {
+            0x0002: build_clock_time
+        }
+        await data_source.add_device("my other", "other_id")
+        await when_configs_are_created_for_appliance_api_with_plan(
+            DEVICE_NAME, data_source, erd_factory
+        )
+        await when_configs_are_created_for_appliance_api_with_plan(
+            "my other", data_source, erd_factory
+        )
+
+        configs = registry_updater_mock.add_entities_to_device.call_args.args[0]
+        assert [config.unique_identifier for config in configs] == [
+            "my_other_0001_Test",
+            "my other_0005_Clock_Time",
+        ]
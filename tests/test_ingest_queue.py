@@ -0,0 +1,169 @@
+"""Tests for GE Appliances per-device ingest queues."""
+
+import asyncio
+
+from custom_components.geappliances.ha_compatibility.ingest_queue import IngestQueues
+from custom_components.geappliances.ha_compatibility.mqtt_client import MQTTMessage
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from .common import config_entry_stub
+
+ERD_VALUE_TOPIC = "geappliances/{}/erd/{:#06x}/value"
+
+
+class BlockingHandler:
+    """Handler that records messages and holds each device's first message until released."""
+
+    def __init__(self) -> None:
+        """Initialize with nothing handled."""
+        self.handled: list[MQTTMessage] = []
+        self.release = asyncio.Event()
+        self.blocked_devices = {"slow"}
+        self.failing_payloads: set[str] = set()
+
+    async def __call__(self, msg: MQTTMessage) -> None:
+        """Record the message, waiting first if its device is blocked and raising if its payload fails."""
+        if msg.topic.split("/")[1] in self.blocked_devices:
+            self.blocked_devices.remove(msg.topic.split("/")[1])
+            await self.release.wait()
+        if msg.payload.hex() in self.failing_payloads:
+            raise ValueError("Invalid message")
+        self.handled.append(msg)
+
+
+@pytest.fixture
+def handler() -> BlockingHandler:
+    """Return a handler that blocks the first message from the slow device."""
+    return BlockingHandler()
+
+
+@pytest.fixture
+def queues(hass: HomeAssistant, handler: BlockingHandler) -> IngestQueues:
+    """Return ingest queues with room for two waiting messages per device."""
+    entry = config_entry_stub()
+    entry.add_to_hass(hass)
+    return IngestQueues(hass, entry, handler, max_depth=2)
+
+
+def message(device_name: str, erd: int, payload: bytes) -> MQTTMessage:
+    """Return a value message for the device's ERD."""
+    return MQTTMessage(
+        ERD_VALUE_TOPIC.format(device_name, erd),
+        payload,
+        0,
+        False,
+        "geappliances/#",
+        0.0,
+    )
+
+
+async def given_messages_are_queued(
+    messages: list[MQTTMessage], device_name: str, queues: IngestQueues
+) -> None:
+    """Queue each message for the device, letting the device's task run in between."""
+    for msg in messages:
+        queues.async_enqueue(device_name, msg)
+        await asyncio.sleep(0)
+
+
+async def when_the_slow_device_is_released(
+    hass: HomeAssistant, handler: BlockingHandler
+) -> None:
+    """Let the slow device's first message finish and wait for its queue to drain."""
+    handler.release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+def the_handled_payloads_should_be(
+    payloads: list[str], device_name: str, handler: BlockingHandler
+) -> None:
+    """Assert the device's messages were handled with the given payloads, in order."""
+    assert [
+        msg.payload.hex()
+        for msg in handler.handled
+        if msg.topic.split("/")[1] == device_name
+    ] == payloads
+
+
+class TestIngestQueue:
+    """Hold ingest queue tests."""
+
+    async def test_handles_other_devices_while_one_is_busy(
+        self, hass: HomeAssistant, handler, queues
+    ) -> None:
+        """Test a device stuck on a message doesn't hold up other devices."""
+        await given_messages_are_queued(
+            [message("slow", 0x0092, bytes.fromhex("01"))], "slow", queues
+        )
+        await given_messages_are_queued(
+            [message("fast", 0x0001, bytes.fromhex("02"))], "fast", queues
+        )
+
+        the_handled_payloads_should_be(["02"], "fast", handler)
+        assert not queues.async_is_idle("slow")
+        assert queues.async_is_idle("fast")
+
+        await when_the_slow_device_is_released(hass, handler)
+        the_handled_payloads_should_be(["01"], "slow", handler)
+        assert queues.async_is_idle("slow")
+
+    async def test_merges_values_on_the_same_topic(
+        self, hass: HomeAssistant, handler, queues
+    ) -> None:
+        """Test a newer value replaces the one waiting on the same topic and moves to the back of the queue."""
+        await given_messages_are_queued(
+            [
+                message("slow", 0x0092, bytes.fromhex("00")),
+                message("slow", 0x0001, bytes.fromhex("01")),
+                message("slow", 0x0093, bytes.fromhex("02")),
+                message("slow", 0x0001, bytes.fromhex("03")),
+            ],
+            "slow",
+            queues,
+        )
+        assert await queues.get_stats("slow") == {"depth": 2, "dropped": 0, "merged": 1}
+
+        await when_the_slow_device_is_released(hass, handler)
+        the_handled_payloads_should_be(["00", "02", "03"], "slow", handler)
+
+    async def test_drops_oldest_value_when_full(
+        self, hass: HomeAssistant, handler, queues
+    ) -> None:
+        """Test a full queue drops its oldest value to make room but keeps appliance API manifests."""
+        await given_messages_are_queued(
+            [
+                message("slow", 0x0001, bytes.fromhex("00")),
+                message("slow", 0x0092, bytes.fromhex("01")),
+                message("slow", 0x0002, bytes.fromhex("02")),
+                message("slow", 0x0003, bytes.fromhex("03")),
+            ],
+            "slow",
+            queues,
+        )
+        assert await queues.get_stats("slow") == {"depth": 2, "dropped": 1, "merged": 0}
+
+        await when_the_slow_device_is_released(hass, handler)
+        the_handled_payloads_should_be(["00", "01", "03"], "slow", handler)
+
+    async def test_handles_messages_after_one_fails(
+        self, hass: HomeAssistant, handler, queues, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test a message whose handler raises is logged and the messages after it are still handled."""
+        handler.failing_payloads.add("01")
+        await given_messages_are_queued(
+            [
+                message("slow", 0x0092, bytes.fromhex("01")),
+                message("slow", 0x0001, bytes.fromhex("02")),
+            ],
+            "slow",
+            queues,
+        )
+
+        await when_the_slow_device_is_released(hass, handler)
+        the_handled_payloads_should_be(["02"], "slow", handler)
+        assert queues.async_is_idle("slow")
+        assert "Could not handle message on geappliances/slow/erd/0x0092/value" in (
+            caplog.text
+        )
@@ -1,12 +1,22 @@
 """Test GE Appliances initialization."""
 
-from custom_components.geappliances.const import DISCOVERY, DOMAIN
+from typing import Any
+
+from custom_components.geappliances.catalog import LazyApplianceApiCatalog
+from custom_components.geappliances.const import (
+    DATA_SOURCE,
+    DISCOVERY,
+    DOMAIN,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+)
 from custom_components.geappliances.discovery import GeaDiscovery
 import pytest
 from pytest_homeassistant_custom_component.typing import MqttMockHAClient
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
 
 from .common import config_entry_stub
 
@@ -27,6 +37,28 @@ async def setup_should_return(
     assert await hass.config_entries.async_setup(entry.entry_id) is val
 
 
+def given_the_snapshot_is(snapshot: Any, hass_storage: dict[str, Any]) -> None:
+    """Put a snapshot of discovered devices in storage."""
+    hass_storage[SNAPSHOT_STORAGE_KEY] = {
+        "version": SNAPSHOT_STORAGE_VERSION,
+        "key": SNAPSHOT_STORAGE_KEY,
+        "data": snapshot,
+    }
+
+
+def the_snapshot_should_be_removed(hass_storage: dict[str, Any]) -> None:
+    """Assert no snapshot of discovered devices is in storage."""
+    assert SNAPSHOT_STORAGE_KEY not in hass_storage
+
+
+def the_device_should_be_registered(device_name: str, hass: HomeAssistant) -> None:
+    """Assert the device registry has the device."""
+    assert (
+        dr.async_get(hass).async_get_device(identifiers={(DOMAIN, device_name)})
+        is not None
+    )
+
+
 def discovery_should_be_created(hass: HomeAssistant) -> None:
     """Assert that the GEADiscovery singleton is created."""
     assert type(hass.data[DOMAIN][DISCOVERY]) is GeaDiscovery
@@ -50,3 +82,57 @@ class TestInit:
         await hass.async_block_till_done(wait_background_tasks=True)
         discovery_should_be_created(hass)
         await hass.async_block_till_done(wait_background_tasks=True)
+
+    async def test_restores_devices_from_snapshot(
+        self, hass: HomeAssistant, mqtt_mock: MqttMockHAClient, hass_storage
+    ) -> None:
+        """Test setup registers the devices in the saved snapshot."""
+        given_the_snapshot_is(
+            {"test": {"manifests": {"0x0092": "0000000100000000"}, "erds": {}}},
+            hass_storage,
+        )
+        entry = given_the_entry_is_created(hass)
+        await setup_should_return(True, hass, entry)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        the_device_should_be_registered("test", hass)
+
+    async def test_discards_unreadable_snapshot(
+        self, hass: HomeAssistant, mqtt_mock: MqttMockHAClient, hass_storage
+    ) -> None:
+        """Test setup succeeds and deletes a snapshot that can't be restored."""
+        given_the_snapshot_is({"test": {"erds": {"0x0001": "not hex"}}}, hass_storage)
+        entry = given_the_entry_is_created(hass)
+        await setup_should_return(True, hass, entry)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        the_snapshot_should_be_removed(hass_storage)
+
+    async def test_removing_entry_deletes_snapshot(
+        self, hass: HomeAssistant, mqtt_mock: MqttMockHAClient, hass_storage
+    ) -> None:
+        """Test removing the config entry deletes the snapshot so removed devices aren't restored."""
+        entry = given_the_entry_is_created(hass)
+        await setup_should_return(True, hass, entry)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        given_the_snapshot_is({}, hass_storage)
+
+        await hass.config_entries.async_remove(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        the_snapshot_should_be_removed(hass_storage)
+
+    async def test_unloading_entry_closes_catalog(
+        self, hass: HomeAssistant, mqtt_mock: MqttMockHAClient
+    ) -> None:
+        """Test unloading the config entry unmaps the compiled catalog, so reloads don't leak mappings."""
+        entry = given_the_entry_is_created(hass)
+        await setup_should_return(True, hass, entry)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        catalog = hass.data[DOMAIN][DATA_SOURCE]._catalog
+        assert isinstance(catalog, LazyApplianceApiCatalog)
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert catalog._reader._mmap.closed
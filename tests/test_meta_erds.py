@@ -1,8 +1,11 @@
 """Test 'Meta' ERDs that provide info about other ERDs."""
 
 import json
+from unittest.mock import AsyncMock, MagicMock
 
 from custom_components.geappliances.const import DISCOVERY, DOMAIN
+from custom_components.geappliances.ha_compatibility import meta_erds
+from custom_components.geappliances.ha_compatibility.data_source import DataSource
 import pytest
 from pytest_homeassistant_custom_component.typing import MqttMockHAClient
 
@@ -311,6 +314,18 @@ def given_the_meta_erds_are_set_to(meta_erds: str, hass: HomeAssistant) -> None:
     coordinator._create_entities_to_meta_erds_dict()
 
 
+async def the_meta_erd_should_apply_to(
+    meta_erd: int, feature_type_and_version: tuple[str, str] | None, hass: HomeAssistant
+) -> None:
+    """Assert the meta ERD is indexed to the given feature type and version on the test device."""
+    coordinator = hass.data[DOMAIN][DISCOVERY]._meta_erd_coordinator
+    assert await coordinator.is_meta_erd(meta_erd)
+    assert (
+        await coordinator._get_meta_erd_feature_type_and_version("test", meta_erd)
+        == feature_type_and_version
+    )
+
+
 async def setting_the_number_should_raise_error(
     name: str, value: float, hass: HomeAssistant
 ) -> None:
@@ -338,6 +353,15 @@ async def setting_the_select_should_raise_error(
 class TestMetaErds:
     """Hold the meta ERD tests."""
 
+    async def test_indexes_meta_erds_when_manifest_changes(
+        self, hass: HomeAssistant, mqtt_mock: MqttMockHAClient
+    ) -> None:
+        """Test meta ERDs are indexed to the manifest that lists them and re-indexed when it changes."""
+        await the_meta_erd_should_apply_to(0x0004, ("common", "1"), hass)
+
+        await given_the_erd_is_set_to(0x0092, "0000 0001 0000 0000", hass)
+        await the_meta_erd_should_apply_to(0x0004, None, hass)
+
     async def test_number_min_is_set_by_erd(
         self, hass: HomeAssistant, mqtt_mock: MqttMockHAClient
     ) -> None:
@@ -440,3 +464,22 @@ class TestMetaErds:
         the_entity_value_should_be(
             "number.test_reverse_test_reverse", STATE_UNKNOWN, hass
         )
+
+    async def test_skips_transforms_for_unregistered_entities(self) -> None:
+        """Test a transform does nothing, and calls no service, when its target entity isn't registered."""
+        hass = MagicMock()
+        data_source = MagicMock(DataSource)
+        data_source.get_entity = AsyncMock(return_value=None)
+        for transform in (
+            meta_erds.set_min,
+            meta_erds.set_max,
+            meta_erds.set_unit,
+            meta_erds.enable_or_disable,
+            meta_erds.set_allowables,
+        ):
+            await transform(
+                hass, data_source, 0x0004, b"\x01", None, "test_0001_Test.Option"
+            )
+
+        hass.services.async_call.assert_not_called()
+        data_source.get_erd_def.assert_not_called()
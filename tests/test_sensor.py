@@ -1,5 +1,6 @@
 """Test GE Appliances sensor."""
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from pytest_homeassistant_custom_component.typing import MqttMockHAClient
 
@@ -17,6 +18,9 @@ from .common import (
     given_the_appliance_api_erd_defs_are,
     given_the_appliance_api_is,
     given_the_erd_is_set_to,
+    given_the_state_was_last_written,
+    the_state_should_not_be_written_since,
+    when_the_entity_receives_erd_value,
     when_the_erd_is_set_to,
 )
 
@@ -614,6 +618,28 @@ class TestSensor:
         the_sensor_value_should_be("sensor.bitfield_test_field_one", "0", hass)
         the_sensor_value_should_be("sensor.bitfield_test_field_two", "15", hass)
 
+    async def test_does_not_write_state_when_other_fields_change(
+        self,
+        hass: HomeAssistant,
+        mqtt_mock: MqttMockHAClient,
+        freezer: FrozenDateTimeFactory,
+    ) -> None:
+        """Test sensor state isn't written when only another field of its ERD changes."""
+        await when_the_erd_is_set_to(0x000A, "F0", hass)
+        last_written = given_the_state_was_last_written(
+            "sensor.bitfield_test_field_one", hass
+        )
+        freezer.tick()
+
+        await when_the_erd_is_set_to(0x000A, "F5", hass)
+        the_sensor_value_should_be("sensor.bitfield_test_field_two", "5", hass)
+        await when_the_entity_receives_erd_value(
+            "sensor.bitfield_test_field_one", "F5", hass
+        )
+        the_state_should_not_be_written_since(
+            "sensor.bitfield_test_field_one", last_written, hass
+        )
+
     async def test_raw_bytes(
         self, hass: HomeAssistant, mqtt_mock: MqttMockHAClient
     ) -> None:
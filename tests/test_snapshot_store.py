@@ -0,0 +1,98 @@
+"""Tests for the GE Appliances snapshot store."""
+
+from typing import Any
+from unittest.mock import MagicMock
+
+from custom_components.geappliances.const import (
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+)
+from custom_components.geappliances.ha_compatibility.data_source import DataSource
+from custom_components.geappliances.ha_compatibility.snapshot_store import (
+    SnapshotStore,
+    remove_snapshot,
+)
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+SNAPSHOT = {"test": {"manifests": {"0x0092": "0000000100000001"}, "erds": {}}}
+
+
+@pytest.fixture
+def data_source_mock() -> MagicMock:
+    """Return a mock data source that snapshots the module's snapshot."""
+    data_source = MagicMock(DataSource)
+    data_source.async_snapshot.return_value = SNAPSHOT
+    return data_source
+
+
+@pytest.fixture
+def snapshot_store(hass: HomeAssistant, data_source_mock) -> SnapshotStore:
+    """Return a snapshot store for the mock data source."""
+    return SnapshotStore(hass, data_source_mock)
+
+
+def given_a_snapshot_is_saved(hass_storage: dict[str, Any]) -> None:
+    """Put the module's snapshot in storage."""
+    hass_storage[SNAPSHOT_STORAGE_KEY] = {
+        "version": SNAPSHOT_STORAGE_VERSION,
+        "key": SNAPSHOT_STORAGE_KEY,
+        "data": SNAPSHOT,
+    }
+
+
+def the_saved_snapshot_should_be(
+    snapshot: dict[str, Any] | None, hass_storage: dict[str, Any]
+) -> None:
+    """Assert storage holds the given snapshot, or nothing if it is None."""
+    if snapshot is None:
+        assert SNAPSHOT_STORAGE_KEY not in hass_storage
+    else:
+        assert hass_storage[SNAPSHOT_STORAGE_KEY]["data"] == snapshot
+
+
+class TestSnapshotStore:
+    """Hold snapshot store tests."""
+
+    async def test_loads_empty_snapshot_when_nothing_saved(
+        self, snapshot_store
+    ) -> None:
+        """Test the store returns an empty snapshot before anything was saved."""
+        assert await snapshot_store.load() == {}
+
+    async def test_loads_saved_snapshot(self, hass_storage, snapshot_store) -> None:
+        """Test the store returns the snapshot in storage."""
+        given_a_snapshot_is_saved(hass_storage)
+        assert await snapshot_store.load() == SNAPSHOT
+
+    async def test_saves_scheduled_snapshot_once_when_flushed(
+        self, hass_storage, data_source_mock, snapshot_store
+    ) -> None:
+        """Test changes scheduled before a flush are saved as one snapshot."""
+        snapshot_store.async_schedule_save()
+        snapshot_store.async_schedule_save()
+        the_saved_snapshot_should_be(None, hass_storage)
+
+        await snapshot_store.flush()
+        the_saved_snapshot_should_be(SNAPSHOT, hass_storage)
+        data_source_mock.async_snapshot.assert_called_once()
+
+    async def test_flush_does_nothing_without_scheduled_save(
+        self, hass_storage, snapshot_store
+    ) -> None:
+        """Test flushing with no change scheduled leaves storage alone."""
+        await snapshot_store.flush()
+        the_saved_snapshot_should_be(None, hass_storage)
+
+    async def test_removes_snapshot(
+        self, hass: HomeAssistant, hass_storage, snapshot_store
+    ) -> None:
+        """Test the saved snapshot can be deleted through the store or without one."""
+        given_a_snapshot_is_saved(hass_storage)
+        await snapshot_store.remove()
+        the_saved_snapshot_should_be(None, hass_storage)
+
+        given_a_snapshot_is_saved(hass_storage)
+        await remove_snapshot(hass)
+        the_saved_snapshot_should_be(None, hass_storage)
@@ -1,5 +1,6 @@
 """Test GE Appliances switch."""
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from pytest_homeassistant_custom_component.typing import MqttMockHAClient
 
@@ -19,8 +20,11 @@ from .common import (
     given_integration_is_initialized,
     given_the_appliance_api_erd_defs_are,
     given_the_appliance_api_is,
+    given_the_state_was_last_written,
     given_the_status_pair_dict_is,
     the_mqtt_topic_value_should_be,
+    the_state_should_not_be_written_since,
+    when_the_entity_receives_erd_value,
     when_the_erd_is_set_to,
 )
 
@@ -330,6 +334,28 @@ class TestSwitch:
         the_switch_state_should_be("switch.bitfield_test_bit_one", STATE_OFF, hass)
         the_switch_state_should_be("switch.bitfield_test_bit_two", STATE_ON, hass)
 
+    async def test_does_not_write_state_when_other_fields_change(
+        self,
+        hass: HomeAssistant,
+        mqtt_mock: MqttMockHAClient,
+        freezer: FrozenDateTimeFactory,
+    ) -> None:
+        """Test switch state isn't written when only another field of its ERD changes."""
+        await when_the_erd_is_set_to(0x0004, "80", hass)
+        last_written = given_the_state_was_last_written(
+            "switch.bitfield_test_bit_one", hass
+        )
+        freezer.tick()
+
+        await when_the_erd_is_set_to(0x0004, "C0", hass)
+        the_switch_state_should_be("switch.bitfield_test_bit_two", STATE_ON, hass)
+        await when_the_entity_receives_erd_value(
+            "switch.bitfield_test_bit_one", "C0", hass
+        )
+        the_state_should_not_be_written_since(
+            "switch.bitfield_test_bit_one", last_written, hass
+        )
+
     async def test_shows_unknown_when_unsupported(
         self, hass: HomeAssistant, mqtt_mock: MqttMockHAClient
     ) -> None:
@@ -192,7 +192,7 @@ async def given_the_erd_string_is_set_to(
     async_fire_mqtt_message(
         hass, ERD_VALUE_TOPIC.format(f"{erd:#06x}"), text.encode().hex()
     )
-    await hass.async_block_till_done()
+    await hass.async_block_till_done(wait_background_tasks=True)
 
 
 async def when_the_erd_string_is_set_to(
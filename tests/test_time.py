@@ -2,7 +2,6 @@
 
 from datetime import time
 
-from custom_components.geappliances.const import CONF_DEVICE_ID
 from custom_components.geappliances.ha_compatibility.data_source import DataSource
 from custom_components.geappliances.models import GeaTimeConfig
 import pytest
@@ -56,6 +55,13 @@ APPLIANCE_API_JSON = """
                         { "erd": "0x0005", "name": "Test Pair Request", "length": 3 }
                     ],
                     "features": []
+                },
+                "2": {
+                    "required": [
+                        { "erd": "0x0004", "name": "Test Pair Status", "length": 3 },
+                        { "erd": "0x0005", "name": "Test Pair Request", "length": 3 }
+                    ],
+                    "features": []
                 }
             }
         }
@@ -217,7 +223,7 @@ async def build_time_test_config(
     return [
         GeaTimeConfig(
             f"{device_name}_0001_Test_Time",
-            (await data_source.get_device(device_name))[CONF_DEVICE_ID],
+            (await data_source.get_device(device_name)).device_id,
             device_name,
             "Time Test: Time Test",
             "time",
@@ -238,7 +244,7 @@ async def build_read_only_time_test_config(
     return [
         GeaTimeConfig(
             f"{device_name}_0002_Read_Only_Test",
-            (await data_source.get_device(device_name))[CONF_DEVICE_ID],
+            (await data_source.get_device(device_name)).device_id,
             device_name,
             "Read Only Test: Read Only Test",
             "time",
@@ -259,7 +265,7 @@ async def build_time_removal_test_config(
     return [
         GeaTimeConfig(
             f"{device_name}_0003_Removal_Test",
-            (await data_source.get_device(device_name))[CONF_DEVICE_ID],
+            (await data_source.get_device(device_name)).device_id,
             device_name,
             "Removal Test: Removal Test",
             "time",
@@ -280,7 +286,7 @@ async def build_test_pair_config(
     return [
         GeaTimeConfig(
             f"{device_name}_0005_Test_Pair",
-            (await data_source.get_device(device_name))[CONF_DEVICE_ID],
+            (await data_source.get_device(device_name)).device_id,
             device_name,
             "Test Pair: Test Pair",
             "time",
@@ -370,7 +376,7 @@ class TestTime:
     ) -> None:
         """Test time shows STATE_UNKNOWN when the associated ERD is no longer supported."""
         await when_the_erd_is_set_to(0x0003, "000000", hass)
-        await when_the_erd_is_set_to(0x0093, "0000 0001 0000 0000", hass)
+        await when_the_erd_is_set_to(0x0093, "0000 0002 0000 0000", hass)
         the_time_value_should_be("time.removal_test_removal_test", STATE_UNKNOWN, hass)
 
     async def test_publishes_to_request_erd_and_does_not_update_paired_number(
@@ -0,0 +1,38 @@
+"""Tests for GE Appliances MQTT topic parsing."""
+
+from custom_components.geappliances.const import (
+    TOPIC_DEVICE,
+    TOPIC_INVALID,
+    TOPIC_VALUE,
+    TOPIC_WRITE,
+)
+from custom_components.geappliances.topic import ParsedTopic, parse_topic
+
+
+class TestTopic:
+    """Hold topic parsing tests."""
+
+    async def test_parses_topics(self) -> None:
+        """Test each kind of topic is split into its device, ERD and kind."""
+        assert parse_topic("geappliances/test") == ParsedTopic(
+            "test", None, TOPIC_DEVICE
+        )
+        assert parse_topic("geappliances/test/erd/0x0092/value") == ParsedTopic(
+            "test", 0x0092, TOPIC_VALUE
+        )
+        assert parse_topic("geappliances/test/erd/0x0001/write") == ParsedTopic(
+            "test", 0x0001, TOPIC_WRITE
+        )
+
+    async def test_marks_bad_topics_invalid(self) -> None:
+        """Test topics with the wrong shape or a bad ERD are invalid."""
+        assert parse_topic("geappliances/test/bad").kind == TOPIC_INVALID
+        assert parse_topic("geappliances/test/erd/0xZZZZ/value").kind == TOPIC_INVALID
+        assert parse_topic("geappliances").kind == TOPIC_INVALID
+
+    async def test_caches_each_topic(self) -> None:
+        """Test the same topic is only parsed once."""
+        parse_topic.cache_clear()
+        first = parse_topic("geappliances/test/erd/0x0001/value")
+        assert parse_topic("geappliances/test/erd/0x0001/value") is first
+        assert parse_topic.cache_info().hits == 1